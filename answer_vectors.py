@@ -0,0 +1,130 @@
+import base64
+
+import numpy as np
+import pandas as pd
+from gspread.utils import rowcol_to_a1
+
+# --------------------------------------------------
+# 답안 벡터 (Sheet1 'Answers' 컬럼) - 버전 붙은 압축 형식
+# --------------------------------------------------
+# "v1|<고른 답>|<오답 비트마스크(base64)>"
+#   고른 답: 문항 순서대로 한 글자씩 ('1'~'5', '0' = 미응답, '?' = 알 수 없음(백필된 옛 기록))
+#   오답 비트마스크: 틀린 문항 = 1, np.packbits 후 urlsafe base64 (패딩 포함, 길이가 문항 수로 고정)
+ANSWER_COLUMN = "Answers"
+VERSION = "v1"
+UNKNOWN = -1
+
+
+def encode_answer_vector(choices, wrong):
+    """choices: 문항별 고른 답 (0 = 미응답, -1 = 모름), wrong: 문항별 오답 여부"""
+    chars = "".join("?" if c < 0 else str(int(c)) for c in choices)
+    mask = base64.urlsafe_b64encode(np.packbits(np.asarray(wrong, dtype=bool)).tobytes()).decode("ascii")
+    return f"{VERSION}|{chars}|{mask}"
+
+
+def decode_answer_vectors(values, n_questions):
+    """
+    Answers 컬럼(문자열 Series)을 한 번에 배열로 변환.
+    return: (choices[int8, 학생 × 문항, 모름 = -1], wrong[bool, 학생 × 문항], valid[bool, 학생])
+      valid 가 False 인 행(벡터가 없거나 문항 수가 다른 행)은 choices = -1, wrong = False
+    """
+    values = values.astype(str).reset_index(drop=True)
+    n = len(values)
+    choices = np.full((n, n_questions), UNKNOWN, dtype=np.int8)
+    wrong = np.zeros((n, n_questions), dtype=bool)
+
+    parts = values.str.split("|", n=2, expand=True)
+    if parts.shape[1] < 3:
+        return choices, wrong, np.zeros(n, dtype=bool)
+
+    mask_len = 4 * ((-(-n_questions // 8) + 2) // 3)
+    valid = (
+        (parts[0] == VERSION)
+        & (parts[1].str.len() == n_questions)
+        & (parts[2].str.len() == mask_len)
+    ).to_numpy()
+    if not valid.any():
+        return choices, wrong, valid
+
+    # 길이가 모두 같으므로 이어 붙여서 한 번에 디코딩
+    raw = np.frombuffer("".join(parts[1][valid]).encode("ascii"), dtype=np.uint8).reshape(-1, n_questions)
+    ch = raw.astype(np.int16) - ord("0")
+    ch[raw == ord("?")] = UNKNOWN
+    choices[valid] = ch.astype(np.int8)
+
+    packed = np.frombuffer(base64.urlsafe_b64decode("".join(parts[2][valid])), dtype=np.uint8)
+    bits = np.unpackbits(packed.reshape(valid.sum(), -1), axis=1)[:, :n_questions]
+    wrong[valid] = bits.astype(bool)
+    return choices, wrong, valid
+
+
+def wrong_matrix_from_questions(wrong_questions, q_nums):
+    """옛 형식 Wrong_Questions("3, 7, 12" / "없음") -> (학생 × 문항) 오답 여부"""
+    wrong_questions = wrong_questions.astype(str).reset_index(drop=True)
+    wrong = np.zeros((len(wrong_questions), len(q_nums)), dtype=bool)
+    if len(wrong_questions) == 0:
+        return wrong
+
+    wq = wrong_questions.str.split(",").explode().str.strip()
+    wq = wq[wq.str.fullmatch(r"[0-9]+", na=False)]
+    pos = {int(q): i for i, q in enumerate(q_nums)}
+    cols = wq.astype(np.int64).map(pos)
+    hit = cols.notna()
+    wrong[wq.index[hit].to_numpy(), cols[hit].to_numpy(dtype=np.int64)] = True
+    return wrong
+
+
+def wrong_matrix(rows, q_nums):
+    # 답안 벡터가 있는 행은 벡터로, 없는 옛 행은 Wrong_Questions 로 오답 배열을 만든다
+    if ANSWER_COLUMN in rows.columns:
+        _, wrong, valid = decode_answer_vectors(rows[ANSWER_COLUMN], len(q_nums))
+    else:
+        wrong, valid = np.zeros((len(rows), len(q_nums)), dtype=bool), np.zeros(len(rows), dtype=bool)
+    if not valid.all():
+        legacy = wrong_matrix_from_questions(rows["Wrong_Questions"], q_nums)
+        wrong[~valid] = legacy[~valid]
+    return wrong
+
+
+# --------------------------------------------------
+# 옛 기록 백필 (Wrong_Questions -> Answers)
+# --------------------------------------------------
+def backfill_answer_vectors(ws, exam_db):
+    """
+    Answers 가 비어 있는 행을 Wrong_Questions 로 채운다. (고른 답은 '?' 로 기록)
+    시트 전체를 한 번 읽고, Answers 컬럼 전체를 update 한 번으로 쓴다.
+    return: 채운 행 수
+    """
+    values = ws.get_all_values()
+    if not values:
+        return 0
+    header = [str(h).strip() for h in values[0]]
+    rows = values[1:]
+
+    if ANSWER_COLUMN in header:
+        col = header.index(ANSWER_COLUMN)
+    else:
+        col = len(header)
+        ws.update(range_name=rowcol_to_a1(1, col + 1), values=[[ANSWER_COLUMN]])
+
+    g_idx, r_idx, w_idx = header.index("Grade"), header.index("Round"), header.index("Wrong_Questions")
+
+    out = []
+    filled = 0
+    for row in rows:
+        row = row + [""] * (len(header) + 1 - len(row))
+        current = str(row[col]).strip()
+        round_data = exam_db.get(str(row[g_idx]).strip(), {}).get(str(row[r_idx]).strip())
+        if current or not round_data:
+            out.append([current])
+            continue
+        q_nums = list(round_data.keys())
+        wrong = wrong_matrix_from_questions(pd.Series([row[w_idx]], dtype=str), q_nums)[0]
+        out.append([encode_answer_vector([UNKNOWN] * len(q_nums), wrong)])
+        filled += 1
+
+    if filled:
+        rng = f"{rowcol_to_a1(2, col + 1)}:{rowcol_to_a1(len(rows) + 1, col + 1)}"
+        ws.update(range_name=rng, values=out)
+    return filled
+
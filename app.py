@@ -1,52 +1,66 @@
+import logging
+import tempfile
+
 import streamlit as st
-import pandas as pd
-from datetime import datetime
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
-import altair as alt
+
+# 로그인 화면까지는 가벼운 모듈만 import (gspread / pandas / altair 는 로그인 뒤 처음 쓸 때)
+from metrics import METRICS
+from refresher import BackgroundRefresher
+from sheets import get_pool
+from exam_db import GRADE_ORDER, get_exam_db_cache
+from feedback import FEEDBACK_CATALOG, FEEDBACK_ENGINE, exam_db_types, get_feedback_message_list
 
 # --------------------------------------------------
 # [0] 기본 설정
 # --------------------------------------------------
 st.set_page_config(page_title="국어 모의고사 통합 시스템", page_icon="📚", layout="wide")
 
-GRADE_ORDER = ["중 1학년", "중 2학년", "중 3학년", "고 1학년", "고 2학년", "고 3학년"]
+logger = logging.getLogger("app")
+
+# 이번 실행을 계측 기록의 재실행 1번으로 시작 (열려 있는 탭 기준으로 묶음)
+METRICS.begin_rerun(tab=st.session_state.get("main_tab", "로그인"))
 
 # --------------------------------------------------
 # [1] 관리자 계정 불러오기
 # --------------------------------------------------
-@st.cache_data(ttl=600)
-def load_admins():
-    if "gcp_service_account" not in st.secrets:
-        return {}
-
-    scope = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
-    creds = ServiceAccountCredentials.from_json_keyfile_dict(
-        dict(st.secrets["gcp_service_account"]), scope
-    )
-    client = gspread.authorize(creds)
+def read_admins(pool):
+    sheet = pool.worksheet("Admins")
+    records = sheet.get_all_records()
 
     admins = {}
-    try:
-        sheet = client.open("ExamResults").worksheet("Admins")
-        records = sheet.get_all_records()
+    for row in records:
+        admin_id = str(row.get("AdminID", "")).strip()
+        if not admin_id:
+            continue
 
-        for row in records:
-            admin_id = str(row.get("AdminID", "")).strip()
-            if not admin_id:
-                continue
+        admins[admin_id] = {
+            "password": str(row.get("Password", "")).strip(),
+            "role": str(row.get("Role", "admin")).strip().lower()  # admin / superadmin
+        }
+    return admins
 
-            admins[admin_id] = {
-                "password": str(row.get("Password", "")).strip(),
-                "role": str(row.get("Role", "admin")).strip().lower()  # admin / superadmin
-            }
-    except Exception as e:
-        st.error(f"관리자 시트 로딩 오류: {e}")
 
-    return admins
+@st.cache_resource
+def get_admin_table():
+    """모든 세션이 공유하는 관리자 목록 (10분마다 백그라운드로 새로고침). 서비스 계정 정보가 없으면 None."""
+    pool = get_pool()
+    if pool is None:
+        return None
+    return BackgroundRefresher(lambda: read_admins(pool), ttl=600, name="admins-refresh")
 
 
-ADMINS = load_admins()
+def load_admins():
+    admin_table = get_admin_table()
+    if admin_table is None:
+        return {}
+    try:
+        return admin_table.get()
+    except Exception:
+        # 처음 읽기부터 실패한 경우에만 여기로 옴 (이후 새로고침 실패는 이전 목록 유지 + 로그)
+        logger.exception("관리자 시트 로딩 실패")
+        st.error("관리자 목록을 불러오지 못했습니다. 잠시 후 다시 시도해 주세요.")
+        return {}
+
 
 # --------------------------------------------------
 # [2] 로그인 처리
@@ -65,7 +79,8 @@ with st.sidebar:
         pw_input = st.text_input("비밀번호", type="password")
 
         if st.button("로그인"):
-            admin_info = ADMINS.get(admin_id_input)
+            # 관리자 시트는 로그인 버튼을 누를 때 처음 읽음 (첫 화면은 네트워크 없이 바로 뜸)
+            admin_info = load_admins().get(admin_id_input)
 
             if admin_info and pw_input == admin_info["password"]:
                 st.session_state["is_authenticated"] = True
@@ -82,8 +97,29 @@ with st.sidebar:
 
         st.markdown("---")
         if st.button("🔄 문제 DB 새로고침"):
-            st.cache_data.clear()
-            st.success("문제 DB 캐시를 초기화했습니다. (다음 화면부터 반영됩니다)")
+            # 내용이 바뀐 정답_ 시트(학년)만 다시 읽음 - 다른 캐시와 다른 사용자 세션은 그대로
+            exam_cache = get_exam_db_cache()
+            try:
+                changed = exam_cache.refresh() if exam_cache else []
+                if changed:
+                    st.success(f"변경된 학년만 다시 불러왔습니다: {', '.join(changed)}")
+                else:
+                    st.success("바뀐 정답 시트가 없습니다.")
+                for grade, e in (exam_cache.errors if exam_cache else []):
+                    st.warning(f"'{grade}' 정답 시트 오류 (이전 정답 유지): {e}")
+            except Exception as e:
+                logger.exception("정답 DB 새로고침 실패")
+                st.error(f"정답 DB 새로고침 오류 (이전 정답 유지): {e}")
+
+        if st.button("👤 관리자 목록 새로고침"):
+            admin_table = get_admin_table()
+            try:
+                if admin_table:
+                    admin_table.refresh()
+                st.success("관리자 목록을 다시 불러왔습니다.")
+            except Exception as e:
+                logger.exception("관리자 목록 새로고침 실패")
+                st.error(f"관리자 목록 새로고침 오류 (이전 목록 유지): {e}")
 
         if st.button("로그아웃"):
             for k in ["is_authenticated", "admin_id", "is_superadmin"]:
@@ -92,875 +128,621 @@ with st.sidebar:
             # 로그인 안 되어 있으면 앱 중단
 if not st.session_state.get("is_authenticated", False):
     st.warning("이 시스템은 관리자 전용입니다. 왼쪽에서 로그인해 주세요.")
+    METRICS.end_rerun()
     st.stop()
 
 current_admin = st.session_state.get("admin_id")
 is_superadmin = st.session_state.get("is_superadmin", False)
 is_admin = True
 
+# 로그인 뒤에만 쓰는 무거운 모듈 (pandas / numpy / pyarrow / gspread)
+import pandas as pd
+from answer_vectors import backfill_answer_vectors
+from bulk_import import read_answer_table, validate_answer_table
+from grading import CompiledRound, grade_answers, grade_matrix
+from item_analysis import analyze_round
+from reports import (
+    build_student_report, create_portfolio_html, create_report_html, group_feedback,
+    parse_wrong_questions, write_reports_zip,
+)
+from shards import SUBMISSION_MODE, get_results_cache, get_shard_router, migrate_legacy
+from submissions import FAILED, RETRYING, STATUS_LABELS, build_result_row, get_submission_queue
+
+
+def sync_results(results, grade=None):
+    """
+    결과 캐시에 새 행을 반영한다. 쿼터 대기 초과(QuotaWaitTimeout - 안내 문구 그대로) / 시트 오류면
+    화면에 메시지를 띄우고 False (트레이스백 대신)
+    """
+    try:
+        results.sync(grade)
+        return True
+    except Exception as e:
+        logger.exception("결과 시트 동기화 실패")
+        st.error(str(e))
+        return False
+
 
 # --------------------------------------------------
 # [3] 정답 DB 로드
 # --------------------------------------------------
-@st.cache_data(ttl=600)
-def load_exam_db():
-    if "gcp_service_account" not in st.secrets:
-        return {}
-
-    scope = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
-    creds = ServiceAccountCredentials.from_json_keyfile_dict(dict(st.secrets["gcp_service_account"]), scope)
-    client = gspread.authorize(creds)
+@st.cache_resource(show_spinner=False)
+def warm_feedback(grade, version, _rounds):
+    # 학년 정답 버전이 바뀔 때만 그 학년에 등장하는 Type 의 피드백을 미리 계산
+    FEEDBACK_ENGINE.precompute(exam_db_types({grade: _rounds}))
 
-    db = {}
 
-    for grade in GRADE_ORDER:
-        try:
-            sheet_name = f"정답_{grade}"
-            sheet = client.open("ExamResults").worksheet(sheet_name)
-            records = sheet.get_all_records()
+def load_exam_db():
+    # 학년별 버전 캐시 (모든 세션 공유) - 10분마다 백그라운드로, 또는 새로고침 버튼으로 바뀐 학년만 다시 읽음
+    exam_cache = get_exam_db_cache()
+    if exam_cache is None:
+        return {}
 
-            if grade not in db:
-                db[grade] = {}
+    try:
+        db = exam_cache.get()
+    except Exception:
+        # 처음 읽기부터 실패한 경우에만 여기로 옴 (이후 새로고침 실패는 이전 정답 유지 + 로그)
+        logger.exception("정답 DB 로딩 실패")
+        st.error("정답 DB 를 불러오지 못했습니다. 잠시 후 다시 시도해 주세요.")
+        return {}
 
-            for row in records:
-                round_name = str(row['Round']).strip()
-                q_num = int(row['Q_Num'])
+    for grade, rounds in db.items():
+        warm_feedback(grade, exam_cache.version(grade), rounds)
 
-                if round_name not in db[grade]:
-                    db[grade][round_name] = {}
+    return db
 
-                db[grade][round_name][q_num] = {
-                    "ans": int(row['Answer']),
-                    "score": int(row['Score']),
-                    "type": str(row['Type']).strip()
-                }
 
-        except gspread.WorksheetNotFound:
-            continue
-        except Exception as e:
-            st.error(f"'{grade}' 정답 로딩 오류: {e}")
+with METRICS.section("load_exam_db"):
+    EXAM_DB = load_exam_db()
+
+
+@st.cache_resource
+def get_compiled_round(round_data):
+    # 회차 정답을 채점용 배열로 한 번만 변환 (정답 내용이 바뀌면 새로 컴파일)
+    return CompiledRound(round_data)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def load_item_analysis(grade, round_name, data_version, round_data):
+    # data_version(결과 캐시 버전)이 같으면 다시 계산하지 않음
+    rows = get_results_cache().round_frame(grade, round_name)
+    items, by_type, distractors = analyze_round(rows, get_compiled_round(round_data))
+    return len(rows), items, by_type, distractors
+
+# 최고관리자 전용: 옛 기록의 Wrong_Questions 로 Answers(답안 벡터) 컬럼 채우기 / 결과 시트 학년·학년도별 분리
+if is_superadmin:
+    with st.sidebar:
+        with st.expander("🛠️ 데이터 도구"):
+            if st.button("답안 벡터 백필 (옛 기록)", key="backfill_answers"):
+                pool = get_pool()
+                results = get_results_cache()
+                if pool is None or results is None:
+                    st.error("시트 연결 실패")
+                else:
+                    try:
+                        n = sum(backfill_answer_vectors(ws, EXAM_DB) for ws in results.worksheets())
+                        results.reset()
+                        st.success(f"{n}행 백필 완료")
+                    except Exception as e:
+                        st.error(f"백필 오류: {e}")
+
+            router = get_shard_router()
+            if router is not None:
+                st.markdown("---")
+                try:
+                    migrated = router.migrated_rows
+                    st.caption(
+                        "결과 시트: 학년·학년도별 분리 완료" if migrated is not None
+                        else "결과 시트: Sheet1 하나 (분리 전)"
+                    )
+                except Exception as e:
+                    migrated = None
+                    st.caption(f"결과 시트 상태 확인 실패: {e}")
+                if migrated is None and st.button("결과 시트 학년·학년도별 분리", key="migrate_shards"):
+                    st.session_state["confirm_migrate"] = True
+                # Sheet1 전체를 다시 쓰는 작업이라 한 번 더 확인
+                if migrated is None and st.session_state.get("confirm_migrate"):
+                    st.warning(
+                        "Sheet1 의 모든 기록을 학년·학년도별 시트로 옮깁니다. "
+                        "분리가 끝나면 새 제출은 분리된 시트에 저장됩니다. 계속할까요?"
+                    )
+                    c1, c2 = st.columns(2)
+                    if c2.button("취소", key="migrate_cancel"):
+                        st.session_state["confirm_migrate"] = False
+                        st.rerun()
+                    if c1.button("분리 실행", key="migrate_confirm", type="primary"):
+                        st.session_state["confirm_migrate"] = False
+                        try:
+                            moved, skipped = migrate_legacy(get_pool(), router)
+                            get_results_cache().reset()
+                            st.success(f"{sum(moved.values())}행을 {len(moved)}개 시트로 옮겼습니다.")
+                            st.dataframe(
+                                pd.DataFrame(list(moved.items()), columns=["시트", "행 수"]), hide_index=True
+                            )
+                            if skipped:
+                                st.warning(
+                                    f"Grade 가 비어 있는 {len(skipped)}행은 옮기지 않았습니다. "
+                                    f"(Sheet1 {', '.join(map(str, skipped[:20]))}{' …' if len(skipped) > 20 else ''}행)"
+                                )
+                        except Exception as e:
+                            logger.exception("결과 시트 분리 실패")
+                            st.error(f"분리 오류 (다시 실행하면 처음부터 다시 옮깁니다): {e}")
+
+            # 시트가 거부해서 보관 중인 제출 - 확인 뒤 다시 시도하거나 삭제
+            queue = get_submission_queue()
+            failed = queue.failed() if queue else []
+            if failed:
+                st.markdown("---")
+                st.warning(f"저장 실패로 보관 중인 제출 {len(failed)}건")
+                st.dataframe(
+                    pd.DataFrame(
+                        [(row[0], row[1], row[2], row[3], err) for _, row, err in failed],
+                        columns=["Grade", "Round", "ID", "Name", "오류"],
+                    ),
+                    hide_index=True,
+                )
+                c1, c2 = st.columns(2)
+                if c1.button("다시 시도", key="failed_retry"):
+                    st.success(f"{queue.retry_failed()}건을 다시 대기열에 넣었습니다.")
+                if c2.button("삭제", key="failed_discard"):
+                    st.success(f"{queue.discard_failed()}건을 삭제했습니다.")
+
+
+def _stats_frame(rows, columns):
+    # 계측 요약(dict 리스트)을 표로 - ms 는 소수 1자리
+    df = pd.DataFrame(rows, columns=columns)
+    return df.round(1)
+
+
+@st.fragment
+def render_metrics_panel():
+    # 최고관리자 전용: 재실행 / Sheets 호출 / 캐시 / 화면 구간 계측 (직전 재실행까지의 기록)
+    with st.expander("⏱️ 성능 계측"):
+        scope = st.radio("범위", ["이 세션", "전체 세션"], horizontal=True, key="metrics_scope")
+        session = METRICS.session_id() if scope == "이 세션" else None
+
+        rs = METRICS.rerun_stats(session)
+        fmt = lambda v: "-" if v is None else f"{v:.0f}"
+        st.caption(
+            f"재실행 {rs['reruns']}회 · 시간 p50 {fmt(rs['p50'])} / p95 {fmt(rs['p95'])} ms · "
+            f"재실행당 Sheets 호출 p50 {fmt(rs['sheets_p50'])} / p95 {fmt(rs['sheets_p95'])}"
+        )
 
-    return db
+        st.write("**Sheets API (ms)**")
+        st.dataframe(_stats_frame(
+            METRICS.sheets_stats(session), ["name", "calls", "errors", "p50", "p95", "total_ms", "wait_p95"]
+        ), hide_index=True)
+
+        st.write("**탭별 Sheets 호출**")
+        st.dataframe(_stats_frame(
+            METRICS.sheets_by_tab(session), ["tab", "name", "calls", "errors"]
+        ), hide_index=True)
+
+        st.write("**캐시 적중률**")
+        cache = _stats_frame(METRICS.cache_stats(session), ["name", "hit", "miss", "hit_rate"])
+        cache["hit_rate"] = (pd.to_numeric(cache["hit_rate"]) * 100).round(1)
+        st.dataframe(cache, hide_index=True)
+
+        st.write("**화면 구간 (ms)**")
+        st.dataframe(_stats_frame(
+            METRICS.section_stats(session), ["name", "count", "p50", "p95"]
+        ), hide_index=True)
+
+        st.write("**최근 재실행**")
+        st.dataframe(_stats_frame(
+            METRICS.recent_reruns(session),
+            ["rerun", "tab", "trigger", "ms", "sheets_calls", "sheets_ms", "sheets_errors"]
+        ), hide_index=True)
+
+        if session is None:
+            st.write("**세션별**")
+            st.dataframe(_stats_frame(
+                METRICS.session_stats(), ["session", "reruns", "sheets_calls", "sheets_ms", "p95"]
+            ), hide_index=True)
+
+        # JSON lines 는 버튼을 누를 때만 만든다
+        st.download_button(
+            "📥 JSON lines 내보내기",
+            lambda: METRICS.to_jsonl(session),
+            file_name="metrics.jsonl",
+            mime="application/x-ndjson",
+            key="metrics_export"
+        )
+        if st.button("기록 초기화", key="metrics_reset"):
+            METRICS.reset()
 
 
-EXAM_DB = load_exam_db()
+if is_superadmin:
+    with st.sidebar:
+        render_metrics_panel()
 
 # --------------------------------------------------
-# [4] 학생 시트 (Sheet1)
+# [4] 탭 구성
 # --------------------------------------------------
-def get_student_sheet():
-    if "gcp_service_account" not in st.secrets:
-        return None
+# 선택된 탭(학년)만 실행하고 (on_change="rerun" + .open),
+# 탭 / 학년 화면은 각각 fragment 라서 그 안의 위젯을 바꾸면 그 부분만 다시 실행된다.
+tab1, tab2, tab3, tab4 = st.tabs(
+    ["📝 시험 응시", "🔍 성적 조회", "📈 포트폴리오", "📊 문항 분석"], key="main_tab", on_change="rerun"
+)
+active_grades = [g for g in GRADE_ORDER if g in EXAM_DB]
 
-    scope = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
-    creds = ServiceAccountCredentials.from_json_keyfile_dict(dict(st.secrets["gcp_service_account"]), scope)
-    client = gspread.authorize(creds)
 
+# ==================================================
+# [탭 1] 시험 응시
+# ==================================================
+def render_bulk_import(grade, round_name, round_data):
+    st.caption(
+        "CSV / Excel 파일: 학번, 이름, 답안 컬럼 (답안 예: 31524... 한 글자 = 한 문항, 0 또는 - = 미응답) "
+        "또는 학번, 이름 + 문항 번호별 컬럼(1, 2, 3, ...)"
+    )
+    up = st.file_uploader(
+        "답안 파일", type=["csv", "xlsx"], key=f"bulk_file_{grade}_{round_name}"
+    )
+    if up is None:
+        return
+
+    compiled = get_compiled_round(round_data)
     try:
-        return client.open("ExamResults").sheet1
+        students, matrix, errors = validate_answer_table(read_answer_table(up), compiled)
     except Exception as e:
-        st.error(f"시트 연결 오류: {e}")
-        return None
+        st.error(f"파일 읽기 오류: {e}")
+        return
+
+    if errors:
+        st.warning(f"⚠️ {len(errors)}개 행은 형식 오류로 제외됩니다.")
+        st.dataframe(pd.DataFrame(errors, columns=["행", "사유"]), hide_index=True)
+
+    if students.empty:
+        st.error("채점할 수 있는 행이 없습니다.")
+        return
+
+    # 업로드한 반 전체를 한 번에 채점
+    result = grade_matrix(compiled, matrix)
+    wrong_nums = [result.wrong_questions(i) for i in range(len(result))]
+    preview = students.assign(
+        점수=result.totals,
+        틀린문항=[", ".join(map(str, w)) if w else "없음" for w in wrong_nums],
+    )
+    st.write(f"✔ {grade} {round_name} · {len(preview)}명 채점 결과 미리보기")
+    st.dataframe(preview, hide_index=True)
+
+    if st.button(f"💾 {len(preview)}명 일괄 저장", key=f"bulk_save_{grade}_{round_name}"):
+        queue = get_submission_queue()
+        if not queue:
+            st.error("시트 연결 실패")
+            return
+
+        rows = [
+            build_result_row(
+                grade, round_name, sid, nm, result.totals[i], result.wrong_types(i), wrong_nums[i],
+                current_admin, result.answer_vector(i)
+            )
+            for i, (sid, nm) in enumerate(students.itertuples(index=False))
+        ]
+        sub_ids = queue.submit_many(rows)
+        st.session_state.setdefault("my_submissions", []).extend(
+            {"id": sub_id, "grade": grade, "round": round_name, "name": row[3], "score": row[4]}
+            for sub_id, row in zip(sub_ids, rows)
+        )
+        st.success(f"{len(rows)}명 제출 완료! (한 번에 저장됩니다)")
 
-# --------------------------------------------------
-# [5] 피드백 함수
-# --------------------------------------------------
-# 세분화된 Type 값에 대한 전용 피드백
-FEEDBACK_BY_TYPE = {
-    "화법(강연-말하기 전략)": """### 🗣️ 화법: 강연에서의 말하기 전략
-**1. 진단**  
-강연 내용을 이해하는 데 집중하느라, 화자가 사용한 **말하기 전략(예시, 비교, 질문, 강조)**을 구분하지 못했을 가능성이 큽니다. 그래서 비슷한 선지 사이에서 계속 헷갈립니다.
-
-**2. Action Plan**  
-1. 지문을 읽을 때 중요한 문장 옆에 `[예시] [비교] [질문] [강조]`처럼 전략 이름을 직접 적게 하세요.  
-2. 각 전략이 쓰인 문장마다 “이 전략을 쓰면 청자가 어떤 느낌/정보를 더 잘 받는가?”를 말로 설명하게 해 보세요.  
-3. 마지막에는 반드시 **“이 화자는 무엇을 하게 만들려고 이 말을 했을까?”**를 한 문장으로 요약하게 하세요.""",
-
-    "화법(강연-시각 자료·예시 활용)": """### 🗣️ 화법: 시각 자료·예시 활용
-**1. 진단**  
-그래프·사진·도표 등을 그냥 ‘꾸미기용 그림’처럼 보고, **말하기 내용과 연결된 기능**으로 해석하지 못했을 가능성이 큽니다.
-
-**2. Action Plan**  
-1. 시각 자료가 나올 때마다 옆에 **“이 자료가 없으면 어떤 정보가 약해질까?”**를 적게 하세요. (이해 보조 / 설득 강화 / 비교 강조 중 무엇인지)  
-2. 자료에 담긴 핵심 숫자·변화 방향만 뽑아서 한 줄로 요약하게 하세요.  
-3. 선지에서 시각 자료의 ‘역할’을 묻는지, ‘내용’ 자체를 묻는지 먼저 구분하도록 지도하세요.""",
-
-    "화법(강연-청자 반응·이해 평가)": """### 🗣️ 화법: 청자 반응·이해 평가
-**1. 진단**  
-청자의 질문·고개 끄덕임·웃음 등을 단순한 행동 묘사로만 보고, **이 반응이 이해/평가/공감/반박 중 무엇인지**를 구분하지 못했을 가능성이 큽니다.
-
-**2. Action Plan**  
-1. 청자 발화마다 옆에 `[이해 확인] [공감] [비판] [추가 질문]`처럼 듣기 유형 꼬리표를 붙이게 하세요.  
-2. “이 반응이 나오면, 화자는 다음에 어떤 전략으로 이어갈까?”를 예측하게 해 보세요.  
-3. 선지를 볼 때는, 반응의 **내용**이 아니라 그 반응이 가진 **기능(역할)**을 기준으로 옳고 그름을 판단하도록 지도하세요.""",
-
-    "문법-음운(비음화·유음화 개념 이해)": """### 🧬 문법: 비음화·유음화 개념 정리
-**1. 진단**  
-비음화·유음화의 정의는 외웠지만, **실제 단어에서 ‘왜’ 그런 변화가 일어나는지**를 설명하지 못했을 가능성이 큽니다. 받침 뒤에 오는 소리를 제대로 보지 않고 정답을 고른 경우가 많습니다.
-
-**2. Action Plan**  
-1. 항상 **‘받침 + 뒤 음운’** 구조로 단어를 쪼개 보게 하세요. (예: [국+물] → [궁물])  
-2. 비음화 = 뒤에 **[ㄴ, ㅁ, ㅇ] 비음**이 올 때, 유음화 = **ㄴ이 ㄹ 앞에서 ㄹ로 바뀜**이라는 최소한의 조건을 말로 설명하게 하세요.  
-3. 문제를 풀 때, 먼저 “어떤 음이 어떤 음 옆으로 갔는지”를 입으로 읽어 보고, 그다음에 용어(비음화/유음화)를 붙이도록 지도하세요.""",
-
-    "문법-음운(구개음화-조음 위치·환경 분석)": """### 🧬 문법: 구개음화(조음 위치·환경)
-**1. 진단**  
-구개음화를 ‘ㄷ/ㅌ + 이 → ㅈ/ㅊ’ 공식으로만 외우고, **뒤에 오는 모음·자음 환경**을 제대로 보지 않았을 가능성이 큽니다. 조음 위치가 앞쪽(입천장 쪽)으로 옮겨지는 원리를 이해하지 못한 상태입니다.
-
-**2. Action Plan**  
-1. 단어를 항상 `[자음 + 모음]` 단위로 끊고, **ㄷ·ㅌ 뒤에 ㅣ(또는 ㅕ, ㅛ, ㅠ 등 ㅣ 계열 모음)**이 오는지 먼저 체크하게 하세요.  
-2. 구개음화는 “혀의 닿는 위치가 앞쪽(경구개)으로 당겨진다”는 그림을 함께 보여 주며 설명하면 기억이 오래 갑니다.  
-3. 음성 변화 과정을 **/디/ → [지]**처럼 기호로 적어 보게 하고, 그 뒤에 용어(구개음화)를 붙이도록 연습시키세요.""",
-
-    "문법-문장 성분/구문 도해(주어·목적어·조사)": """### 🧱 문법: 문장 성분·구문 도해
-**1. 진단**  
-문장을 단어 나열로만 보고, **서술어-주어-목적어 관계를 구조적으로 파악하지 못했을 가능성**이 큽니다. 특히 조사를 그냥 단어의 일부로 보고, 문장 성분의 역할을 구분하지 못합니다.
-
-**2. Action Plan**  
-1. 어떤 문장이든 먼저 **서술어(동사·형용사)**에 밑줄을 긋게 하세요.  
-2. 그다음 “누가(주어), 무엇을(목적어), 어떤 상태가 되게 하는가(보어)”를 질문으로 던지며 해당 성분을 찾게 합니다.  
-3. 조사는 ‘꾸며주는 꼬리표’라는 것을 강조하고, 체언과 분리해서 표시하는 연습(예: 학생/이, 책/을)을 반복시키세요.""",
-
-    "문법-사전 정보 해석(있다/없다-발음·품사)": """### 📖 문법: 사전 정보(발음·품사)
-**1. 진단**  
-사전 뜻풀이에서 **발음 기호와 품사 정보**를 건너뛰고, 뜻풀이만 보고 판단했을 가능성이 큽니다. 그래서 같은 표기의 다른 품사를 구별하지 못했을 수 있습니다.
-
-**2. Action Plan**  
-1. 사전 문제가 나오면 먼저 **발음 기호, 품사, 문형** 순으로 표시하게 하세요. (뜻은 그다음)  
-2. 예문을 볼 때 “이 예문에서는 어떤 품사로 쓰였는지”를 동그라미 치게 하여, 품사-뜻풀이-예문이 서로 어떻게 대응되는지 연결하도록 지도하세요.  
-3. ‘있다/없다’처럼 일상적 단어일수록 품사가 여러 개일 수 있다는 점을 강조해 주세요.""",
-
-    "문법-사전 정보 해석(있다/없다-의미·용례 적용)": """### 📖 문법: 사전 의미·용례 적용
-**1. 진단**  
-사전에서 제시한 **여러 개의 의미 중 어느 의미가 문제 속 문장에 해당하는지**를 고르는 데 실패했습니다. 문장 속 쓰임을 정확히 파악하지 못한 상태입니다.
-
-**2. Action Plan**  
-1. 먼저 문제에 나온 문장을 자신의 말로 풀어 쓰게 하여, 실제 의미를 명확히 하게 하세요.  
-2. 그다음 사전 뜻풀이 각 항목 옆에 “비슷한 말”을 하나씩 적어 보게 하고, 문제 속 문장과 가장 잘 맞는 항목을 고르게 지도하세요.  
-3. 비슷해 보이는 의미를 구분할 때는 ‘대상’과 ‘상황’을 기준으로 나누게 하세요 (예: 존재/소유/경험 등).""",
-
-    "비문학-인문/철학(흄·데카르트-진리관 비교)": """### 🧠 인문/철학: 흄·데카르트 진리관 비교
-**1. 진단**  
-두 사상가의 입장을 따로따로 외우고, **어떤 기준에서 대립하는지**를 표로 정리하지 못했을 가능성이 큽니다. 그래서 선지에서 관점이 섞여 나올 때 쉽게 헷갈립니다.
-
-**2. Action Plan**  
-1. 지문에서 철학자가 두 명 이상 나오면, 반드시 다음 틀로 정리하게 하세요.  
-   - 흄: 경험/인상 중심, 인과 필연성 회의  
-   - 데카르트: 이성/명석판명한 인식 중심  
-2. 각 사상가에 대해 “○○는 진리를 무엇으로 보나?” 한 줄 요약을 적게 하고, 모든 선지는 그 한 줄과 비교해서 판단하도록 지도하세요.""",
-
-    "비문학-인문/철학(인상/관념 개념 추론)": """### 🧠 인문/철학: 인상·관념 개념 이해
-**1. 진단**  
-‘인상’과 ‘관념’의 정의를 읽었지만, 구체적인 예시에 대입해 보지 않아 **어떤 것이 인상이고 어떤 것이 관념인지** 구분하지 못했을 가능성이 큽니다.
-
-**2. Action Plan**  
-1. 수업 시간에 직접 예시를 만들게 하세요.  
-   - 인상: 지금 막 불을 본 강렬한 경험  
-   - 관념: 나중에 떠올리는 ‘불’에 대한 생각  
-2. 지문 속 예들을 보고, 인상/관념 옆에 각각 I, C 같은 약어 표시를 하게 하여 개념과 사례를 계속 묶도록 지도하세요.  
-3. 학생이 자신의 말로 “인상 = ○○, 관념 = ○○”를 설명하게 해 보고, 말로 설명이 안 되면 개념 재학습이 필요합니다.""",
-
-    "비문학-인문/철학(보기 적용-경험론 사례 분석)": """### 🧠 인문/철학: 보기 적용(경험론 사례)
-**1. 진단**  
-[보기]에 나온 일상 사례를 지문에서 설명한 **경험론 개념**으로 번역하지 못했습니다. 그래서 지문과 보기의 연결 고리를 찾지 못한 상태입니다.
-
-**2. Action Plan**  
-1. [보기]를 볼 때, 문장 옆에 “= 지문의 ○○”처럼 어떤 개념에 해당하는지 직접 적게 하세요. (예: ‘습관적인 믿음’ = 흄의 인과관계 이해 방식)  
-2. 지문 용어 ↔ 일상 사례를 1:1로 짝짓는 표를 만들어 보게 하고, 표를 완성한 뒤에 선지를 검토하도록 지도하세요.  
-3. 보기 적용 문제는 ‘지문 요약 없이 보기부터 읽는 것’을 금지시키고, 반드시 **지문 개념 → 보기 사례 순서**로 읽게 하세요.""",
-
-    "비문학-인문/철학(주장·타당성 평가)": """### 🧠 인문/철학: 주장·타당성 평가
-**1. 진단**  
-글쓴이의 주장을 파악했지만, 그 주장이 성립하기 위한 **전제와 조건**을 충분히 생각하지 못했습니다. 그래서 반례가 되는 사례나 조건 누락을 발견하지 못합니다.
-
-**2. Action Plan**  
-1. 주장 문장(결론)을 찾은 뒤, “이게 성립하려면 무엇이 사실이어야 하지?”를 세 가지 이상 떠올리게 하세요.  
-2. 지문이나 선지에 등장하는 사례가 그 전제를 깨는지, 아니면 오히려 강화하는지 구분하게 지도하세요.  
-3. “전제를 건드리는 선지”가 있는지를 먼저 확인하게 하면, 고난도 타당성 평가 문제에서 실수를 줄일 수 있습니다.""",
-
-    "문학-운문(서정시 전통-형식·내용 개관)": """### 🌙 문학(운문): 서정시 전통 이해
-**1. 진단**  
-시의 형식(운율, 행 구분 등)은 보았지만, **한국 서정시 전통 속에서 이 작품이 어떤 계열에 속하는지**를 정리하지 못했습니다.
-
-**2. Action Plan**  
-1. 작품을 읽은 뒤, 먼저 “이 시는 ‘자연 예찬 / 현실 비판 / 민족 정서 / 사랑·이별’ 중 어디에 가까운가?”를 분류하게 하세요.  
-2. 형식적 특징(음보, 반복, 종결 어미, 시적 화자의 태도)을 나열하고, 그것이 내용과 어떻게 연결되는지 한 줄로 설명하게 훈련시키세요.  
-3. 비슷한 전통의 시 두 편을 나란히 놓고 공통점·차이점을 비교하는 활동을 통해 ‘서정시 전통’이라는 큰 틀을 잡게 하는 것이 좋습니다.""",
-
-    "문학-운문(고전시가-상황·정서 파악)": """### 🌙 문학(운문): 고전시가 상황·정서
-**1. 진단**  
-고전 어휘와 어순에 막혀, 화자가 처한 **상황과 정서**를 현재어로 번역하지 못했습니다. 그래서 시어의 의미와 정서의 방향을 잘못 파악했을 가능성이 큽니다.
-
-**2. Action Plan**  
-1. 먼저 각 행을 오늘날 말로 옮겨 적게 하세요. (너무 예쁘게 번역하려 하지 말고, 말하듯이 쓰게)  
-2. 그다음 “화자가 지금 어디에서, 누구를 떠올리며, 무엇을 바라는지”를 한 문장으로 정리하게 하세요.  
-3. 정서를 볼 때는 개별 단어에 매달리기보다 ‘화자–님–자연–현실’ 사이의 관계(가까워지는가/멀어지는가, 긍정/부정)를 중심으로 보게 지도하세요.""",
-
-    "문학-운문(현대시-이미지·정서 해석)": """### 🌙 문학(운문): 현대시 이미지·정서
-**1. 진단**  
-시어를 **사전적 의미**로만 해석하고, 그 이미지가 만들어 내는 분위기·정서까지 연결하지 못했습니다. ‘길’, ‘바다’, ‘어둠’ 같은 상징적 시어가 문자 그대로만 읽혔을 가능성이 큽니다.
-
-**2. Action Plan**  
-1. 학생에게 “이 시어를 풍경·상태·관계 중 어떤 것으로 보면 자연스러운가?”를 묻게 하세요. (예: ‘길’ = 삶의 방향, 방황)  
-2. 시의 이미지를 긍정/부정, 밝음/어둠, 정지/움직임 등 **대비 축**에서 분류하게 하여, 전체 정서 흐름을 시각적으로 정리하게 합니다.  
-3. 마지막에는 “시 전체에서 화자가 느끼는 핵심 감정 한 단어”를 뽑게 하고, 근거가 되는 시어 세 개를 함께 제시하게 하세요.""",
-
-    "문학-운문(전통 계승·변용 방식 평가)": """### 🌙 문학(운문): 전통 계승·변용
-**1. 진단**  
-고전시가의 전통 요소와 현대시의 변용 요소를 분리해서 보지 못했습니다. 그래서 ‘계승’과 ‘파격’이 뒤섞인 선지를 구분하는 데 어려움을 겪었을 가능성이 큽니다.
-
-**2. Action Plan**  
-1. 고전 작품과의 공통점/차이점을 각각 한 줄씩 쓰게 하세요. (예: 자연 소재 사용은 계승, 화자의 태도는 변용)  
-2. 형식(운율, 반복 구조)과 내용(정서, 주제)이 각각 어떻게 전통을 이어받았는지/뒤틀었는지 표로 정리하게 합니다.  
-3. 선지를 볼 때 “이건 ‘계승’에 초점인가, ‘변용’에 초점인가?”를 먼저 구분하고 읽도록 지도하세요.""",
-
-    "문학-운문(보기 적용-종합 감상)": """### 🌙 문학(운문): 보기 적용·종합 감상
-**1. 진단**  
-[보기]의 감상 문장을 지문의 근거와 연결하지 않고, 자신의 느낌에 가까운 선지를 고른 경우가 많습니다. 근거 없는 감상은 정답일 수 없습니다.
-
-**2. Action Plan**  
-1. [보기]의 각 문장마다 시 속에서의 **근거 시어**를 찾게 하세요. (없다면 그 감상은 오답 가능성이 큼)  
-2. “이 감상이 맞으려면, 시 속에서 어떤 표현이 반드시 있어야 하지?”를 질문해 보게 합니다.  
-3. 보기 감상과 시 내용을 비교할 때, 감정 단어만 보지 말고 **관계·상황·태도**까지 함께 확인하도록 지도하세요.""",
-
-    "비문학-사회/경제(조세-효율성·공평성 개념)": """### 📈 사회/경제: 조세·효율성·공평성 개념
-**1. 진단**  
-조세 정책을 설명하는 문단에서 **효율성과 공평성의 개념**은 대략 이해했으나, 둘이 어떤 상황에서 충돌하는지 구체적으로 떠올리지 못했습니다.
-
-**2. Action Plan**  
-1. 효율성 = 전체 파이 키우기, 공평성 = 파이 나누는 방식이라는 비유로 다시 정리하게 하세요.  
-2. 실제 사례(누진세, 복지 정책 등)를 가지고 “이건 효율성/공평성 중 어느 쪽을 더 중시한 정책인가?”를 분류해 보게 합니다.  
-3. 문제를 풀 때는 문장 옆에 `효율↑ 공평↓` 같은 화살표 메모를 하게 해서, 방향성을 시각적으로 익히도록 지도하세요.""",
-
-    "비문학-사회/경제(효율성 vs 공평성 비교)": """### 📈 사회/경제: 효율성 vs 공평성 비교
-**1. 진단**  
-두 가치가 서로 충돌할 때 어떤 선택을 하는지, 그에 따른 장단점을 논리적으로 비교하는 데 어려움이 있습니다.
-
-**2. Action Plan**  
-1. “효율성만 높이면 생길 수 있는 문제 / 공평성만 중시하면 생길 수 있는 문제”를 각각 두 가지씩 써 보게 하세요.  
-2. 지문에서 제시한 입장이 어느 쪽에 더 치우쳐 있는지, 근거 문장을 표시하게 합니다.  
-3. 선지를 읽을 때, 두 가치를 모두 만족시키는지보다 **어느 가치를 더 우선시하는지**에 초점을 맞추도록 지도하세요.""",
-
-    "비문학-사회/경제(보기 적용-조세 사례 분석)": """### 📈 사회/경제: 보기 적용(조세 사례)
-**1. 진단**  
-[보기]에 제시된 구체적인 세금 사례를, 지문에서 설명한 조세 원리(효율성/공평성, 조세 형평 등)와 연결하지 못했습니다.
-
-**2. Action Plan**  
-1. 보기 속 사례 옆에 “= 효율성 중시 / 공평성 중시 / 혼합”처럼 지문 개념을 붙이게 하세요.  
-2. 세율 구조·과세 대상·재원 사용처가 각각 효율성·공평성과 어떻게 연결되는지 질문하며 하나씩 따져 보게 합니다.  
-3. 보기 적용 문제는 반드시 **지문 개념 요약 → 보기 사례 읽기 → 개념 라벨 붙이기** 순서를 지키도록 지도하세요.""",
-
-    "매체-영화/시나리오(장면 연출 의도 파악)": """### 🎬 매체: 영화/시나리오 장면 연출 의도
-**1. 진단**  
-장면 전환, 카메라 거리, 배경음악 등 연출 요소를 그냥 ‘상황 설명’ 정도로만 이해하고, **관객에게 주는 효과**까지 연결하지 못했을 가능성이 큽니다.
-
-**2. Action Plan**  
-1. 컷 전환, 클로즈업, 롱숏, 배경음 등 연출 장치 옆에 `긴장 강화`, `감정 집중`, `정보 제공` 같은 효과를 적게 하세요.  
-2. 같은 내용이라도 어떻게 찍느냐에 따라 관객 인상이 달라진다는 점을 짧은 영상 예시로 경험하게 하는 것이 좋습니다.  
-3. 문제에서 묻는 것이 ‘내용’인지 ‘연출 효과’인지 먼저 구분하도록 지도하세요.""",
-
-    "매체-영화/시나리오(보기 적용-감상 관점)": """### 🎬 매체: 영화 감상 관점(보기 적용)
-**1. 진단**  
-[보기]의 감상문이 사용하는 관점(인물 중심, 주제 중심, 연출 중심 등)을 구분하지 못했습니다. 그래서 감상 관점과 맞지 않는 내용을 걸러내지 못합니다.
-
-**2. Action Plan**  
-1. 보기 감상문에서 반복되는 단어나 강조되는 부분을 찾아 “이 감상은 **인물/주제/연출/사회적 의미** 중 어디에 초점이 있는가?”를 분류하게 하세요.  
-2. 각 관점별로 어떤 요소를 중점적으로 언급하는지(인물 내면, 상징, 카메라 움직임 등) 간단한 리스트를 만들어 두고, 그 기준으로 선지를 판단하도록 지도하세요.""",
-
-    "매체-영화/시나리오(구성·장면 배열 효과)": """### 🎬 매체: 구성·장면 배열 효과
-**1. 진단**  
-사건이 제시되는 순서를 바꾸었을 때 **긴장감·정보 공개 시점**이 어떻게 달라지는지 상상하지 못했습니다.
-
-**2. Action Plan**  
-1. 제시된 장면 순서를 바꾸어 다시 배열해 보게 하고, “이렇게 바꾸면 관객은 어떤 정보를 언제 알게 되는가?”를 비교하게 하세요.  
-2. 플래시백, 미리 제시된 결말 장면 등 비선형 구성이 작품 해석에 어떤 역할을 하는지 토론해 보게 하면 효과적입니다.  
-3. 문제에서 ‘구성상 효과’를 묻는 선지는 항상 **정보 공개 시점·긴장감·인물에 대한 인상 변화** 중 어디를 말하는지 확인하게 하세요.""",
-
-    "비문학-과학/기술(초고층 건물-하중 개념 이해)": """### ⚙️ 과학/기술: 초고층 건물·하중 개념
-**1. 진단**  
-하중의 종류(고정 하중/활동 하중/풍하중 등)를 구분하지 못하거나, 구조물에 어떤 방식으로 작용하는지 상상하지 못했을 가능성이 큽니다.
-
-**2. Action Plan**  
-1. 지문에 나온 하중 종류 옆에 간단한 예시(사람·가구·바람 등)를 직접 그려 보게 하세요.  
-2. “어떤 하중은 항상 존재하고, 어떤 하중은 시간에 따라 달라지는가?”를 기준으로 분류하게 합니다.  
-3. 선지에서 하중의 방향(수직/수평)과 지속성(항상/일시적)을 바꾸어 말하고 있는지 확인하도록 지도하세요.""",
-
-    "비문학-과학/기술(구조 유형 비교·설명 방식)": """### ⚙️ 과학/기술: 구조 유형 비교
-**1. 진단**  
-여러 구조 유형(예: 라멘, 트러스 등)의 특징을 암기 수준으로만 알고, **어떤 구조가 어떤 하중에 적합한지** 연결하지 못했습니다.
-
-**2. Action Plan**  
-1. 구조별로 “어떤 방향의 힘에 강한지, 주로 어디에 쓰이는지”를 짧게 정리한 표를 만들게 하세요.  
-2. 지문 설명에서 ‘비교/대조’ 표현(반면에, 그러나, ~와 달리)을 표시하게 하여, 구조 간 차이점을 눈에 띄게 합니다.  
-3. 보기나 선지에 제시된 상황(바람이 강한 지역, 지진 가능성 등)에 어떤 구조가 적합한지 스스로 판단해 보게 하는 연습을 시키세요.""",
-
-    "비문학-과학/기술(TLCD 작동 원리 이해)": """### ⚙️ 과학/기술: TLCD 작동 원리
-**1. 진단**  
-TLCD의 구조와 작동 원리를 글로만 읽고, **‘흔들림 → 액체 움직임 → 힘 상쇄’**라는 과정을 단계적으로 정리하지 못했습니다.
-
-**2. Action Plan**  
-1. TLCD의 구조를 간단히 그림으로 그리게 하고, 건물이 한쪽으로 기울 때 액체가 어떻게 움직여 반대 힘을 만드는지 화살표로 표시하게 하세요.  
-2. 원인-결과를 `건물 흔들림 ↑ → 액체 운동 ↑ → 상쇄력 ↑`처럼 한 줄 공식으로 정리하도록 지도하세요.  
-3. 계산이나 수치보다, “어떤 요소가 변할 때 어떤 결과가 따라오는지”에 초점을 맞춰 읽게 해야 합니다.""",
-
-    "비문학-과학/기술(보기-도식 정보 적용)": """### ⚙️ 과학/기술: 도식 정보 적용
-**1. 진단**  
-[보기]에 제시된 도식·그래프·표를 TLCD 설명과 정확히 연결하지 못했습니다. 도식의 각 요소가 지문에서 무엇을 의미하는지 파악이 부족한 상태입니다.
-
-**2. Action Plan**  
-1. 도식의 각 부분(상자, 화살표)에 지문 용어를 직접 적게 하여 1:1로 매칭시켜 보게 하세요.  
-2. 지문과 도식 중 무엇이 ‘원리 설명’이고 무엇이 ‘구체적 예시’인지 나누게 합니다.  
-3. 도식 설명 문제는 지문 전체를 다시 읽기보다, 도식-지문 사이의 대응 관계를 먼저 완성한 뒤 선지를 검토하게 하세요.""",
-
-    "문학-고전소설(배비장전-작품·모티프 개관)": """### 📖 문학(고전소설): 배비장전 개관
-**1. 진단**  
-배비장전을 단순한 옛날 이야기로만 보고, **풍자·해학·위선 폭로**라는 핵심 모티프를 잡지 못했을 가능성이 큽니다.
-
-**2. Action Plan**  
-1. 배비장 인물을 한 줄로 요약하게 하세요. (예: 밖에서는 엄격한 선비, 속으로는 욕망에 흔들리는 인물)  
-2. 이야기의 주요 사건을 “겉으로 드러난 모습 vs 속마음” 구조로 나눠 정리하게 합니다.  
-3. 다른 풍자 소설(예: 허생전 등)과 비교하여, 어떤 방식으로 인물의 위선을 드러내는지 공통점·차이점을 정리하게 하세요.""",
-
-    "문학-고전소설(배비장전-인물·갈등 구조)": """### 📖 문학(고전소설): 배비장전 인물·갈등
-**1. 진단**  
-사건 전개는 이해했지만, 인물들 사이의 **갈등 구조와 힘의 역전**을 충분히 파악하지 못했습니다. 특히 주인공의 심리 변화와 주변 인물의 의도를 놓쳤을 수 있습니다.
-
-**2. Action Plan**  
-1. 배비장, 기생, 아내, 주변 인물의 관계도를 그리고, 각 인물이 배비장을 어떻게 ‘시험’하거나 ‘조롱’하는지 화살표로 표시하게 하세요.  
-2. 갈등이 최고조에 이르는 장면과, 그 갈등이 어떻게 해소되는지를 구체적으로 적게 합니다.  
-3. 선지를 읽을 때 단순한 사건 요약인지, 인물의 가치관·태도를 드러내는지 구분해서 보게 지도하세요.""",
-
-    "문학-고전소설(배비장전-장면별 태도 해석)": """### 📖 문학(고전소설): 장면별 태도 해석
-**1. 진단**  
-각 장면에서 배비장이 보이는 태도(체면/욕망/두려움 등)를 상황에 맞게 읽어내지 못했습니다. 한 번 형성한 인물 이미지만 고수한 채, 장면별 변화를 놓친 경우가 많습니다.
-
-**2. Action Plan**  
-1. 주요 장면마다 “밖으로 드러난 말/행동”과 “속마음”을 따로 적게 하여, 위선 구조를 분명하게 인식하게 하세요.  
-2. “이 장면에서 배비장은 무엇을 가장 두려워하는가?” 같은 질문을 던져, 감정의 초점을 찾게 합니다.  
-3. 태도 선지를 볼 때는 단어 하나에만 반응하지 말고, 그 단어가 작품 전체에서의 배비장과 어울리는지 검증하게 지도하세요.""",
-
-    "문학-고전소설(배비장전-상황에 맞는 성어)": """### 📖 문학(고전소설): 상황에 맞는 성어 이해
-**1. 진단**  
-성어의 뜻은 대략 알고 있지만, **작품 속 구체적 장면과 성어의 핵심 이미지**를 연결하지 못했습니다. 비슷한 의미의 성어를 혼동했을 가능성이 큽니다.
-
-**2. Action Plan**  
-1. 자주 나오는 성어들의 한자 구성과 기본 이미지를 먼저 정리하게 하세요. (예: 자승자박 = 스스로 만든 올가미에 걸림)  
-2. 작품 속 장면을 한 줄로 요약한 뒤, 그 상황과 가장 잘 어울리는 성어를 고르는 연습을 여러 작품에 걸쳐 반복시키세요.  
-3. 성어 문제를 풀 때는 단어 뜻만 보지 말고, **‘누가 누구에게 무엇을 해서 어떤 꼴이 되었는가’**를 기준으로 판단하도록 지도하세요."""
-}
-def create_report_html(grade, round_name, name, score, rank, total_students, wrong_data_map, feedback_func):
-    from datetime import datetime
-
-    now = datetime.now().strftime("%Y년 %m월 %d일 %H시 %M분")
-    has_wrong = bool(wrong_data_map)
-    feedback_section_html = ""
-
-    if has_wrong:
-        for title, q_nums in wrong_data_map.items():
-            nums_str = ", ".join([str(n) for n in sorted(q_nums)]) + "번"
-
-            msg = feedback_func(title)   # 해당 유형의 피드백 가져오기
-            clean_msg = msg.strip().replace(">", "💡").replace("**", "").replace("-", "•").replace("\n", "<br>")
-
-            # 제목과 본문 분리
-            if clean_msg.startswith("###"):
-                parts = clean_msg.split("<br>", 1)
-                title_txt = parts[0].replace("###", "").strip()
-                body_txt = parts[1] if len(parts) > 1 else ""
-                feedback_section_html += f"""
-                <div class='feedback-card'>
-                    <div class='card-header'>
-                        <span class='card-title'>{title_txt}</span>
-                        <span class='card-nums'>❌ 틀린 번호: {nums_str}</span>
-                    </div>
-                    <div class='card-body'>{body_txt}</div>
-                </div>
-                """
-            else:
-                feedback_section_html += f"""
-                <div class='feedback-card'>
-                    <div class='card-header'>
-                        <span class='card-title'>{title}</span>
-                        <span class='card-nums'>❌ 틀린 번호: {nums_str}</span>
-                    </div>
-                    <div class='card-body'>{clean_msg}</div>
-                </div>
-                """
 
-    else:
-        feedback_section_html = """
-        <div class='feedback-card' style='border-color:#4CAF50; background:#E8F5E9;'>
-            <h3 style='color:#2E7D32; margin:0;'>🎉 완벽합니다!</h3>
-            <p style='margin:10px 0 0 0;'>약점이 없습니다.</p>
-        </div>
-        """
-
-    return f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <title>{name} 성적표</title>
-    <style>
-        body {{ font-family: 'Malgun Gothic', sans-serif; padding: 20px; color: #333; }}
-        .paper {{ max-width: 800px; margin: 0 auto; border: 2px solid #444; padding: 40px; }}
-        h1 {{ text-align: center; border-bottom: 3px solid #444; padding-bottom: 20px; margin-bottom: 30px; }}
-        .info-table {{ width: 100%; border-collapse: collapse; margin-bottom: 30px; }}
-        .info-table th {{ background-color: #f4f4f4; border: 1px solid #999; padding: 12px; width: 20%; font-weight: bold; }}
-        .info-table td {{ border: 1px solid #999; padding: 12px; text-align: center; }}
-        .score {{ font-size: 36px; font-weight: bold; color: #D32F2F; }}
-        .feedback-card {{ border: 1px solid #999; margin-bottom: 20px; page-break-inside: avoid; }}
-        .card-header {{ background-color: #eee; padding: 10px 15px; border-bottom: 1px solid #ccc; display: flex; justify-content: space-between; align-items: center; }}
-        .card-title {{ font-size: 16px; font-weight: bold; }}
-        .card-nums {{ font-size: 14px; color: #D32F2F; font-weight: bold; background: white; padding: 3px 8px; border-radius: 5px; border: 1px solid #ddd; }}
-        .card-body {{ padding: 15px; font-size: 13px; line-height: 1.6; }}
-        .footer {{ text-align: center; margin-top: 50px; font-size: 12px; color: #888; }}
-    </style>
-</head>
-<body>
-    <div class="paper">
-        <h1>📑 {grade} {round_name} 분석 성적표</h1>
-
-        <table class="info-table">
-            <tr>
-                <th>이 름</th><td>{name}</td>
-                <th>응시일</th><td>{now}</td>
-            </tr>
-            <tr>
-                <th>점 수</th><td><span class="score">{int(score)}</span> 점</td>
-                <th>등 수</th><td>{rank}등 / {total_students}명</td>
-            </tr>
-        </table>
-
-        <h3 style="border-bottom: 2px solid #ddd; padding-bottom: 10px;">
-            💊 유형별 오답 분석 및 처방
-        </h3>
-
-        {feedback_section_html}
-
-        <div class="footer">
-            위 학생의 모의고사 결과를 증명합니다.<br>
-            Designed by AI Teacher
-        </div>
-    </div>
-</body>
-</html>
-"""
-
-def create_portfolio_html(grade, name, my_hist_df, weakness_stats, feedback_markdown_map):
-    """
-    grade: 학년 문자열 (예: '중 1학년')
-    name:  학생 이름
-    my_hist_df: 해당 학생 기록 df (Round, Score, Wrong_Types 포함)
-    weakness_stats: [(유형명, 횟수), ...]  (보통 TOP3)
-    feedback_markdown_map: {유형명: 피드백_마크다운_문자열}
-    """
-    now = datetime.now().strftime("%Y년 %m월 %d일 %H시 %M분")
-
-    # 1) 응시 기록 테이블 HTML
-    history_rows = ""
-    for _, row in my_hist_df.iterrows():
-        history_rows += f"""
-        <tr>
-            <td>{row['Round']}</td>
-            <td>{row['Score']}</td>
-            <td>{row.get('Wrong_Types', '')}</td>
-        </tr>
-        """
-
-    # 2) 누적 취약 유형 TOP3 테이블
-    weakness_rows = ""
-    for t, c in weakness_stats:
-        # 보기 좋게 "화법(말하기 전략)" → "화법: 말하기 전략"
-        display_title = str(t).replace("(", ": ").replace(")", "")
-        weakness_rows += f"""
-        <tr>
-            <td>{display_title}</td>
-            <td>{c}회</td>
-        </tr>
-        """
-
-    # 3) 유형별 맞춤 처방 (마크다운 → 제목/본문 분리 후 HTML)
-    feedback_sections = ""
-    for t, _ in weakness_stats:
-        md = str(feedback_markdown_map.get(t, "")).strip()
-
-        if md.startswith("###"):
-            parts = md.split("\n", 1)
-            title_txt = parts[0].replace("###", "").strip()
-            body_txt = parts[1] if len(parts) > 1 else ""
-        else:
-            title_txt = t
-            body_txt = md
-
-        html_body = body_txt.replace("\n", "<br>")
-
-        feedback_sections += f"""
-        <div class="feedback-card">
-            <div class="card-header">
-                <span class="card-title">{title_txt}</span>
-            </div>
-            <div class="card-body">{html_body}</div>
-        </div>
-        """
-
-    # 최종 HTML
-    return f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <title>{grade} {name} 포트폴리오 리포트</title>
-    <style>
-        body {{ font-family: 'Malgun Gothic', sans-serif; padding: 20px; color: #333; }}
-        h1 {{ text-align: center; border-bottom: 3px solid #444; padding-bottom: 20px; margin-bottom: 30px; }}
-        h2 {{ margin-top: 30px; border-bottom: 2px solid #999; padding-bottom: 8px; }}
-        table {{ width: 100%; border-collapse: collapse; margin-top: 10px; }}
-        th, td {{ border: 1px solid #999; padding: 8px; text-align: center; font-size: 13px; }}
-        th {{ background-color: #f4f4f4; }}
-        .feedback-card {{ border: 1px solid #999; margin-top: 15px; page-break-inside: avoid; }}
-        .card-header {{ background-color: #eee; padding: 8px 12px; border-bottom: 1px solid #ccc; }}
-        .card-title {{ font-weight: bold; }}
-        .card-body {{ padding: 12px; font-size: 13px; line-height: 1.6; }}
-        .meta {{ font-size: 12px; color: #666; text-align:right; margin-bottom: 10px; }}
-    </style>
-</head>
-<body>
-    <h1>📈 {grade} {name} 포트폴리오 리포트</h1>
-    <div class="meta">생성 시각: {now}</div>
-
-    <h2>1️⃣ 응시 기록 요약</h2>
-    <table>
-        <thead>
-            <tr>
-                <th>회차</th>
-                <th>점수</th>
-                <th>오답 유형</th>
-            </tr>
-        </thead>
-        <tbody>
-            {history_rows}
-        </tbody>
-    </table>
-
-    <h2>2️⃣ 누적 취약 유형 TOP3</h2>
-    <table>
-        <thead>
-            <tr>
-                <th>유형</th>
-                <th>누적 오답 횟수</th>
-            </tr>
-        </thead>
-        <tbody>
-            {weakness_rows}
-        </tbody>
-    </table>
-
-    <h2>3️⃣ 유형별 맞춤 처방</h2>
-    {feedback_sections}
-
-</body>
-</html>
-"""
-    
-def get_feedback_message_list(question_type, use_general=True):
-    messages = []
-    q = str(question_type).strip()
-
-    if q in FEEDBACK_BY_TYPE:
-        messages.append(FEEDBACK_BY_TYPE[q])
-
-    if use_general and "문법" in question_type or "문장" in question_type:
-        if "음운" not in question_type and "사전" not in question_type and "중세" not in question_type:
-            messages.append("""### 🏗️ 문법: 문장의 '뼈대' 찾기
-문장 성분 분석과 조사의 쓰임을 놓쳤습니다.
-→ 서술어 확인 → 필수 성분(주어·목적어·보어) 점검""")
-
-    if use_general and "사전" in question_type:
-        messages.append("""### 📖 문법: 사전 정보
-품사 / 문형 / 예문 연결이 부족합니다.
-→ 품사 먼저 체크 후 예문 비교""")
-
-    if use_general and "음운" in question_type:
-        messages.append("""### 🛑 문법: 음운 변동
-‘유형’보다 ‘환경’을 먼저 봐야 합니다.
-→ 받침+자음 / 받침+모음 / ㄷ·ㅌ+이 구조 먼저 확인""")
-
-    if use_general and "철학" in question_type or "인문" in question_type:
-        messages.append("""### 🧠 인문/철학
-사상가별 기준과 용어가 섞였습니다.
-→ 공통점/차이점 표로 정리 + 키워드 한 줄 요약""")
-
-    if use_general and "경제" in question_type or "사회" in question_type:
-        messages.append("""### 📈 사회/경제
-원인 → 과정 → 결과 흐름을 못 봤습니다.
-→ 금리↑ → 소비↓ → 경기↓ 처럼 화살표 정리""")
-
-    if use_general and "소설" in question_type or "서사" in question_type:
-        messages.append("""### 🎭 문학(산문)
-갈등 지점을 못 잡았습니다.
-→ 인물관계도 + 말/행동 변화 표시""")
-
-    if use_general and "시가" in question_type:
-        messages.append("""### 🌙 문학(운문)
-감정어가 아니라 ‘관계/상황’을 봐야 합니다.
-→ 화자-대상-상황 한 문장 정리""")
-
-    if use_general and "화법" in question_type:
-        messages.append("""### 🗣️ 화법
-전달 ‘방식/전략’을 못 봤습니다.
-→ 강조/비교/질문/예시 표시""")
-
-    if use_general and "매체" in question_type:
-        messages.append("""### 🖥️ 매체
-기능과 효과 연결이 부족했습니다.
-→ 댓글/링크/그래프 = 어떤 효과?""")
-
-    if use_general and  "보기" in question_type:
-        messages.append("""### 🔥 보기 적용
-지문 개념 → 보기 상황 번역 실패
-→ 보기 단어를 지문 용어로 치환""")
-
-    if not messages:
-        messages.append("### ⚠️ 기초 독해력 → 근거부터 재확인")
-
-    return messages
+@st.fragment
+@METRICS.section("render_exam_grade")
+def render_exam_grade(grade):
+    rounds = list(EXAM_DB[grade].keys())
+    selected_round = st.selectbox("회차", rounds, key=f"ex_r_{grade}")
+    current_exam_data = EXAM_DB[grade][selected_round]
 
+    input_mode = st.radio(
+        "입력 방식", ["개별 입력", "일괄 업로드"], horizontal=True, key=f"ex_mode_{grade}"
+    )
+    if input_mode == "일괄 업로드":
+        render_bulk_import(grade, selected_round, current_exam_data)
+        return
+
+    with st.form(f"form_{grade}_{selected_round}"):
+
+        nm = st.text_input("이름")
+        sid = st.text_input("학번")
+
+        user_answers = {}
+        for q, info in current_exam_data.items():
+            user_answers[q] = st.radio(
+                f"{q}번 ({info['score']}점)",
+                [1,2,3,4,5],
+                horizontal=True,
+                index=None
+            )
 
-# --------------------------------------------------
-# [6] 탭 구성
-# --------------------------------------------------
-tab1, tab2, tab3 = st.tabs(["📝 시험 응시", "🔍 성적 조회", "📈 포트폴리오"])
-active_grades = [g for g in GRADE_ORDER if g in EXAM_DB]
+        submit = st.form_submit_button("제출")
 
+    if submit:
+        queue = get_submission_queue()
+        if not queue:
+            st.error("시트 연결 실패")
+            return
 
-# ==================================================
-# [탭 1] 시험 응시
-# ==================================================
-with tab1:
-    st.header("시험 응시")
+        graded = grade_answers(get_compiled_round(current_exam_data), user_answers)
+        total_score = int(graded.totals[0])
 
-    if not active_grades:
-        st.error("데이터가 없습니다.")
-    else:
-        exam_tabs = st.tabs(active_grades)
-
-        for i, grade in enumerate(active_grades):
-            with exam_tabs[i]:
-                rounds = list(EXAM_DB[grade].keys())
-                selected_round = st.selectbox("회차", rounds, key=f"ex_r_{grade}")
-                current_exam_data = EXAM_DB[grade][selected_round]
-
-                with st.form(f"form_{grade}_{selected_round}"):
-
-                    nm = st.text_input("이름")
-                    sid = st.text_input("학번")
-
-                    user_answers = {}
-                    for q, info in current_exam_data.items():
-                        user_answers[q] = st.radio(
-                            f"{q}번 ({info['score']}점)",
-                            [1,2,3,4,5],
-                            horizontal=True,
-                            index=None
-                        )
+        # ✅ 관리자 정보 + 압축 답안 같이 저장
+        new_row = build_result_row(
+            grade, selected_round, sid, nm, total_score, graded.wrong_types(0),
+            graded.wrong_questions(0), current_admin, graded.answer_vector(0)
+        )
 
-                    submit = st.form_submit_button("제출")
+        # 시트 쓰기는 대기열에서 모아서 처리 (제출은 바로 반환)
+        sub_id = queue.submit(new_row)
+        st.session_state.setdefault("my_submissions", []).append(
+            {"id": sub_id, "grade": grade, "round": selected_round, "name": nm, "score": total_score}
+        )
 
-                if submit:
-                    sheet = get_student_sheet()
-                    if not sheet:
-                        st.error("시트 연결 실패")
-                        continue
+        # 제출 직후 등수: 이미 읽어 둔 점수 인덱스에 방금 점수를 더해서 계산 (시트를 다시 읽지 않음)
+        # 아직 아무도 조회하지 않은 학년이면 인덱스가 비어 있어 1등 / 1명 이 되므로 등수는 빼고 안내
+        # 업서트 모드면 같은 회차의 이전 기록은 덮어써지므로 그 점수는 빼고 계산
+        results = get_results_cache()
+        ranked = None
+        if results:
+            try:
+                if results.loaded(grade):
+                    ranked = results.rank(
+                        grade, selected_round, total_score, include_new=True,
+                        student_id=sid if SUBMISSION_MODE == "upsert" else None, admin_id=current_admin
+                    )
+            except Exception:
+                # 등수를 못 구해도 제출은 이미 대기열에 들어감 - 등수만 빼고 안내
+                logger.exception("제출 직후 등수 계산 실패")
+        if ranked:
+            rank, total, _ = ranked
+            st.success(f"{nm}점수: {total_score}점 제출 완료! (현재 {rank}등 / {total}명)")
+        else:
+            st.success(f"{nm}점수: {total_score}점 제출 완료!")
 
-                    total_score = 0
-                    wrong_list = []
-                    wrong_q = []
 
-                    for q, info in current_exam_data.items():
-                        if user_answers.get(q) == info['ans']:
-                            total_score += info['score']
-                        else:
-                            wrong_list.append(info['type'])
-                            wrong_q.append(str(q))
+@st.fragment(run_every=5)
+def render_submission_status():
+    # 이번 접속에서 제출한 답안의 저장 상태 (대기열이 백그라운드로 저장하므로 5초마다 갱신)
+    # 시트를 읽지 않는 폴링이라 METRICS 구간으로 재지 않음 - 5초마다 재실행 기록이 쌓여 다른 기록을 밀어내지 않도록
+    my_subs = st.session_state.get("my_submissions", [])
+    queue = get_submission_queue()
+    if my_subs and queue:
+        st.markdown("---")
+        with st.expander(f"📮 제출 저장 현황 ({len(my_subs)}건)", expanded=False):
+            for sub in reversed(my_subs):
+                status = queue.status(sub["id"])
+                label = STATUS_LABELS.get(status, status)
+                line = f"{label} · {sub['grade']} {sub['round']} · {sub['name']} ({sub['score']}점)"
+                if status in (FAILED, RETRYING):
+                    line += f" — {queue.error(sub['id'])}"
+                st.write(line)
+
+
+@st.fragment
+@METRICS.section("render_exam_tab")
+def render_exam_tab():
+    st.header("시험 응시")
 
-                    w_q_str = ", ".join(wrong_q) if wrong_q else "없음"
+    if not active_grades:
+        st.error("데이터가 없습니다.")
+        return
+
+    exam_tabs = st.tabs(active_grades, key="exam_grade_tab", on_change="rerun")
+    for grade, grade_tab in zip(active_grades, exam_tabs):
+        if grade_tab.open:
+            with grade_tab:
+                render_exam_grade(grade)
 
-                    # ✅ 관리자 정보 같이 저장
-                    new_row = [
-                        grade,
-                        selected_round,
-                        sid,
-                        nm,
-                        total_score,
-                        " | ".join(wrong_list),
-                        datetime.now().strftime("%Y-%m-%d %H:%M"),
-                        w_q_str,
-                        current_admin
-                    ]
+    render_submission_status()
 
-                    sheet.append_row(new_row)
 
-                    st.success(f"{nm}점수: {total_score}점 저장 완료!")
+with tab1:
+    if tab1.open:
+        render_exam_tab()
 
 
 # ==================================================
 # [탭 2] 성적 조회
 # ==================================================
-with tab2:
-    st.header("성적 조회")
+@st.fragment
+@METRICS.section("render_result")
+def render_result(grade):
+    rounds = list(EXAM_DB[grade].keys())
+    c1, c2 = st.columns(2)
+    chk_rd = c1.selectbox("회차", rounds, key=f"res_r_{grade}")
+    chk_id = c2.text_input("학번", key=f"res_i_{grade}")
+
+    if st.button("조회", key=f"res_b_{grade}"):
+    # 👉 학생 데이터 로딩 (너 지금 쓰는 방식 그대로면 여기만 df 만드는 부분 맞춰주면 됨)
+        results = get_results_cache()
+        if results:
+            try:
+                results.sync(grade)
+                my_data = results.lookup(grade, chk_id, chk_rd)
+
+                if not my_data.empty:
+                    last_row = my_data.iloc[-1]
+
+                    rank, total, pct = results.rank(grade, chk_rd, last_row['Score'])
+
+                    st.divider()
+                    st.subheader(f"📢 {grade} {last_row['Name']}님의 결과")
+                    m1, m2, m3 = st.columns(3)
+                    m1.metric("점수", f"{int(last_row['Score'])}")
+                    m2.metric("등수", f"{rank} / {total}")
+                    m3.metric("상위", f"{pct:.1f}%")
+
+                    w_q_str = str(last_row.get('Wrong_Questions', ''))
+                    w_nums = parse_wrong_questions(w_q_str)
+
+                    st.markdown("---")
+                    if w_nums:
+                        st.error(f"❌ **틀린 문제:** {w_q_str}번")
+                    else:
+                        st.success("만점입니다!")
+
+                    # ================================
+                    # 🔒 여기부터 관리자 상세 피드백
+                    # ================================
+                    if is_admin:
+                        st.info("🔒 상세 분석 (관리자 전용)")
+
+                        curr_db = EXAM_DB[grade][chk_rd]
+
+                        # 1) 동일한 피드백 내용끼리 묶기: msg(피드백 문자열) -> [문항 번호 리스트]
+                        feedback_group = group_feedback(curr_db, w_nums, get_feedback_message_list)
+
+                        # 2) 화면에 출력
+                        if feedback_group:
+                            st.write("### 💡 유형별 상세 피드백")
+
+                            for i, (msg, nums) in enumerate(feedback_group.items()):
+                                nums = sorted(nums)
+                                n_txt = ", ".join(map(str, nums))
+
+                                # 제목 / 본문은 카탈로그에 미리 분리되어 있음
+                                entry = FEEDBACK_CATALOG.entry(msg)
+                                label = f"❌ **{entry.title}**  (틀린 번호: {n_txt}번)"
+
+                                with st.expander(label, expanded=(i == 0)):
+                                    st.markdown(entry.markdown)
 
-    res_tabs = st.tabs(active_grades)
-
-    def render_result(grade):
-        rounds = list(EXAM_DB[grade].keys())
-        c1, c2 = st.columns(2)
-        chk_rd = c1.selectbox("회차", rounds, key=f"res_r_{grade}")
-        chk_id = c2.text_input("학번", key=f"res_i_{grade}")
-    
-        if st.button("조회", key=f"res_b_{grade}"):
-        # 👉 학생 데이터 로딩 (너 지금 쓰는 방식 그대로면 여기만 df 만드는 부분 맞춰주면 됨)
-            sheet = get_student_sheet()
-            if sheet:
-                try:
-                    recs = sheet.get_all_records()
-                    df = pd.DataFrame(recs)
-                    df['Grade'] = df['Grade'].astype(str).str.strip()
-                    df['Round'] = df['Round'].astype(str).str.strip()
-                    df['ID'] = df['ID'].astype(str)
-    
-                    def norm(v):
-                        try:
-                            return str(int(v))
-                        except:
-                            return str(v).strip()
-    
-                    df['ID_Clean'] = df['ID'].apply(norm)
-                    in_id = norm(chk_id)
-                    
-                    my_data = df[
-                        (df['Grade'] == str(grade)) &
-                        (df['Round'] == str(chk_rd)) &
-                        (df['ID_Clean'] == in_id)
-                    ]
-                    
-                    if not my_data.empty:
-                        last_row = my_data.iloc[-1]
-                        
-                        r_data = df[(df['Grade'] == str(grade)) & (df['Round'] == str(chk_rd))]
-                        rank = r_data[r_data['Score'] > last_row['Score']].shape[0] + 1
-                        total = len(r_data)
-                        pct = (rank / total) * 100
-                        
-                        st.divider()
-                        st.subheader(f"📢 {grade} {last_row['Name']}님의 결과")
-                        m1, m2, m3 = st.columns(3)
-                        m1.metric("점수", f"{int(last_row['Score'])}")
-                        m2.metric("등수", f"{rank} / {total}")
-                        m3.metric("상위", f"{pct:.1f}%")
-                        
-                        w_q_str = str(last_row.get('Wrong_Questions', ''))
-                        w_nums = [int(x.strip()) for x in w_q_str.split(",") if x.strip().isdigit()] if w_q_str != "없음" else []
-                        
                         st.markdown("---")
-                        if w_nums:
-                            st.error(f"❌ **틀린 문제:** {w_q_str}번")
-                        else:
-                            st.success("만점입니다!")
-                        
-                        # ================================
-                        # 🔒 여기부터 관리자 상세 피드백
-                        # ================================
-                        if is_admin:
-                            st.info("🔒 상세 분석 (관리자 전용)")
-    
-                            curr_db = EXAM_DB[grade][chk_rd]
-    
-                            # 1) 동일한 피드백 내용끼리 묶기: msg(피드백 문자열) -> [문항 번호 리스트]
-                            feedback_group = {}
-    
-                            for q in w_nums:
-                                if q not in curr_db:
-                                    continue
-                                qt = curr_db[q]['type']          # 이 문항의 Type (예: "화법(강연-말하기 전략)")
-                                msgs = get_feedback_message_list(qt, use_general=False)
-                                if not msgs:
-                                    msgs = get_feedback_message_list(qt, use_general=True)
-    
-                                for msg in msgs:
-                                    key = msg.strip()
-                                    if key not in feedback_group:
-                                        feedback_group[key] = []
-                                    if q not in feedback_group[key]:
-                                        feedback_group[key].append(q)
-    
-                            # 2) 화면에 출력
-                            if feedback_group:
-                                st.write("### 💡 유형별 상세 피드백")
-    
-                                for i, (msg, nums) in enumerate(feedback_group.items()):
-                                    nums = sorted(nums)
-                                    n_txt = ", ".join(map(str, nums))
-    
-                                    raw = msg.strip()
-                                    # 제목 / 본문 분리 (### 첫 줄을 제목으로 사용)
-                                    if raw.startswith("###"):
-                                        first_line, *rest = raw.split("\n", 1)
-                                        title = first_line.replace("###", "").strip()
-                                    else:
-                                        title = "상세 피드백"
-    
-                                    label = f"❌ **{title}**  (틀린 번호: {n_txt}번)"
-    
-                                    with st.expander(label, expanded=(i == 0)):
-                                        st.markdown(msg)
-    
-                            # 3) 성적표(html) 다운로드용 매핑 (제목 -> 문항 번호 / 메시지)
-                            report_map = {}
-                            title_to_msg = {}
-                            for msg, nums in feedback_group.items():
-                                t = msg.strip().split('\n')[0].replace("###", "").strip() if "###" in msg else "기타"
-                                report_map[t] = nums
-                                title_to_msg[t] = msg
-    
-                            st.markdown("---")
-                            st.write("### 💾 저장")
-    
-                            rpt = create_report_html(
-                                grade,
-                                chk_rd,
-                                last_row['Name'],
-                                last_row['Score'],
-                                rank,
-                                total,
-                                report_map,
-                                lambda x: title_to_msg.get(x, "")
-                            )
-                            html_bytes = rpt.encode("utf-8")
-    
-                            st.download_button(
-                                "📥 다운로드",
-                                html_bytes,
-                                file_name="report.html",
-                                mime="text/html; charset=utf-8",
-                                key=f"d_{grade}_{chk_id}"
-                            )
-                        else:
-                            st.warning("🔒 상세 분석과 성적표는 선생님만 볼 수 있습니다.")
-    
+                        st.write("### 💾 저장")
+
+                        rpt = create_report_html(
+                            grade,
+                            chk_rd,
+                            last_row['Name'],
+                            last_row['Score'],
+                            rank,
+                            total,
+                            feedback_group
+                        )
+                        html_bytes = rpt.encode("utf-8")
+
+                        st.download_button(
+                            "📥 다운로드",
+                            html_bytes,
+                            file_name="report.html",
+                            mime="text/html; charset=utf-8",
+                            key=f"d_{grade}_{chk_id}"
+                        )
                     else:
-                        st.error("기록 없음")
-                except Exception as e:
-                    st.error(f"오류: {e}")
-    for i, g in enumerate(active_grades):
-        with res_tabs[i]:
-            render_result(g)
+                        st.warning("🔒 상세 분석과 성적표는 선생님만 볼 수 있습니다.")
+
+                else:
+                    st.error("기록 없음")
+            except Exception as e:
+                st.error(f"오류: {e}")
+
+
+@st.fragment
+@METRICS.section("render_class_reports")
+def render_class_reports(grade):
+    # 회차 응시 학생 전체 성적표를 ZIP 하나로 (캐시된 결과 + 등수 인덱스 재사용)
+    rounds = list(EXAM_DB[grade].keys())
+    with st.expander("📦 회차 전체 성적표 일괄 다운로드 (ZIP)"):
+        zip_rd = st.selectbox("회차", rounds, key=f"zip_r_{grade}")
+
+        if st.button("성적표 생성", key=f"zip_b_{grade}"):
+            results = get_results_cache()
+            if not results:
+                st.error("시트 연결 실패")
+                return
+
+            if not sync_results(results, grade):
+                return
+            rows = results.round_frame(grade, zip_rd)
+            if not is_superadmin:
+                rows = rows[rows["AdminID"] == current_admin]
+            if rows.empty:
+                st.warning("기록 없음")
+                return
+
+            round_data = EXAM_DB[grade][zip_rd]
+
+            def render(row):
+                rank, total, _ = results.rank(grade, zip_rd, row.Score)
+                html = build_student_report(
+                    grade, zip_rd, round_data, row.Name, row.Score, rank, total,
+                    row.Wrong_Questions, get_feedback_message_list
+                )
+                return f"{grade}_{zip_rd}_{row.ID}_{row.Name}.html", html
+
+            with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as buf:
+                n = write_reports_zip(buf, rows.itertuples(index=False), render)
+                buf.seek(0)
+                zip_bytes = buf.read()
+
+            st.success(f"✔ {n}명 성적표 생성 완료")
+            st.download_button(
+                "📥 ZIP 다운로드",
+                zip_bytes,
+                file_name=f"{grade}_{zip_rd}_성적표.zip",
+                mime="application/zip",
+                key=f"zip_d_{grade}_{zip_rd}"
+            )
+
+
+@st.fragment
+@METRICS.section("render_result_tab")
+def render_result_tab():
+    st.header("성적 조회")
+
+    res_tabs = st.tabs(active_grades, key="res_grade_tab", on_change="rerun")
+    for g, grade_tab in zip(active_grades, res_tabs):
+        if grade_tab.open:
+            with grade_tab:
+                render_result(g)
+                render_class_reports(g)
+
+
+with tab2:
+    if tab2.open:
+        render_result_tab()
 
 
 # ==================================================
 # [탭 3] 포트폴리오
 # ==================================================
-with tab3:
+@st.fragment
+@METRICS.section("render_admin_overview")
+def render_admin_overview(results):
+    # 최고관리자 전용: 관리자별 입력 현황 (관리자 선택을 바꿔도 이 부분만 다시 실행)
+    st.markdown("---")
+    st.subheader("👀 관리자별 입력 현황 (최고관리자 전용)")
+
+    # 동기화 때 갱신해 둔 관리자별 집계 표에서 선택한 관리자만 꺼냄 (모든 학년 샤드)
+    if not sync_results(results):
+        return
+    if "AdminID" not in results.header:
+        st.warning("AdminID 컬럼이 없습니다.")
+        return
+
+    admin_list = results.admin_ids()
+
+    sel_admin = st.selectbox(
+        "관리자 선택",
+        admin_list,
+        key="admin_summary_selector"
+    )
+
+    view = results.admin_students(sel_admin)
+
+    st.write(f"✔ {sel_admin} 관리자가 입력한 학생 수: {view.shape[0]}명")
+    if not view.empty:
+        last = view["마지막 응시"].max()
+        last_txt = last.strftime("%Y-%m-%d %H:%M") if pd.notna(last) else "-"
+        st.caption(f"총 응시 {int(view['응시횟수'].sum())}회 · 마지막 입력 {last_txt}")
+    st.dataframe(view[["Grade", "ID", "Name", "응시횟수", "마지막 응시"]])
+
+
+@st.fragment
+@METRICS.section("render_portfolio_tab")
+def render_portfolio_tab():
+    import altair as alt     # 차트 라이브러리는 포트폴리오를 처음 열 때 import
+
     st.header("📈 포트폴리오")
 
     # ===============================
@@ -981,36 +763,23 @@ with tab3:
     # =====================================================
     if st.session_state.get("show_portfolio"):
 
-        sheet = get_student_sheet()
-        if not sheet:
+        results = get_results_cache()
+        if not results:
             st.error("시트 오류")
-            st.stop()
+            return
 
-        df = pd.DataFrame(sheet.get_all_records())
-
-        # AdminID 컬럼 보정
-        df["AdminID"] = df.get("AdminID", "").astype(str)
+        # 공유 캐시에서 새로 추가된 행만 반영한 뒤, 학번 인덱스로 바로 조회
+        if not sync_results(results, pg):
+            return
+        my_hist = results.lookup(pg, pid)
 
         # 최종관리자가 아닌 경우 자신의 데이터만 조회
         if not is_superadmin:
-            df = df[df["AdminID"] == current_admin]
-
-        df["ID"] = df["ID"].astype(str).str.strip()
-        df["Grade"] = df["Grade"].astype(str).str.strip()
-
-        def norm_id(v):
-            try:
-                return str(int(str(v)))
-            except:
-                return str(v).strip()
-        df["ID_Clean"]=df["ID"].apply(norm_id)
-        in_pid=norm_id(pid)
-
-        my_hist = df[(df["Grade"] == pg) & (df["ID_Clean"] == in_pid)]
+            my_hist = my_hist[my_hist["AdminID"] == current_admin]
 
         if my_hist.empty:
             st.warning("기록 없음")
-            st.stop()
+            return
 
         name = my_hist.iloc[-1]["Name"]
         st.success(f"{pg} {name} 성장 기록")
@@ -1027,25 +796,14 @@ with tab3:
         # ===============================
         # 2. 누적 오답 유형 분석
         # ===============================
-        from collections import Counter
-
-        all_wrong = []
-        for _, r in my_hist.iterrows():
-            wt = str(r.get("Wrong_Types", "")).strip()
-            if wt:
-                all_wrong += wt.split(" | ")
-
-        cnt = Counter(all_wrong).most_common() if all_wrong else []
+        # 동기화 때 미리 집계해 둔 학생별 오답 유형 표에서 바로 조회
+        cnt = results.weak_types(pg, pid, admin_id=None if is_superadmin else current_admin)
 
         selected = []
         seen_msgs = set()
 
         for t, c in cnt:
-            msgs = get_feedback_message_list(t, use_general=False)
-            if not msgs:
-                msgs = get_feedback_message_list(t, use_general=True)
-
-            full_md = "\n".join(msgs)
+            full_md = FEEDBACK_CATALOG.type_entry(t).markdown
 
             if full_md in seen_msgs:
                 continue
@@ -1058,8 +816,6 @@ with tab3:
 
         st.markdown("## 🔎 취약 유형 (피드백 기준 TOP 3)")
 
-        feedback_map = {}
-
         if selected:
             c_left, c_right = st.columns([1, 1.5])
 
@@ -1071,16 +827,9 @@ with tab3:
             with c_right:
                 st.info("💡 유형별 상세 피드백")
                 for idx, (t, c) in enumerate(selected):
-                    msgs = get_feedback_message_list(t, use_general=False)
-                    if not msgs:
-                        msgs = get_feedback_message_list(t, use_general=True)
-
-                    full_md = "\n".join(msgs)
-                    feedback_map[t] = full_md
-
                     display_title = str(t).replace("(", ": ").replace(")", "")
                     with st.expander(f"{display_title} 처방전", expanded=(idx == 0)):
-                        st.markdown(full_md)
+                        st.markdown(FEEDBACK_CATALOG.type_entry(t).markdown)
         else:
             st.success("✅ 누적 취약 유형이 거의 없습니다.")
 
@@ -1095,8 +844,7 @@ with tab3:
                 grade=pg,
                 name=name,
                 my_hist_df=my_hist[['Round', 'Score', 'Wrong_Types']],
-                weakness_stats=selected,
-                feedback_markdown_map=feedback_map
+                weakness_stats=selected
             )
             html_bytes = html_report.encode("utf-8")
 
@@ -1114,30 +862,59 @@ with tab3:
         # 4. 최고관리자 전용: 관리자별 입력 현황
         # ===============================
         if is_superadmin:
-            st.markdown("---")
-            st.subheader("👀 관리자별 입력 현황 (최고관리자 전용)")
+            render_admin_overview(results)
 
-            df_all = pd.DataFrame(sheet.get_all_records())
 
-            if "AdminID" not in df_all.columns:
-                st.warning("AdminID 컬럼이 없습니다.")
+with tab3:
+    if tab3.open:
+        render_portfolio_tab()
+
+
+# ==================================================
+# [탭 4] 문항 분석
+# ==================================================
+@st.fragment
+@METRICS.section("render_item_analysis_tab")
+def render_item_analysis_tab():
+    st.header("📊 문항 분석")
+    st.caption("정답률(p) · 점이연 변별도(r_pb) · 상하위 27% 정답률 차이(D) / 학생별 마지막 응시 기준")
+
+    c1, c2 = st.columns(2)
+    ia_grade = c1.selectbox("학년", active_grades, key="ia_grade")
+    ia_rounds = list(EXAM_DB[ia_grade].keys()) if ia_grade else []
+    ia_round = c2.selectbox("회차", ia_rounds, key="ia_round")
+
+    if st.button("분석", key="ia_btn") and ia_round:
+        results = get_results_cache()
+        if not results:
+            st.error("시트 연결 실패")
+        elif sync_results(results, ia_grade):
+            n_students, items, by_type, distractors = load_item_analysis(
+                ia_grade, ia_round, results.version, EXAM_DB[ia_grade][ia_round]
+            )
+
+            if n_students == 0:
+                st.warning("기록 없음")
             else:
-                df_all["AdminID"] = df_all["AdminID"].astype(str).str.strip()
-                df_all["ID"] = df_all["ID"].astype(str).str.strip()
-                df_all["Name"] = df_all["Name"].astype(str).str.strip()
-                df_all["Grade"] = df_all["Grade"].astype(str).str.strip()
+                st.write(f"✔ {ia_grade} {ia_round} · 응시 {n_students}명")
 
-                group = df_all.groupby(["AdminID", "Grade", "ID", "Name"]).size().reset_index(name="응시횟수")
+                st.subheader("문항별 분석")
+                st.dataframe(items, hide_index=True)
 
-                admin_list = sorted(group["AdminID"].unique())
+                st.subheader("유형별 요약")
+                st.dataframe(by_type, hide_index=True)
+
+                st.subheader("선택지 분포 (%)")
+                n_known = int(distractors["응답 수"].iloc[0]) if len(distractors) else 0
+                if n_known:
+                    st.caption(f"고른 답이 기록된 {n_known}명 기준")
+                    st.dataframe(distractors.drop(columns=["응답 수"]), hide_index=True)
+                else:
+                    st.info("고른 답이 기록된 응시 기록이 없습니다. (답안 벡터 저장 이후 제출분부터 집계)")
 
-                sel_admin = st.selectbox(
-                    "관리자 선택",
-                    admin_list,
-                    key="admin_summary_selector"
-                )
 
-                view = group[group["AdminID"] == sel_admin].sort_values(["Grade", "ID"])
+with tab4:
+    if tab4.open:
+        render_item_analysis_tab()
 
-                st.write(f"✔ {sel_admin} 관리자가 입력한 학생 수: {view.shape[0]}명")
-                st.dataframe(view[["Grade", "ID", "Name", "응시횟수"]])
+METRICS.end_rerun()
@@ -0,0 +1,257 @@
+"""
+앱이 쓰는 gspread 기능만 흉내 낸 메모리 내 가짜 구현 (벤치마크 / 오프라인 실행용).
+
+    backend = FakeBackend(latency=0.05, quota_error_rate=0.01)
+    ss = FakeSpreadsheet(backend, {"Sheet1": rows, "Admins": admin_rows, ...})
+    pool = make_pool(ss)          # sheets.SheetsPool 과 같은 인터페이스
+
+지원: client.open, spreadsheet.worksheet / worksheets / sheet1 / values_batch_get / add_worksheet /
+fetch_sheet_metadata, worksheet.get_all_records / get_all_values / get / append_row / append_rows / update /
+batch_update / clear, gspread.WorksheetNotFound, 쿼터 초과(429) gspread.exceptions.APIError
+
+격자: 실제 시트처럼 워크시트마다 격자 행 수가 있고(append 하면 늘어남), 격자 밖에서 시작하는 범위를 읽으면 400.
+worksheet.row_count 는 실제 핸들처럼 연 시점 값 (fetch_sheet_metadata 로만 새 값을 알 수 있음)
+"""
+import itertools
+import random
+import threading
+import time
+from collections import Counter
+
+import gspread
+from gspread.utils import a1_range_to_grid_range
+
+from gateway import SheetsGateway
+from sheets import SheetsPool
+
+
+class _FakeResponse:
+    # gspread.exceptions.APIError 가 읽는 부분만 (status_code / json / text)
+    def __init__(self, code, status, message):
+        self.status_code = code
+        self.text = message
+        self._error = {"code": code, "status": status, "message": message}
+
+    def json(self):
+        return {"error": self._error}
+
+
+def grid_error(range_name, max_rows):
+    return gspread.exceptions.APIError(
+        _FakeResponse(400, "INVALID_ARGUMENT", f"Range ({range_name}) exceeds grid limits. Max rows: {max_rows}")
+    )
+
+
+def auth_error():
+    return gspread.exceptions.APIError(
+        _FakeResponse(401, "UNAUTHENTICATED", "Request had invalid authentication credentials.")
+    )
+
+
+def quota_error():
+    return gspread.exceptions.APIError(
+        _FakeResponse(429, "RESOURCE_EXHAUSTED", "Quota exceeded for quota metric 'Read requests'")
+    )
+
+
+class FakeBackend:
+    """
+    모든 가짜 API 호출이 거쳐 가는 곳 - 지연 시간 / 쿼터 오류 / 호출 횟수.
+
+    latency: 호출 1회 지연(초), jitter: 지연에 더할 최대 무작위 시간(초)
+    quota_error_rate: 호출이 429 로 실패할 확률 (0~1)
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, quota_error_rate=0.0, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.quota_error_rate = quota_error_rate
+        self.calls = Counter()
+        self.errors = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def call(self, method):
+        with self._lock:
+            self.calls[method] += 1
+            delay = self.latency + (self._rng.random() * self.jitter if self.jitter else 0.0)
+            fail = self.quota_error_rate and self._rng.random() < self.quota_error_rate
+            if fail:
+                self.errors[method] += 1
+        if delay:
+            time.sleep(delay)
+        if fail:
+            raise quota_error()
+
+    def total_calls(self):
+        return sum(self.calls.values())
+
+    def reset_counts(self):
+        with self._lock:
+            self.calls.clear()
+            self.errors.clear()
+
+
+def _grid(range_name):
+    # "A5:J" / "'시트'!J2:J31" -> (시작 행, 끝 행, 시작 열, 끝 열) 0 기준, 끝은 미포함 (None = 끝까지)
+    a1 = range_name.split("!", 1)[1] if "!" in range_name else range_name
+    if not a1 or a1.startswith("'"):
+        return 0, None, 0, None
+    g = a1_range_to_grid_range(a1)
+    return g.get("startRowIndex", 0), g.get("endRowIndex"), g.get("startColumnIndex", 0), g.get("endColumnIndex")
+
+
+_sheet_ids = itertools.count(1)
+
+
+class FakeWorksheet:
+    def __init__(self, backend, title, rows=None, grid_rows=None):
+        self._backend = backend
+        self.title = title
+        self.id = next(_sheet_ids)
+        self._rows = [[str(v) for v in r] for r in (rows or [])]
+        self._grid = max(grid_rows or 0, len(self._rows), 1)
+        self._properties = {"sheetId": self.id, "title": title, "gridProperties": {"rowCount": self._grid}}
+        self._lock = threading.Lock()
+
+    @property
+    def row_count(self):
+        # 실제 gspread 처럼 연 시점(또는 마지막 메타데이터 확인 시점)의 격자 행 수
+        return self._properties["gridProperties"]["rowCount"]
+
+    def _grow(self):
+        self._grid = max(self._grid, len(self._rows))
+
+    def _read(self, r0=0, r1=None, c0=0, c1=None):
+        with self._lock:
+            rows = self._rows[r0:r1]
+            out = [list(r[c0:c1]) for r in rows]
+        # 실제 API 처럼 뒤쪽 빈 칸 / 빈 행은 잘라서 돌려줌
+        for r in out:
+            while r and r[-1] == "":
+                r.pop()
+        while out and not out[-1]:
+            out.pop()
+        return out
+
+    def get_all_values(self, **kwargs):
+        self._backend.call("get_all_values")
+        return self._read()
+
+    def get_all_records(self, **kwargs):
+        self._backend.call("get_all_records")
+        values = self._read()
+        if not values:
+            return []
+        header = values[0]
+        return [dict(zip(header, r + [""] * (len(header) - len(r)))) for r in values[1:]]
+
+    def get(self, range_name=None, **kwargs):
+        self._backend.call("get")
+        if range_name is None:
+            return self._read()
+        r0, r1, c0, c1 = _grid(range_name)
+        if r0 >= self._grid:
+            raise grid_error(range_name, self._grid)
+        return self._read(r0, r1, c0, c1)
+
+    def append_rows(self, values, **kwargs):
+        self._backend.call("append_rows")
+        with self._lock:
+            self._rows.extend([[str(v) for v in r] for r in values])
+            self._grow()
+
+    def append_row(self, values, **kwargs):
+        self._backend.call("append_row")
+        with self._lock:
+            self._rows.append([str(v) for v in values])
+            self._grow()
+
+    def clear(self):
+        self._backend.call("clear")
+        with self._lock:
+            self._rows = []
+
+    def update(self, values=None, range_name=None, **kwargs):
+        self._backend.call("update")
+        self._write(range_name or "A1", values)
+
+    def batch_update(self, data, **kwargs):
+        self._backend.call("batch_update")
+        for item in data:
+            self._write(item["range"], item["values"])
+
+    def _write(self, range_name, values):
+        r0, _, c0, _ = _grid(range_name)
+        with self._lock:
+            for i, row in enumerate(values):
+                while len(self._rows) <= r0 + i:
+                    self._rows.append([])
+                target = self._rows[r0 + i]
+                while len(target) < c0 + len(row):
+                    target.append("")
+                for j, v in enumerate(row):
+                    target[c0 + j] = str(v)
+            self._grow()
+
+
+class FakeSpreadsheet:
+    """sheets: {제목: 행 리스트(첫 행 = 헤더)} - 'Sheet1' 이 sheet1"""
+
+    def __init__(self, backend, sheets):
+        self._backend = backend
+        self._sheets = {title: FakeWorksheet(backend, title, rows) for title, rows in sheets.items()}
+
+    def worksheets(self):
+        self._backend.call("worksheets")
+        return list(self._sheets.values())
+
+    def worksheet(self, title):
+        self._backend.call("worksheet")
+        ws = self._sheets.get(title)
+        if ws is None:
+            raise gspread.WorksheetNotFound(title)
+        return ws
+
+    @property
+    def sheet1(self):
+        self._backend.call("sheet1")
+        return self._sheets["Sheet1"]
+
+    def add_worksheet(self, title, rows=1000, cols=26, **kwargs):
+        self._backend.call("add_worksheet")
+        ws = FakeWorksheet(self._backend, title, grid_rows=rows)
+        self._sheets[title] = ws
+        return ws
+
+    def fetch_sheet_metadata(self, params=None):
+        self._backend.call("fetch_sheet_metadata")
+        return {"sheets": [
+            {"properties": {"sheetId": ws.id, "title": ws.title, "gridProperties": {"rowCount": ws._grid}}}
+            for ws in self._sheets.values()
+        ]}
+
+    def values_batch_get(self, ranges, **kwargs):
+        self._backend.call("values_batch_get")
+        out = []
+        for rng in ranges:
+            title = rng.split("!", 1)[0].strip("'").replace("''", "'")
+            ws = self._sheets.get(title)
+            values = ws._read(*_grid(rng)) if ws is not None else []
+            out.append({"range": rng, "values": values})
+        return {"valueRanges": out}
+
+
+class FakeClient:
+    def __init__(self, spreadsheet):
+        self._spreadsheet = spreadsheet
+
+    def open(self, name):
+        self._spreadsheet._backend.call("open")
+        return self._spreadsheet
+
+
+def make_pool(spreadsheet, gateway=None):
+    """가짜 스프레드시트를 쓰는 SheetsPool (gateway 를 주지 않으면 쿼터 제한 없음)"""
+    gateway = gateway or SheetsGateway(reads_per_minute=None, writes_per_minute=None)
+    return SheetsPool(lambda: FakeClient(spreadsheet), gateway=gateway)
@@ -0,0 +1,253 @@
+"""
+오프라인 벤치마크 - 가짜 gspread + 합성 데이터로 주요 경로의 시간을 잰다.
+
+    python -m benchmarks.run_benchmarks                       # 1k / 10k / 100k 행
+    python -m benchmarks.run_benchmarks --sizes 1000 --latency 0.05 --json out.json
+
+항목
+  answer_db_load      정답 DB 첫 로딩 (ExamDBCache.refresh)
+  answer_db_recheck   바뀐 것 없는 상태에서 다시 확인 (해시 비교)
+  results_cold_sync   Sheet1 전체 로딩 + 인덱스 구성 (ResultsCache 첫 sync)
+  render_result       학생 1명 조회 + 등수 + 피드백 묶기 + 성적표 HTML (중앙값)
+  portfolio_build     학생 1명 누적 기록 + 취약 유형 TOP3 + 포트폴리오 HTML (중앙값)
+  grade_single        1명 채점 (grade_answers, 중앙값)
+  grade_round         회차 응시자 전체 일괄 채점 (grade_matrix)
+  report_zip          회차 응시자 전체 성적표 ZIP
+  concurrent_reads    20개 세션이 동시에 Sheet1 전체 읽기 (같은 읽기 합치기 -> 시트 호출 1회)
+  shard_migrate       Sheet1 을 학년·학년도 샤드로 분리 (migrate_legacy)
+  shard_grade_sync    분리 뒤 한 학년만 첫 sync (그 학년 샤드 + Sheet1 헤더·꼬리만 읽음)
+  upsert_resubmit     응시자 20명 재제출을 업서트로 저장 (꼬리 읽기 + 응시이력 + batch_update)
+"""
+import argparse
+import io
+import json
+import statistics
+import threading
+import time
+
+import numpy as np
+
+from benchmarks import synthetic
+from benchmarks.fake_gspread import FakeBackend, FakeSpreadsheet, make_pool
+from exam_db import ExamDBCache
+from gateway import SheetsGateway
+from feedback import FEEDBACK_CATALOG, get_feedback_message_list
+from grading import CompiledRound, grade_answers, grade_matrix
+from submissions import build_result_row
+from reports import (
+    build_student_report, create_portfolio_html, create_report_html, group_feedback,
+    parse_wrong_questions, write_reports_zip,
+)
+from results import ResultsCache
+from shards import ShardedResults, ShardRouter, migrate_legacy, upsert_result_rows
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+
+def _timed(fn):
+    t = time.perf_counter()
+    out = fn()
+    return (time.perf_counter() - t) * 1000, out
+
+
+def _median_ms(fn, args_list):
+    times = []
+    for args in args_list:
+        ms, _ = _timed(lambda: fn(*args))
+        times.append(ms)
+    return statistics.median(times)
+
+
+def render_result(results, exam_db, grade, round_name, sid):
+    # app.render_result 에서 화면 출력을 뺀 부분
+    my_data = results.lookup(grade, sid, round_name)
+    if my_data.empty:
+        return None
+    last_row = my_data.iloc[-1]
+    rank, total, _ = results.rank(grade, round_name, last_row["Score"])
+    w_nums = parse_wrong_questions(str(last_row["Wrong_Questions"]))
+    feedback_group = group_feedback(exam_db[grade][round_name], w_nums, get_feedback_message_list)
+    for msg in feedback_group:
+        FEEDBACK_CATALOG.entry(msg)
+    return create_report_html(grade, round_name, last_row["Name"], last_row["Score"], rank, total, feedback_group)
+
+
+def portfolio_build(results, grade, sid):
+    # app.render_portfolio_tab 에서 화면 출력을 뺀 부분
+    my_hist = results.lookup(grade, sid)
+    if my_hist.empty:
+        return None
+    selected = []
+    seen = set()
+    for t, c in results.weak_types(grade, sid):
+        md = FEEDBACK_CATALOG.type_entry(t).markdown
+        if md in seen:
+            continue
+        seen.add(md)
+        selected.append((t, c))
+        if len(selected) >= 3:
+            break
+    return create_portfolio_html(grade, my_hist.iloc[-1]["Name"], my_hist[["Round", "Score", "Wrong_Types"]], selected)
+
+
+def concurrent_reads(pool, n_threads):
+    # 모든 스레드가 동시에 같은 읽기를 요청 -> 게이트웨이가 한 번만 호출하고 결과를 나눠 줌
+    ws = pool.sheet1()
+    barrier = threading.Barrier(n_threads)
+
+    def worker():
+        barrier.wait()
+        ws.get_all_values()
+
+    threads = [threading.Thread(target=worker) for _ in range(n_threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def run_size(n_rows, n_rounds, backend_kwargs, samples, seed, reads_per_minute=None):
+    sheets = synthetic.make_sheets(n_rows, n_rounds=n_rounds, seed=seed)
+    backend = FakeBackend(seed=seed, **backend_kwargs)
+    gateway = SheetsGateway(reads_per_minute=reads_per_minute, writes_per_minute=reads_per_minute)
+    ss = FakeSpreadsheet(backend, sheets)
+    pool = make_pool(ss, gateway)
+    out = {}
+
+    def record(name, ms, calls_before):
+        out[name] = {"ms": round(ms, 2), "sheets_calls": backend.total_calls() - calls_before}
+
+    # ---------- 정답 DB ----------
+    exam_cache = ExamDBCache(pool.spreadsheet)
+    c0 = backend.total_calls()
+    ms, _ = _timed(exam_cache.refresh)
+    record("answer_db_load", ms, c0)
+    c0 = backend.total_calls()
+    ms, _ = _timed(exam_cache.refresh)
+    record("answer_db_recheck", ms, c0)
+    exam_db = exam_cache.get()
+
+    # ---------- 결과 캐시 ----------
+    results = ResultsCache(pool.sheet1, min_interval=3600, grid_rows=pool.grid_rows)
+    c0 = backend.total_calls()
+    ms, df = _timed(results.sync)
+    record("results_cold_sync", ms, c0)
+
+    picks = [
+        (row.Grade, row.Round, row.ID)
+        for row in df.sample(n=min(samples, len(df)), random_state=seed).itertuples(index=False)
+    ]
+
+    c0 = backend.total_calls()
+    ms = _median_ms(lambda g, r, s: render_result(results, exam_db, g, r, s), picks)
+    record("render_result", ms, c0)
+
+    c0 = backend.total_calls()
+    ms = _median_ms(lambda g, r, s: portfolio_build(results, g, s), picks)
+    record("portfolio_build", ms, c0)
+
+    # ---------- 채점 ----------
+    grade, round_name = picks[0][0], picks[0][1]
+    round_data = exam_db[grade][round_name]
+    compiled = CompiledRound(round_data)
+    np_rng = np.random.default_rng(seed)
+    round_rows = results.round_frame(grade, round_name)
+    n_students = max(1, len(round_rows))
+    matrix = synthetic.simulate_answers(compiled, n_students, np_rng)
+
+    singles = [({int(q): int(a) for q, a in zip(compiled.q_nums, matrix[i])},) for i in range(min(samples, n_students))]
+    ms = _median_ms(lambda answers: grade_answers(compiled, answers), singles)
+    record("grade_single", ms, backend.total_calls())
+
+    ms, _ = _timed(lambda: grade_matrix(compiled, matrix))
+    record("grade_round", ms, backend.total_calls())
+    out["grade_round"]["students"] = n_students
+
+    # ---------- 성적표 ZIP ----------
+    def render(row):
+        rank, total, _ = results.rank(grade, round_name, row.Score)
+        html = build_student_report(
+            grade, round_name, round_data, row.Name, row.Score, rank, total,
+            row.Wrong_Questions, get_feedback_message_list
+        )
+        return f"{grade}_{round_name}_{row.ID}_{row.Name}.html", html
+
+    c0 = backend.total_calls()
+    ms, n = _timed(lambda: write_reports_zip(io.BytesIO(), round_rows.itertuples(index=False), render))
+    record("report_zip", ms, c0)
+    out["report_zip"]["students"] = n
+
+    # ---------- 동시 읽기 ----------
+    # 호출이 겹치도록 지연을 최소 50ms 로
+    latency = backend.latency
+    backend.latency = max(latency, 0.05)
+    c0 = backend.total_calls()
+    ms, _ = _timed(lambda: concurrent_reads(pool, 20))
+    record("concurrent_reads", ms, c0)
+    out["concurrent_reads"]["requests"] = 20
+    backend.latency = latency
+
+    # ---------- 결과 샤딩 ----------
+    router = ShardRouter(pool)
+    c0 = backend.total_calls()
+    ms, (moved, _) = _timed(lambda: migrate_legacy(pool, router))
+    record("shard_migrate", ms, c0)
+    out["shard_migrate"]["shards"] = len(moved)
+
+    sharded = ShardedResults(pool, router, min_interval=3600, snapshots=False)
+    c0 = backend.total_calls()
+    ms, _ = _timed(lambda: sharded.sync(grade))
+    record("shard_grade_sync", ms, c0)
+
+    # ---------- 업서트 재제출 ----------
+    # 같은 회차 응시자 20명이 다시 제출 (대기열 한 묶음) - 행은 늘지 않고 기존 행을 덮어씀
+    resubmit = [
+        build_result_row(grade, round_name, row.ID, row.Name, max(row.Score - 2, 0), [], [], row.AdminID)
+        for row in round_rows.head(20).itertuples(index=False)
+    ]
+    shard_ws = ss.worksheet(router.route(resubmit[0]))
+    n_before = len(shard_ws.get_all_values())
+    sharded.sync(grade)
+    c0 = backend.total_calls()
+    ms, _ = _timed(lambda: upsert_result_rows(pool, router, sharded, resubmit))
+    record("upsert_resubmit", ms, c0)
+    out["upsert_resubmit"]["rows_added"] = len(shard_ws.get_all_values()) - n_before
+
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Sheet1 행 수")
+    parser.add_argument("--rounds", type=int, default=10, help="학년별 회차 수")
+    parser.add_argument("--latency", type=float, default=0.0, help="가짜 API 호출 1회 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="지연에 더할 최대 무작위 시간(초)")
+    parser.add_argument("--quota-error-rate", type=float, default=0.0, help="429 로 실패할 확률")
+    parser.add_argument("--reads-per-minute", type=int, default=None, help="게이트웨이 쿼터 (기본: 제한 없음)")
+    parser.add_argument("--samples", type=int, default=50, help="중앙값을 낼 때 사용할 학생 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="결과를 JSON 으로 저장할 경로")
+    args = parser.parse_args()
+
+    backend_kwargs = {"latency": args.latency, "jitter": args.jitter, "quota_error_rate": args.quota_error_rate}
+    report = {}
+    for n_rows in args.sizes:
+        report[n_rows] = run_size(
+            n_rows, args.rounds, backend_kwargs, args.samples, args.seed, args.reads_per_minute
+        )
+
+    names = list(next(iter(report.values())))
+    print(f"{'benchmark':<20}" + "".join(f"{n:>14,}" for n in args.sizes) + "   (ms / sheets calls)")
+    for name in names:
+        cells = "".join(
+            f"{report[n][name]['ms']:>9.2f} / {report[n][name]['sheets_calls']:<2}" for n in args.sizes
+        )
+        print(f"{name:<20}{cells}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "results": report}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
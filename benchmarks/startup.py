@@ -0,0 +1,66 @@
+"""
+시작 시간 벤치마크 - 새 파이썬 프로세스에서 app.py 첫 화면(로그인 전)을 그리기까지 걸리는 시간.
+
+    python benchmarks/startup.py [--repeat 5]
+
+매 회 새 프로세스로 실행하므로 컨테이너 콜드 스타트와 비슷하게 측정된다.
+(OS 파일 캐시는 남아 있으므로 실제 콜드 스타트보다는 약간 빠르게 나옴)
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 로그인 화면에서는 import 되지 않아야 하는 모듈
+HEAVY_MODULES = ["gspread", "oauth2client", "altair", "pandas", "numpy", "pyarrow"]
+
+_CHILD = """
+import json, sys, time
+t0 = time.perf_counter()
+import streamlit
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.run()
+t2 = time.perf_counter()
+print(json.dumps({{
+    "streamlit_import": t1 - t0,
+    "first_render": t2 - t1,
+    "login_form": any(t.label == "관리자 ID" for t in at.sidebar.text_input),
+    "exception": [str(e.value) for e in at.exception],
+    "heavy": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def run_once():
+    code = _CHILD.format(app=os.path.join(ROOT, "app.py"), heavy=HEAVY_MODULES)
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [run_once() for _ in range(args.repeat)]
+    last = runs[-1]
+    render = [r["first_render"] * 1000 for r in runs]
+    total = [(r["streamlit_import"] + r["first_render"]) * 1000 for r in runs]
+    print(f"첫 화면(로그인) 렌더링: 중앙값 {statistics.median(render):.0f} ms (최대 {max(render):.0f} ms)")
+    print(f"streamlit import 포함:   중앙값 {statistics.median(total):.0f} ms")
+    print(f"로그인 입력창 표시: {'예' if last['login_form'] else '아니오'}")
+    print(f"로그인 전 import 된 무거운 모듈: {', '.join(last['heavy']) or '없음'}")
+    if last["exception"]:
+        print(f"첫 화면 오류: {last['exception']}")
+
+
+if __name__ == "__main__":
+    main()
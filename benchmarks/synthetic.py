@@ -0,0 +1,136 @@
+"""
+벤치마크용 합성 데이터 - N명 × M회차 × 6개 학년.
+
+정답_ 시트: 회차마다 45문항 (독서 1~17 / 문학 18~34 / 화법·작문·언어·매체 35~45),
+Type 은 실제 피드백 카탈로그의 세부 유형 + 일반 규칙만 맞는 유형 + 어디에도 안 맞는 유형을 섞어서 뽑는다.
+응시 기록: 학생 능력치(θ)와 문항 난이도(b)로 정답 확률을 정해(1PL) 점수 분포가 실제와 비슷하게 나오도록 한다.
+"""
+import math
+
+import numpy as np
+
+from exam_db import GRADE_ORDER, parse_answer_records, values_to_records
+from grading import CompiledRound, grade_matrix
+from submissions import RESULT_HEADER, build_result_row
+
+N_QUESTIONS = 45
+THREE_POINT = 10             # 3점 문항 수 (나머지 2점, 총점 100)
+
+# 영역별 Type 후보 (앞쪽일수록 자주 출제)
+READING_TYPES = [
+    "비문학-인문/철학(흄·데카르트-진리관 비교)", "비문학-인문/철학(인상/관념 개념 추론)",
+    "비문학-인문/철학(보기 적용-경험론 사례 분석)", "비문학-인문/철학(주장·타당성 평가)",
+    "비문학-사회/경제(조세-효율성·공평성 개념)", "비문학-사회/경제(효율성 vs 공평성 비교)",
+    "비문학-사회/경제(보기 적용-조세 사례 분석)", "비문학-과학/기술(초고층 건물-하중 개념 이해)",
+    "비문학-과학/기술(구조 유형 비교·설명 방식)", "비문학-과학/기술(TLCD 작동 원리 이해)",
+    "비문학-과학/기술(보기-도식 정보 적용)",
+    "비문학-인문/철학(새 지문-논지 전개 방식)", "비문학-사회/경제(금리-그래프 해석)",
+    "비문학-기술(세부 정보 확인)",
+]
+LITERATURE_TYPES = [
+    "문학-운문(서정시 전통-형식·내용 개관)", "문학-운문(고전시가-상황·정서 파악)",
+    "문학-운문(현대시-이미지·정서 해석)", "문학-운문(전통 계승·변용 방식 평가)",
+    "문학-운문(보기 적용-종합 감상)", "문학-고전소설(배비장전-작품·모티프 개관)",
+    "문학-고전소설(배비장전-인물·갈등 구조)", "문학-고전소설(배비장전-장면별 태도 해석)",
+    "문학-고전소설(배비장전-상황에 맞는 성어)",
+    "문학-현대소설(서술상 특징)", "문학-고전시가(화자의 태도)", "문학-극(갈래 복합)",
+]
+LANGUAGE_TYPES = [
+    "화법(강연-말하기 전략)", "화법(강연-시각 자료·예시 활용)", "화법(강연-청자 반응·이해 평가)",
+    "문법-음운(비음화·유음화 개념 이해)", "문법-음운(구개음화-조음 위치·환경 분석)",
+    "문법-문장 성분/구문 도해(주어·목적어·조사)", "문법-사전 정보 해석(있다/없다-발음·품사)",
+    "문법-사전 정보 해석(있다/없다-의미·용례 적용)", "매체-영화/시나리오(장면 연출 의도 파악)",
+    "매체-영화/시나리오(보기 적용-감상 관점)", "매체-영화/시나리오(구성·장면 배열 효과)",
+    "작문(고쳐쓰기)", "매체-블로그(정보 구성)",
+]
+SECTIONS = [(17, READING_TYPES), (17, LITERATURE_TYPES), (11, LANGUAGE_TYPES)]
+
+ANSWER_HEADER = ["Round", "Q_Num", "Answer", "Score", "Type"]
+ADMIN_HEADER = ["AdminID", "Password", "Role"]
+
+
+def round_names(n_rounds):
+    return [f"{i}회" for i in range(1, n_rounds + 1)]
+
+
+def _zipf_choice(rng, options, size):
+    # 앞쪽 유형일수록 자주 나오도록 (1/k 가중치)
+    w = 1.0 / np.arange(1, len(options) + 1)
+    return rng.choice(len(options), size=size, p=w / w.sum())
+
+
+def make_answer_values(n_rounds, seed=0):
+    """return: {학년: 정답_ 시트 값(첫 행 = 헤더)}"""
+    rng = np.random.default_rng(seed)
+    sheets = {}
+    for grade in GRADE_ORDER:
+        values = [list(ANSWER_HEADER)]
+        for round_name in round_names(n_rounds):
+            types = []
+            for n, pool in SECTIONS:
+                types += [pool[i] for i in _zipf_choice(rng, pool, n)]
+            answers = rng.integers(1, 6, size=N_QUESTIONS)
+            scores = np.full(N_QUESTIONS, 2)
+            scores[rng.choice(N_QUESTIONS, size=THREE_POINT, replace=False)] = 3
+            for q in range(N_QUESTIONS):
+                values.append([round_name, str(q + 1), str(answers[q]), str(scores[q]), types[q]])
+        sheets[grade] = values
+    return sheets
+
+
+def simulate_answers(compiled, n_students, rng):
+    """(학생 × 문항) 답안 배열 - 1PL 모형으로 정답 여부를 뽑고 오답은 다른 번호 / 일부 미응답"""
+    theta = rng.normal(0.0, 1.0, size=(n_students, 1))
+    b = rng.normal(-0.3, 1.0, size=(1, compiled.n_questions))
+    p = 1.0 / (1.0 + np.exp(-1.7 * (theta - b)))
+    correct = rng.random((n_students, compiled.n_questions)) < p
+
+    wrong_pick = (compiled.answers[None, :] + rng.integers(1, 5, size=correct.shape) - 1) % 5 + 1
+    answers = np.where(correct, compiled.answers[None, :], wrong_pick)
+    answers[rng.random(correct.shape) < 0.01] = 0
+    return answers
+
+
+def make_result_rows(answer_values, n_rows, n_rounds, n_admins=5, seed=0):
+    """
+    Sheet1 행 목록(첫 행 = 헤더). 회차 순서대로, 각 회차에 학년마다 같은 학생들이 응시한다.
+    학생 수 = ceil(n_rows / (6 × n_rounds)), 전체 행 수가 n_rows 가 되도록 마지막에 자른다.
+    """
+    rng = np.random.default_rng(seed + 1)
+    n_students = max(1, math.ceil(n_rows / (len(GRADE_ORDER) * n_rounds)))
+    dbs = {g: parse_answer_records(values_to_records(answer_values[g])) for g in GRADE_ORDER}
+    admins = [f"teacher{i % n_admins + 1}" for i in range(n_students)]
+    rows = [list(RESULT_HEADER)]
+
+    for r_idx, round_name in enumerate(round_names(n_rounds)):
+        for g_idx, grade in enumerate(GRADE_ORDER):
+            compiled = CompiledRound(dbs[grade][round_name])
+            result = grade_matrix(compiled, simulate_answers(compiled, n_students, rng))
+            date = f"2026-{(r_idx % 12) + 1:02d}-{(g_idx % 28) + 1:02d} 10:00"
+            for i in range(n_students):
+                row = build_result_row(
+                    grade, round_name, f"{g_idx + 1}{i:05d}", f"학생{g_idx + 1}-{i}", result.totals[i],
+                    result.wrong_types(i), result.wrong_questions(i), admins[i], result.answer_vector(i)
+                )
+                row[6] = date
+                rows.append(row)
+
+    return rows[:n_rows + 1]
+
+
+def make_admin_rows(n_admins=5):
+    rows = [list(ADMIN_HEADER), ["admin", "admin", "superadmin"]]
+    rows += [[f"teacher{i}", f"pw{i}", "admin"] for i in range(1, n_admins + 1)]
+    return rows
+
+
+def make_sheets(n_rows, n_rounds=10, n_admins=5, seed=0):
+    """가짜 스프레드시트용 {시트 제목: 행 리스트} (Sheet1 / Admins / 정답_<학년>)"""
+    answer_values = make_answer_values(n_rounds, seed)
+    sheets = {
+        "Sheet1": make_result_rows(answer_values, n_rows, n_rounds, n_admins, seed),
+        "Admins": make_admin_rows(n_admins),
+    }
+    for grade, values in answer_values.items():
+        sheets[f"정답_{grade}"] = values
+    return sheets
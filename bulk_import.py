@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+
+from grading import NO_ANSWER
+
+# --------------------------------------------------
+# 반 전체 답안 일괄 업로드 (CSV / Excel, OMR 내보내기)
+# --------------------------------------------------
+ID_COLUMNS = ["학번", "ID", "id"]
+NAME_COLUMNS = ["이름", "Name", "name"]
+ANSWER_COLUMNS = ["답안", "Answers", "answers", "Answer", "답"]
+
+BLANK_MARKS = {"0", "-", ".", "_", ""}
+
+
+def _column_label(c):
+    # 엑셀은 숫자 헤더(문항 번호 1, 2, ...)를 int / float 로 돌려주므로 문자열로 맞춤 (1.0 -> "1")
+    if isinstance(c, float) and c.is_integer():
+        c = int(c)
+    return str(c).strip()
+
+
+def read_answer_table(uploaded_file):
+    # 학번 앞자리 0 이 사라지지 않도록 모두 문자열로 읽음 (Excel 은 openpyxl 로 읽는 .xlsx 만)
+    name = getattr(uploaded_file, "name", "")
+    if name.lower().endswith(".xlsx"):
+        df = pd.read_excel(uploaded_file, dtype=str).fillna("")
+    else:
+        df = pd.read_csv(uploaded_file, dtype=str, encoding="utf-8-sig").fillna("")
+    df.columns = [_column_label(c) for c in df.columns]
+    return df
+
+
+def _find_column(df, candidates):
+    for c in candidates:
+        if c in df.columns:
+            return c
+    return None
+
+
+def parse_answer_string(text, n_questions):
+    """
+    "3152..." (한 글자 = 한 문항) 또는 "3,1,5,2" / "3 1 5 2" 형식의 답안을 배열로 변환.
+    0 / - / . / 빈칸은 미응답. 형식이 틀리면 ValueError.
+    """
+    text = str(text).strip()
+    if "," in text:
+        tokens = [t.strip() for t in text.split(",")]
+    elif " " in text:
+        tokens = text.split()
+    else:
+        tokens = list(text)
+
+    if len(tokens) != n_questions:
+        raise ValueError(f"문항 수 불일치 ({len(tokens)}개 / {n_questions}문항)")
+
+    out = np.full(n_questions, NO_ANSWER, dtype=np.int64)
+    for i, t in enumerate(tokens):
+        if t in BLANK_MARKS:
+            continue
+        if t not in ("1", "2", "3", "4", "5"):
+            raise ValueError(f"{i + 1}번째 답 '{t}' 는 1~5 가 아닙니다")
+        out[i] = int(t)
+    return out
+
+
+def validate_answer_table(df, compiled):
+    """
+    업로드 표를 검사해서 채점 가능한 행만 배열로 만든다.
+
+    답안은 '답안' 컬럼(문자열) 또는 문항 번호별 컬럼(1, 2, ..., 45) 중 하나로 받는다.
+    return: (students_df[학번, 이름], answer_matrix, errors[(행 번호, 사유)])
+    """
+    id_col = _find_column(df, ID_COLUMNS)
+    name_col = _find_column(df, NAME_COLUMNS)
+    ans_col = _find_column(df, ANSWER_COLUMNS)
+    q_cols = [str(q) for q in compiled.q_nums]
+    per_question = ans_col is None and all(c in df.columns for c in q_cols)
+
+    if id_col is None or name_col is None or (ans_col is None and not per_question):
+        raise ValueError("학번 / 이름 / 답안(또는 문항 번호별) 컬럼이 필요합니다.")
+
+    students = []
+    rows = []
+    errors = []
+    for i, rec in enumerate(df.to_dict("records"), start=2):   # 엑셀 기준 행 번호 (헤더 = 1행)
+        sid = str(rec[id_col]).strip()
+        nm = str(rec[name_col]).strip()
+        if not sid or not nm:
+            errors.append((i, "학번 또는 이름이 비어 있습니다"))
+            continue
+        try:
+            if per_question:
+                text = ",".join(str(rec[c]).strip() for c in q_cols)
+            else:
+                text = rec[ans_col]
+            rows.append(parse_answer_string(text, compiled.n_questions))
+            students.append((sid, nm))
+        except ValueError as e:
+            errors.append((i, str(e)))
+
+    students_df = pd.DataFrame(students, columns=["학번", "이름"])
+    matrix = np.vstack(rows) if rows else np.empty((0, compiled.n_questions), dtype=np.int64)
+    return students_df, matrix, errors
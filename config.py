@@ -0,0 +1,6 @@
+import os
+
+# --------------------------------------------------
+# 로컬 저장 위치 (제출 저널 / 결과 스냅샷)
+# --------------------------------------------------
+LOCAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".exam_cache")
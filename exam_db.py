@@ -0,0 +1,160 @@
+import hashlib
+import json
+import logging
+
+import streamlit as st
+
+from refresher import BackgroundRefresher
+from sheets import get_pool, sheet_range
+
+logger = logging.getLogger(__name__)
+
+# --------------------------------------------------
+# 정답 DB (정답_<학년> 워크시트) 로딩
+# --------------------------------------------------
+GRADE_ORDER = ["중 1학년", "중 2학년", "중 3학년", "고 1학년", "고 2학년", "고 3학년"]
+
+
+def answer_sheet_name(grade):
+    return f"정답_{grade}"
+
+
+def values_to_records(values):
+    # values_batch_get 결과(첫 행 = 헤더)를 get_all_records 와 같은 dict 리스트로 변환
+    if not values:
+        return []
+    header = [str(h).strip() for h in values[0]]
+    records = []
+    for row in values[1:]:
+        if not any(str(v).strip() for v in row):
+            continue
+        padded = list(row) + [""] * (len(header) - len(row))
+        records.append(dict(zip(header, padded)))
+    return records
+
+
+def parse_answer_records(records):
+    # {회차: {문항번호: {"ans", "score", "type"}}}
+    rounds = {}
+    for row in records:
+        round_name = str(row['Round']).strip()
+        q_num = int(row['Q_Num'])
+
+        if round_name not in rounds:
+            rounds[round_name] = {}
+
+        rounds[round_name][q_num] = {
+            "ans": int(row['Answer']),
+            "score": int(row['Score']),
+            "type": str(row['Type']).strip()
+        }
+    return rounds
+
+
+def fetch_answer_values(spreadsheet):
+    """
+    워크시트 목록을 한 번 조회하고, 존재하는 정답_ 시트만 한 번의 values_batch_get 으로 읽는다.
+    (학년 수와 관계없이 API 왕복 2회)
+
+    return: {학년: 시트 값(첫 행 = 헤더)}
+    """
+    titles = {ws.title for ws in spreadsheet.worksheets()}
+    grades = [g for g in GRADE_ORDER if answer_sheet_name(g) in titles]
+    if not grades:
+        return {}
+
+    resp = spreadsheet.values_batch_get([sheet_range(answer_sheet_name(g)) for g in grades])
+    value_ranges = resp.get("valueRanges", [])
+    return {grade: vr.get("values", []) for grade, vr in zip(grades, value_ranges)}
+
+
+def content_hash(values):
+    return hashlib.sha1(json.dumps(values, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class ExamDBCache:
+    """
+    학년별 정답 DB 캐시 (모든 세션 공유).
+    새로고침하면 정답_ 시트 내용을 해시로 비교해서 바뀐 학년만 다시 파싱하고 그 학년의 버전을 올린다.
+    바뀌지 않은 학년은 이전 dict 를 그대로 쓰므로, 그 회차로 만든 다른 캐시(채점 배열, 문항 분석)도 유지된다.
+    ttl 이 지나면 마지막 정답 DB 를 계속 쓰면서 백그라운드에서 다시 읽는다. (BackgroundRefresher)
+
+    spreadsheet_getter: 스프레드시트를 돌려주는 함수
+    ttl: 이 시간(초)이 지나면 다음 get() 때 백그라운드로 변경 여부를 확인
+    """
+
+    def __init__(self, spreadsheet_getter, ttl=600.0):
+        self._spreadsheet_getter = spreadsheet_getter
+        self._refresher = BackgroundRefresher(self._reload, ttl=ttl, name="exam-db-refresh")
+        self._db = {}             # {학년: {회차: {...}}} - 바뀔 때마다 새 dict 로 교체
+        self._hashes = {}         # {학년: 시트 내용 해시}
+        self._versions = {}       # {학년: 버전}
+        self._errors = []         # [(학년, 예외), ...] 마지막 새로고침 기준
+        self._changed = []        # 마지막 새로고침에서 바뀐 학년
+
+    def get(self):
+        """정답 DB 를 돌려준다. 처음에만 직접 읽고, 이후에는 항상 마지막 정상 값을 바로 돌려준다."""
+        return self._refresher.get()
+
+    def refresh(self):
+        """
+        지금 바로 정답_ 시트를 다시 읽어서 내용이 바뀐 학년만 새로 파싱한다.
+        return: 바뀐(추가/수정/삭제된) 학년 리스트
+        """
+        self._refresher.refresh()
+        return list(self._changed)
+
+    def _reload(self):
+        # BackgroundRefresher 가 한 번에 하나씩만 호출함
+        values = fetch_answer_values(self._spreadsheet_getter())
+
+        db = {}
+        hashes = dict(self._hashes)
+        versions = dict(self._versions)
+        errors = []
+        changed = []
+        for grade, grade_values in values.items():
+            h = content_hash(grade_values)
+            if hashes.get(grade) == h and grade in self._db:
+                db[grade] = self._db[grade]
+                continue
+            try:
+                db[grade] = parse_answer_records(values_to_records(grade_values))
+            except Exception as e:
+                logger.warning("'%s' 정답 파싱 오류 - 이전 정답 유지: %s", grade, e)
+                errors.append((grade, e))
+                if grade in self._db:
+                    db[grade] = self._db[grade]     # 새 내용이 잘못됐으면 이전 정답을 계속 사용
+                continue
+            hashes[grade] = h
+            versions[grade] = versions.get(grade, 0) + 1
+            changed.append(grade)
+
+        for grade in self._db:
+            if grade not in values:
+                hashes.pop(grade, None)
+                versions[grade] = versions.get(grade, 0) + 1
+                changed.append(grade)
+
+        self._hashes = hashes
+        self._versions = versions
+        self._errors = errors
+        self._changed = changed
+        self._db = db
+        return db
+
+    @property
+    def errors(self):
+        return list(self._errors)
+
+    def version(self, grade):
+        return self._versions.get(grade, 0)
+
+
+@st.cache_resource
+def get_exam_db_cache():
+    """모든 세션이 공유하는 정답 DB 캐시. 서비스 계정 정보가 없으면 None."""
+    pool = get_pool()
+    if pool is None:
+        return None
+    return ExamDBCache(pool.spreadsheet)
@@ -0,0 +1,220 @@
+import functools
+import json
+import os
+import threading
+
+from metrics import METRICS
+
+# --------------------------------------------------
+# 유형별 피드백 규칙 엔진
+# --------------------------------------------------
+# 전용 피드백(by_type) / 일반 규칙(general_rules) / 기본 메시지(fallback)는 feedback_catalog.json 에 있음.
+# 앱 시작 때가 아니라 피드백을 처음 쓸 때 한 번만 읽는다.
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "feedback_catalog.json")
+
+
+@functools.lru_cache(maxsize=None)
+def load_feedback_data(path=CATALOG_PATH):
+    """
+    return: (by_type, general_rules, fallback)
+      by_type: {Type: 메시지}, general_rules: [{"any_of", "none_of", "message"}, ...]
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data["by_type"], data["general_rules"], data["fallback"]
+
+
+class FeedbackEngine:
+    """
+    Type 문자열 -> 피드백 메시지 리스트.
+
+    우선순위 (명시적):
+      1) by_type 에 정확히 일치하는 전용 피드백이 있으면 그것만 사용
+      2) 없으면 general_rules 중 조건이 맞는 일반 피드백 전부 (규칙 순서대로)
+      3) 그것도 없으면 fallback
+    계산 결과는 Type 별로 표에 저장해 두고, 다음부터는 dict 조회만 한다.
+    by_type / rules / fallback 을 주지 않으면 처음 사용할 때 feedback_catalog.json 에서 읽는다.
+    """
+
+    def __init__(self, by_type=None, rules=None, fallback=None):
+        self._given = (by_type, rules, fallback)
+        self._data = None
+        self._table = {}
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._data is None:
+            by_type, rules, fallback = self._given
+            if by_type is None or rules is None or fallback is None:
+                d_by_type, d_rules, d_fallback = load_feedback_data()
+                by_type = d_by_type if by_type is None else by_type
+                rules = d_rules if rules is None else rules
+                fallback = d_fallback if fallback is None else fallback
+            rules = [(tuple(r["any_of"]), tuple(r["none_of"]), r["message"]) for r in rules]
+            self._data = (by_type, rules, fallback)
+        return self._data
+
+    def static_messages(self):
+        # 규칙에 들어 있는 고정 메시지 전체 (전용 → 일반 → 기본 순)
+        by_type, rules, fallback = self._load()
+        return list(by_type.values()) + [message for _, _, message in rules] + [fallback]
+
+    def specific(self, question_type):
+        msg = self._load()[0].get(str(question_type).strip())
+        return [msg] if msg else []
+
+    def general(self, question_type):
+        q = str(question_type)
+        return [
+            message
+            for any_of, none_of, message in self._load()[1]
+            if any(k in q for k in any_of) and not any(k in q for k in none_of)
+        ]
+
+    def _resolve(self, question_type):
+        msgs = self.specific(question_type) or self.general(question_type) or [self._load()[2]]
+        return tuple(msgs)
+
+    def precompute(self, types):
+        # 정답 DB 를 불러올 때 등장하는 모든 Type 을 미리 계산
+        table = {str(t).strip(): self._resolve(t) for t in types}
+        with self._lock:
+            self._table.update(table)
+
+    def messages(self, question_type):
+        key = str(question_type).strip()
+        msgs = self._table.get(key)
+        METRICS.cache("feedback_rules", hit=msgs is not None)
+        if msgs is None:
+            msgs = self._resolve(key)
+            with self._lock:
+                self._table[key] = msgs
+        return list(msgs)
+
+
+FEEDBACK_ENGINE = FeedbackEngine()
+
+
+def exam_db_types(db):
+    # EXAM_DB 에 등장하는 모든 Type
+    return {
+        info["type"]
+        for rounds in db.values()
+        for questions in rounds.values()
+        for info in questions.values()
+    }
+
+
+def get_feedback_message_list(question_type):
+    """Type 에 해당하는 피드백 메시지 리스트 (전용 → 일반 → 기본 순서로 결정)."""
+    return FEEDBACK_ENGINE.messages(question_type)
+
+
+# --------------------------------------------------
+# 피드백 카탈로그 - 메시지를 한 번만 파싱해서 제목/본문/HTML 조각으로 보관
+# --------------------------------------------------
+class FeedbackEntry:
+    """
+    피드백 마크다운 1개(또는 여러 개를 이어 붙인 것)를 미리 파싱한 결과.
+
+    title:          '###' 첫 줄에서 뽑은 제목 (없으면 default_title)
+    markdown:       원문 마크다운 (st.markdown 용)
+    body_markdown:  제목 줄을 뺀 본문 마크다운
+    report_card_head / report_card_tail: 성적표 카드 앞/뒤 조각 (사이에 틀린 번호가 들어감)
+    portfolio_card: 포트폴리오 카드 전체 조각
+    """
+
+    __slots__ = ("title", "markdown", "body_markdown", "report_card_head", "report_card_tail", "portfolio_card")
+
+    def __init__(self, md, default_title="기타"):
+        raw = str(md).strip()
+        self.markdown = raw
+
+        # 제목 / 본문 분리 (### 첫 줄을 제목으로 사용)
+        if raw.startswith("###"):
+            first_line, *rest = raw.split("\n", 1)
+            self.title = first_line.replace("###", "").strip()
+            self.body_markdown = rest[0] if rest else ""
+        else:
+            self.title = default_title
+            self.body_markdown = raw
+
+        # 성적표: 인용/강조/목록 기호를 단순 문자로 바꾼 본문
+        clean = raw.replace(">", "💡").replace("**", "").replace("-", "•").replace("\n", "<br>")
+        if clean.startswith("###"):
+            parts = clean.split("<br>", 1)
+            report_title = parts[0].replace("###", "").strip()
+            report_body = parts[1] if len(parts) > 1 else ""
+        else:
+            report_title = default_title
+            report_body = clean
+        self.report_card_head = f"""
+                <div class='feedback-card'>
+                    <div class='card-header'>
+                        <span class='card-title'>{report_title}</span>
+                        <span class='card-nums'>❌ 틀린 번호: """
+        self.report_card_tail = f"""</span>
+                    </div>
+                    <div class='card-body'>{report_body}</div>
+                </div>
+                """
+
+        # 포트폴리오: 줄바꿈만 <br> 로
+        self.portfolio_card = f"""
+        <div class="feedback-card">
+            <div class="card-header">
+                <span class="card-title">{self.title}</span>
+            </div>
+            <div class="card-body">{self.body_markdown.replace(chr(10), "<br>")}</div>
+        </div>
+        """
+
+    def report_card(self, q_nums):
+        nums_str = ", ".join([str(n) for n in sorted(q_nums)]) + "번"
+        return self.report_card_head + nums_str + self.report_card_tail
+
+
+class FeedbackCatalog:
+    """
+    피드백 메시지 -> FeedbackEntry, Type -> FeedbackEntry(해당 Type 의 메시지를 이어 붙인 것).
+    처음 사용할 때 고정 메시지(전용 / 일반 규칙 / 기본 메시지)를 한 번에 파싱하고,
+    그 뒤로는 dict 조회만 한다.
+    """
+
+    def __init__(self, engine):
+        self._engine = engine
+        self._entries = None
+        self._by_type = {}
+        self._lock = threading.Lock()
+
+    def _warm(self):
+        with self._lock:
+            if self._entries is None:
+                static = self._engine.static_messages()
+                self._entries = {str(m).strip(): FeedbackEntry(m) for m in static}
+        return self._entries
+
+    def entry(self, msg):
+        entries = self._entries or self._warm()
+        key = str(msg).strip()
+        e = entries.get(key)
+        METRICS.cache("feedback_catalog", hit=e is not None)
+        if e is None:
+            e = FeedbackEntry(key)
+            with self._lock:
+                entries[key] = e
+        return e
+
+    def type_entry(self, question_type):
+        # 포트폴리오용: Type 의 메시지 전체를 이어 붙여서 카드 1장
+        key = str(question_type).strip()
+        e = self._by_type.get(key)
+        METRICS.cache("feedback_type_card", hit=e is not None)
+        if e is None:
+            e = FeedbackEntry("\n".join(self._engine.messages(key)), default_title=key)
+            with self._lock:
+                self._by_type[key] = e
+        return e
+
+
+FEEDBACK_CATALOG = FeedbackCatalog(FEEDBACK_ENGINE)
@@ -0,0 +1,174 @@
+import threading
+import time
+
+from metrics import METRICS
+
+# --------------------------------------------------
+# Sheets 게이트웨이 - 쿼터 맞춤 속도 제한 + 같은 읽기 합치기 + 제한 시간 안에서 대기
+# --------------------------------------------------
+# Google Sheets API 쿼터는 사용자(= 서비스 계정)당 분당 읽기 60회 / 쓰기 60회.
+# 버킷 용량(burst) + 1분 동안 채워지는 양이 쿼터를 넘지 않도록 채우는 속도를 정한다.
+READS_PER_MINUTE = 60
+WRITES_PER_MINUTE = 60
+BURST = 5
+MAX_WAIT = 10.0              # 토큰을 기다리는 최대 시간(초) - 넘으면 기다리지 않고 바로 QuotaWaitTimeout
+
+# 값만 읽는 메서드 (같은 인자로 동시에 들어오면 한 번만 호출해서 결과를 나눠 씀)
+READ_METHODS = {
+    "open", "sheet1", "worksheet", "worksheets", "get_worksheet",
+    "get", "get_all_values", "get_all_records", "get_values", "batch_get",
+    "row_values", "col_values", "acell", "cell", "values_batch_get", "values_get", "fetch_sheet_metadata",
+}
+
+
+class QuotaWaitTimeout(RuntimeError):
+    """쿼터 대기 시간이 MAX_WAIT 를 넘는 요청 (시트에는 보내지 않음)"""
+
+    def __init__(self, wait):
+        super().__init__(f"Sheets 요청이 많아 {wait:.0f}초 이상 기다려야 합니다. 잠시 후 다시 시도해 주세요.")
+        self.wait = wait
+
+
+def _status_code(e):
+    return getattr(getattr(e, "response", None), "status_code", None)
+
+
+class TokenBucket:
+    """
+    분당 per_minute 회 쿼터에 맞춘 토큰 버킷.
+    acquire() 는 토큰을 미리 예약하고(음수 = 대기 순번) 자기 차례까지 잔다 -> 먼저 온 요청이 먼저 나감.
+    per_minute 가 None 이면 제한 없음.
+    """
+
+    def __init__(self, per_minute, burst=BURST):
+        self._unlimited = per_minute is None
+        self._capacity = float(burst)
+        # burst + 60초 × rate <= per_minute
+        self._rate = 0.0 if self._unlimited else max(per_minute - burst, 1) / 60.0
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def unlimited(self):
+        return self._unlimited
+
+    def _refill(self, now):
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def acquire(self, deadline):
+        """return: 기다린 시간(초). deadline(monotonic) 안에 차례가 오지 않으면 QuotaWaitTimeout"""
+        if self._unlimited:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+            if now + wait > deadline:
+                self._tokens += 1          # 예약 취소
+                raise QuotaWaitTimeout(wait)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def drain(self):
+        # 429 를 받으면 남은 토큰을 비워서 다음 요청들이 채워지는 속도대로만 나가게 함
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0)
+
+
+class _Flight:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """같은 key 로 동시에 들어온 호출은 먼저 온 호출 하나만 실행하고 나머지는 그 결과를 받는다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def do(self, key, fn):
+        """return: (결과, 다른 호출의 결과를 받았는지)"""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, True
+
+        try:
+            flight.value = fn()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.value, False
+
+
+class SheetsGateway:
+    """
+    모든 Sheets API 호출이 거쳐 가는 곳 (SheetsPool 이 워크시트 / 스프레드시트를 감쌀 때 사용).
+
+    - 읽기 / 쓰기 각각 토큰 버킷으로 분당 쿼터에 맞춤
+    - 같은 시트·메서드·인자의 읽기가 동시에 들어오면 한 번만 호출 (결과는 읽기 전용으로 공유)
+    - 쿼터를 넘는 호출은 max_wait 까지 줄 서서 기다리고, 그보다 오래 걸릴 것 같으면 바로 QuotaWaitTimeout
+    - 읽기가 429 를 받으면 버킷을 비우고 max_wait 안에서 다시 시도 (쓰기는 제출 대기열이 재시도)
+
+    reads_per_minute / writes_per_minute: None 이면 제한 없음 (벤치마크 / 테스트용)
+    """
+
+    def __init__(self, reads_per_minute=READS_PER_MINUTE, writes_per_minute=WRITES_PER_MINUTE,
+                 burst=BURST, max_wait=MAX_WAIT):
+        self._reads = TokenBucket(reads_per_minute, burst)
+        self._writes = TokenBucket(writes_per_minute, burst)
+        self._max_wait = max_wait
+        self._flight = SingleFlight()
+
+    def call(self, name, target, fn, *args, **kwargs):
+        if name not in READ_METHODS:
+            return self._invoke(self._writes, name, target, fn, args, kwargs, retry=False)
+
+        key = (target, name, repr(args), repr(sorted(kwargs.items())))
+        value, shared = self._flight.do(
+            key, lambda: self._invoke(self._reads, name, target, fn, args, kwargs, retry=True)
+        )
+        METRICS.cache("sheets_coalesced", hit=shared)
+        return value
+
+    def _invoke(self, bucket, name, target, fn, args, kwargs, retry):
+        deadline = time.monotonic() + self._max_wait
+        last_error = None
+        while True:
+            try:
+                waited = bucket.acquire(deadline)
+            except QuotaWaitTimeout:
+                if last_error is not None:
+                    raise last_error       # 재시도할 시간이 없으면 받은 429 를 그대로
+                raise
+            try:
+                with METRICS.sheets_call(name, target, wait_ms=waited * 1000):
+                    return fn(*args, **kwargs)
+            except Exception as e:
+                if _status_code(e) != 429:
+                    raise
+                bucket.drain()
+                if not retry or bucket.unlimited:
+                    raise
+                last_error = e
@@ -0,0 +1,88 @@
+import numpy as np
+
+from answer_vectors import encode_answer_vector
+
+# --------------------------------------------------
+# 채점 엔진 - 회차 정답을 배열로 컴파일해서 (학생 × 문항) 한 번에 채점
+# --------------------------------------------------
+NO_ANSWER = 0   # 답을 고르지 않은 문항
+
+
+class CompiledRound:
+    """
+    EXAM_DB[grade][round] 를 문항 순서대로 나란히 놓은 배열로 변환한 것.
+
+    q_nums:  문항 번호 (int 배열)
+    answers: 정답 번호 (int 배열)
+    scores:  배점 (int 배열)
+    type_codes: 문항 Type 코드 (type_names 의 인덱스)
+    """
+
+    def __init__(self, round_data):
+        items = list(round_data.items())
+        self.q_nums = np.array([q for q, _ in items], dtype=np.int64)
+        self.answers = np.array([info["ans"] for _, info in items], dtype=np.int64)
+        self.scores = np.array([info["score"] for _, info in items], dtype=np.int64)
+
+        self.type_names = []
+        codes = {}
+        for _, info in items:
+            if info["type"] not in codes:
+                codes[info["type"]] = len(self.type_names)
+                self.type_names.append(info["type"])
+        self.type_codes = np.array([codes[info["type"]] for _, info in items], dtype=np.int64)
+        self._q_pos = {int(q): i for i, q in enumerate(self.q_nums)}
+
+    @property
+    def n_questions(self):
+        return len(self.q_nums)
+
+    def answers_to_matrix(self, answer_dicts):
+        # [{문항번호: 고른 답}, ...] -> (학생 × 문항) 배열, 안 고른 문항은 NO_ANSWER
+        mat = np.full((len(answer_dicts), self.n_questions), NO_ANSWER, dtype=np.int64)
+        for i, answers in enumerate(answer_dicts):
+            for q, a in answers.items():
+                pos = self._q_pos.get(int(q))
+                if pos is not None and a is not None:
+                    mat[i, pos] = int(a)
+        return mat
+
+
+class GradeResult:
+    """
+    grade_matrix 결과.
+    totals: 학생별 총점, correct: (학생 × 문항) 정답 여부
+    """
+
+    def __init__(self, compiled, answers, correct):
+        self.compiled = compiled
+        self.answers = answers
+        self.correct = correct
+        self.totals = correct.astype(np.int64) @ compiled.scores
+
+    def __len__(self):
+        return len(self.totals)
+
+    def wrong_questions(self, i):
+        # i 번째 학생이 틀린 문항 번호 (문항 순서대로)
+        return self.compiled.q_nums[~self.correct[i]].tolist()
+
+    def wrong_types(self, i):
+        # i 번째 학생이 틀린 문항의 Type (문항 순서대로, 중복 포함)
+        names = self.compiled.type_names
+        return [names[c] for c in self.compiled.type_codes[~self.correct[i]]]
+
+    def answer_vector(self, i):
+        # Sheet1 'Answers' 컬럼에 저장할 압축 답안 (answer_vectors 참고)
+        return encode_answer_vector(self.answers[i], ~self.correct[i])
+
+
+def grade_matrix(compiled, answer_matrix):
+    """(학생 × 문항) 답안 배열을 한 번에 채점한다."""
+    answer_matrix = np.asarray(answer_matrix, dtype=np.int64).reshape(-1, compiled.n_questions)
+    return GradeResult(compiled, answer_matrix, answer_matrix == compiled.answers)
+
+
+def grade_answers(compiled, answers):
+    """학생 1명 채점. answers = {문항번호: 고른 답} -> 1행짜리 GradeResult"""
+    return grade_matrix(compiled, compiled.answers_to_matrix([answers]))
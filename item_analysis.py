@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+
+from answer_vectors import ANSWER_COLUMN, decode_answer_vectors, wrong_matrix
+
+# --------------------------------------------------
+# 문항 분석 - 정답률(p), 점이연 변별도(r_pb), 상하위 집단 차이(D)
+# --------------------------------------------------
+GROUP_RATIO = 0.27      # 상위/하위 집단 비율
+
+EASY_P = 90.0           # 정답률이 이보다 높으면 '너무 쉬움'
+HARD_P = 20.0           # 정답률이 이보다 낮으면 '너무 어려움'
+LOW_DISCRIMINATION = 0.2
+
+
+def correctness_matrix(round_rows, compiled):
+    """
+    회차 응시 기록(학생별 1행)으로 (학생 × 문항) 정답 여부 배열을 만든다.
+    Answers 답안 벡터가 있으면 그것을, 없는 옛 행은 Wrong_Questions 를 사용한다.
+    compiled: grading.CompiledRound (문항 순서 기준)
+    """
+    return ~wrong_matrix(round_rows, compiled.q_nums)
+
+
+def distractor_table(round_rows, compiled):
+    """
+    문항별 선택지 분포 (%) - 고른 답이 기록된 행(답안 벡터)만 사용.
+    return: 문항, 정답, ①~⑤, 미응답, 응답 수
+    """
+    if ANSWER_COLUMN in round_rows.columns:
+        choices, _, valid = decode_answer_vectors(round_rows[ANSWER_COLUMN], compiled.n_questions)
+    else:
+        choices, valid = np.empty((0, compiled.n_questions), dtype=np.int8), np.zeros(0, dtype=bool)
+    known = choices[valid]
+    known = known[(known >= 0).all(axis=1)]
+
+    table = pd.DataFrame({"문항": compiled.q_nums, "정답": compiled.answers})
+    n = len(known)
+    for opt, label in enumerate(["미응답", "①", "②", "③", "④", "⑤"]):
+        table[label] = ((known == opt).sum(axis=0) / n * 100).round(1) if n else np.nan
+    table["응답 수"] = n
+    return table[["문항", "정답", "①", "②", "③", "④", "⑤", "미응답", "응답 수"]]
+
+
+def _point_biserial(correct, totals, scores):
+    # 문항별 (정답 여부, 해당 문항을 뺀 나머지 점수) 상관계수
+    x = correct.astype(float)
+    rest = totals[:, None] - x * scores[None, :]
+    xc = x - x.mean(axis=0)
+    rc = rest - rest.mean(axis=0)
+    denom = np.sqrt((xc ** 2).sum(axis=0) * (rc ** 2).sum(axis=0))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r = (xc * rc).sum(axis=0) / denom
+    return np.where(denom > 0, r, np.nan)
+
+
+def _upper_lower_diff(correct, totals):
+    n = len(totals)
+    k = max(1, int(round(n * GROUP_RATIO)))
+    order = np.argsort(totals, kind="stable")
+    lower = correct[order[:k]].mean(axis=0)
+    upper = correct[order[-k:]].mean(axis=0)
+    return upper - lower
+
+
+def _flag(p, r, d):
+    flags = []
+    if p >= EASY_P:
+        flags.append("너무 쉬움")
+    if p <= HARD_P:
+        flags.append("너무 어려움")
+    if (not np.isnan(r) and r < LOW_DISCRIMINATION) or d < LOW_DISCRIMINATION:
+        flags.append("변별도 낮음")
+    return ", ".join(flags)
+
+
+def analyze_round(round_rows, compiled):
+    """
+    return: (문항별 표, 유형별 표, 선택지 분포 표)
+      문항별: 문항, 유형, 배점, 정답률(%), 변별도(r_pb), 상하위차(D), 진단
+      유형별: 유형, 문항 수, 평균 정답률(%), 평균 변별도(r_pb), 평균 상하위차(D)
+    """
+    correct = correctness_matrix(round_rows, compiled)
+    totals = round_rows["Score"].to_numpy(dtype=float)
+
+    if len(totals) == 0:
+        p = np.full(compiled.n_questions, np.nan)
+        r = np.full(compiled.n_questions, np.nan)
+        d = np.full(compiled.n_questions, np.nan)
+    else:
+        p = correct.mean(axis=0) * 100
+        r = _point_biserial(correct, totals, compiled.scores.astype(float))
+        d = _upper_lower_diff(correct, totals)
+
+    types = [compiled.type_names[c] for c in compiled.type_codes]
+    items = pd.DataFrame({
+        "문항": compiled.q_nums,
+        "유형": types,
+        "배점": compiled.scores,
+        "정답률(%)": p.round(1),
+        "변별도(r_pb)": r.round(3),
+        "상하위차(D)": d.round(3),
+    })
+    items["진단"] = [_flag(pi, ri, di) for pi, ri, di in zip(p, r, d)] if len(totals) else ""
+
+    by_type = items.groupby("유형", sort=False).agg(
+        **{
+            "문항 수": ("문항", "size"),
+            "평균 정답률(%)": ("정답률(%)", "mean"),
+            "평균 변별도(r_pb)": ("변별도(r_pb)", "mean"),
+            "평균 상하위차(D)": ("상하위차(D)", "mean"),
+        }
+    ).round(3).reset_index()
+
+    return items, by_type, distractor_table(round_rows, compiled)
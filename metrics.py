@@ -0,0 +1,321 @@
+import contextlib
+import itertools
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# --------------------------------------------------
+# 성능 계측 - Sheets 호출 / 캐시 적중 / 화면 구간 시간을 재실행·세션 단위로 기록
+# --------------------------------------------------
+# 재실행(rerun) 1번 = 스크립트 전체 실행(begin_rerun ~ end_rerun) 또는 fragment 단독 실행.
+# 스크립트 스레드가 아닌 곳(백그라운드 새로고침 / 제출 대기열)의 기록은 세션·재실행 없이 "background" 로 남는다.
+MAX_EVENTS = 20000           # 보관할 Sheets 호출 / 구간 기록 수 (오래된 것부터 버림)
+MAX_RERUNS = 2000
+MAX_SESSIONS = 500           # 세션별 탭 / 캐시 집계를 보관할 세션 수 (가장 오래 기록이 없던 세션부터 정리)
+BACKGROUND = "background"
+EXPIRED = "expired"          # 정리한 세션들의 캐시 집계를 합쳐 두는 곳 (전체 세션 통계에만 포함)
+
+_local = threading.local()
+
+
+def percentile(values, q):
+    # 선형 보간 백분위수 (q: 0~1), 값이 없으면 None
+    if not values:
+        return None
+    s = sorted(values)
+    k = (len(s) - 1) * q
+    f = int(k)
+    c = min(f + 1, len(s) - 1)
+    return s[f] + (s[c] - s[f]) * (k - f)
+
+
+def _error_label(e):
+    # gspread APIError 면 HTTP 상태 코드까지 (예: "APIError 429")
+    code = getattr(getattr(e, "response", None), "status_code", None)
+    return f"{type(e).__name__} {code}" if code else type(e).__name__
+
+
+class _Rerun:
+    __slots__ = ("id", "session", "tab", "trigger", "ts", "start", "ms",
+                 "sheets_calls", "sheets_ms", "sheets_errors", "cache")
+
+    def __init__(self, rerun_id, session, tab, trigger):
+        self.id = rerun_id
+        self.session = session
+        self.tab = tab
+        self.trigger = trigger
+        self.ts = time.time()
+        self.start = time.perf_counter()
+        self.ms = None
+        self.sheets_calls = 0
+        self.sheets_ms = 0.0
+        self.sheets_errors = 0
+        self.cache = {}           # 캐시 이름 -> [hit, miss]
+
+    def to_dict(self):
+        return {
+            "kind": "rerun", "ts": round(self.ts, 3), "session": self.session, "rerun": self.id,
+            "tab": self.tab, "trigger": self.trigger,
+            "ms": None if self.ms is None else round(self.ms, 2),
+            "sheets_calls": self.sheets_calls, "sheets_ms": round(self.sheets_ms, 2),
+            "sheets_errors": self.sheets_errors,
+            "cache": {name: {"hit": h, "miss": m} for name, (h, m) in self.cache.items()},
+        }
+
+
+class Metrics:
+    """
+    프로세스 전체가 공유하는 계측 기록.
+
+    sheets_call(name, target, wait_ms): Sheets API 호출 1회 (시간 / 오류 / 쿼터 대기 시간)
+    cache(name, hit): 캐시 조회 1회 (적중 여부만 세고 개별 기록은 남기지 않음)
+    section(name): 화면 구간 (데코레이터 / with 둘 다 가능, fragment 단독 실행이면 재실행 1번으로 셈)
+    """
+
+    def __init__(self, max_events=MAX_EVENTS, max_reruns=MAX_RERUNS, max_sessions=MAX_SESSIONS):
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._events = deque(maxlen=max_events)
+        self._reruns = deque(maxlen=max_reruns)
+        self._max_sessions = max_sessions
+        self._cache = OrderedDict()   # 세션 -> {캐시 이름: [hit, miss]} (최근에 기록한 세션이 뒤)
+        self._expired = {}            # 캐시 이름 -> [hit, miss] (정리한 세션 합계)
+        self._tabs = OrderedDict()    # 세션 -> 마지막으로 연 탭 (fragment 재실행에 붙이기 위해)
+
+    def _trim_sessions(self):
+        # self._lock 안에서 - 세션이 끝나도 알 수 없으므로 오래 기록이 없던 세션부터 정리
+        while len(self._tabs) > self._max_sessions:
+            self._tabs.popitem(last=False)
+        while len(self._cache) > self._max_sessions:
+            _, per_name = self._cache.popitem(last=False)
+            for name, (h, m) in per_name.items():
+                t = self._expired.setdefault(name, [0, 0])
+                t[0] += h
+                t[1] += m
+
+    # ---------- 재실행 경계 ----------
+    def _new_rerun(self, session, tab, trigger):
+        rerun = _Rerun(next(self._ids), session, tab, trigger)
+        with self._lock:
+            self._reruns.append(rerun)
+        _local.rerun = rerun
+        _local.depth = 0
+        return rerun
+
+    def begin_rerun(self, tab=None):
+        """스크립트 맨 위에서 호출 - 이번 전체 실행을 새 재실행으로 시작"""
+        ctx = get_script_run_ctx(suppress_warning=True)
+        session = ctx.session_id if ctx else BACKGROUND
+        tab = tab or "-"
+        with self._lock:
+            self._tabs[session] = tab
+            self._tabs.move_to_end(session)
+            self._trim_sessions()
+        self._new_rerun(session, tab, "script")
+
+    def end_rerun(self):
+        """스크립트 끝(또는 st.stop 직전)에서 호출 - 전체 실행 시간 기록"""
+        rerun = getattr(_local, "rerun", None)
+        if rerun is not None and rerun.ms is None:
+            rerun.ms = (time.perf_counter() - rerun.start) * 1000
+
+    def session_id(self):
+        # 지금 스크립트를 실행 중인 세션 (스크립트 스레드가 아니면 None)
+        ctx = get_script_run_ctx(suppress_warning=True)
+        return ctx.session_id if ctx else None
+
+    def _current(self):
+        # 이 스레드의 현재 재실행 (스크립트 스레드가 아니면 None)
+        if get_script_run_ctx(suppress_warning=True) is None:
+            return None
+        return getattr(_local, "rerun", None)
+
+    # ---------- 기록 ----------
+    def _record(self, kind, name, ms, rerun, **extra):
+        event = {
+            "kind": kind, "ts": round(time.time(), 3), "name": name, "ms": round(ms, 3),
+            "session": rerun.session if rerun else BACKGROUND,
+            "rerun": rerun.id if rerun else None,
+            "tab": rerun.tab if rerun else BACKGROUND,
+        }
+        event.update(extra)
+        with self._lock:
+            self._events.append(event)
+
+    @contextlib.contextmanager
+    def sheets_call(self, name, target="", wait_ms=0.0):
+        rerun = self._current()
+        t = time.perf_counter()
+        error = None
+        try:
+            yield
+        except Exception as e:
+            error = _error_label(e)
+            raise
+        finally:
+            ms = (time.perf_counter() - t) * 1000
+            if rerun is not None:
+                rerun.sheets_calls += 1
+                rerun.sheets_ms += ms
+                rerun.sheets_errors += error is not None
+            self._record("sheets", name, ms, rerun, target=target, error=error, wait_ms=round(wait_ms, 3))
+
+    def cache(self, name, hit):
+        rerun = self._current()
+        session = rerun.session if rerun else BACKGROUND
+        i = 0 if hit else 1
+        with self._lock:
+            per_name = self._cache.get(session)
+            if per_name is None:
+                per_name = self._cache[session] = {}
+                self._trim_sessions()
+            else:
+                self._cache.move_to_end(session)
+            counts = per_name.setdefault(name, [0, 0])
+            counts[i] += 1
+            if rerun is not None:
+                rerun.cache.setdefault(name, [0, 0])[i] += 1
+
+    @contextlib.contextmanager
+    def section(self, name):
+        ctx = get_script_run_ctx(suppress_warning=True)
+        depth = getattr(_local, "depth", 0)
+        if ctx is not None and depth == 0 and ctx.fragment_ids_this_run:
+            # fragment 만 다시 실행된 경우 - 이 구간이 곧 재실행 1번
+            with self._lock:
+                tab = self._tabs.get(ctx.session_id, "-")
+            self._new_rerun(ctx.session_id, tab, f"fragment:{name}")
+        rerun = self._current()
+        _local.depth = depth + 1
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = (time.perf_counter() - t) * 1000
+            _local.depth = depth
+            if rerun is not None and depth == 0 and rerun.trigger != "script":
+                rerun.ms = ms
+            self._record("section", name, ms, rerun)
+
+    # ---------- 조회 ----------
+    def _snapshot(self, session=None):
+        with self._lock:
+            events = [e for e in self._events if session is None or e["session"] == session]
+            reruns = [r.to_dict() for r in self._reruns if session is None or r.session == session]
+            cache = {
+                (s, name): list(v)
+                for s, per_name in self._cache.items() if session is None or s == session
+                for name, v in per_name.items()
+            }
+            if session is None:
+                cache.update({(EXPIRED, name): list(v) for name, v in self._expired.items()})
+        return events, reruns, cache
+
+    def sheets_stats(self, session=None):
+        """[{name, calls, errors, p50, p95, total_ms, wait_p95}] 호출 수 많은 순 (wait = 쿼터 대기)"""
+        events, _, _ = self._snapshot(session)
+        by_name = {}
+        for e in events:
+            if e["kind"] == "sheets":
+                by_name.setdefault(e["name"], []).append(e)
+        rows = []
+        for name, evs in by_name.items():
+            ms = [e["ms"] for e in evs]
+            rows.append({
+                "name": name, "calls": len(evs), "errors": sum(e["error"] is not None for e in evs),
+                "p50": percentile(ms, 0.5), "p95": percentile(ms, 0.95), "total_ms": sum(ms),
+                "wait_p95": percentile([e.get("wait_ms", 0.0) for e in evs], 0.95),
+            })
+        return sorted(rows, key=lambda r: -r["calls"])
+
+    def sheets_by_tab(self, session=None):
+        """[{tab, name, calls, errors}] - 어느 탭이 쿼터를 쓰는지"""
+        events, _, _ = self._snapshot(session)
+        counts = {}
+        for e in events:
+            if e["kind"] == "sheets":
+                c = counts.setdefault((e["tab"], e["name"]), [0, 0])
+                c[0] += 1
+                c[1] += e["error"] is not None
+        rows = [{"tab": t, "name": n, "calls": c, "errors": err} for (t, n), (c, err) in counts.items()]
+        return sorted(rows, key=lambda r: -r["calls"])
+
+    def section_stats(self, session=None):
+        """[{name, count, p50, p95}] 구간별"""
+        events, _, _ = self._snapshot(session)
+        by_name = {}
+        for e in events:
+            if e["kind"] == "section":
+                by_name.setdefault(e["name"], []).append(e["ms"])
+        rows = [
+            {"name": name, "count": len(ms), "p50": percentile(ms, 0.5), "p95": percentile(ms, 0.95)}
+            for name, ms in by_name.items()
+        ]
+        return sorted(rows, key=lambda r: -(r["p95"] or 0))
+
+    def cache_stats(self, session=None):
+        """[{name, hit, miss, hit_rate}]"""
+        _, _, cache = self._snapshot(session)
+        totals = {}
+        for (_, name), (h, m) in cache.items():
+            t = totals.setdefault(name, [0, 0])
+            t[0] += h
+            t[1] += m
+        return [
+            {"name": name, "hit": h, "miss": m, "hit_rate": h / (h + m) if h + m else None}
+            for name, (h, m) in sorted(totals.items())
+        ]
+
+    def rerun_stats(self, session=None):
+        """재실행 시간 p50/p95 + 재실행당 Sheets 호출 수 p50/p95"""
+        _, reruns, _ = self._snapshot(session)
+        ms = [r["ms"] for r in reruns if r["ms"] is not None]
+        calls = [r["sheets_calls"] for r in reruns]
+        return {
+            "reruns": len(reruns),
+            "p50": percentile(ms, 0.5), "p95": percentile(ms, 0.95),
+            "sheets_p50": percentile(calls, 0.5), "sheets_p95": percentile(calls, 0.95),
+        }
+
+    def session_stats(self):
+        """[{session, reruns, sheets_calls, sheets_ms, p95}] 세션별"""
+        _, reruns, _ = self._snapshot()
+        by_session = {}
+        for r in reruns:
+            by_session.setdefault(r["session"], []).append(r)
+        rows = []
+        for session, rs in by_session.items():
+            ms = [r["ms"] for r in rs if r["ms"] is not None]
+            rows.append({
+                "session": session, "reruns": len(rs),
+                "sheets_calls": sum(r["sheets_calls"] for r in rs),
+                "sheets_ms": sum(r["sheets_ms"] for r in rs), "p95": percentile(ms, 0.95),
+            })
+        return sorted(rows, key=lambda r: -r["sheets_calls"])
+
+    def recent_reruns(self, session=None, n=20):
+        _, reruns, _ = self._snapshot(session)
+        return reruns[-n:][::-1]
+
+    def to_jsonl(self, session=None):
+        """Sheets 호출 / 구간 / 재실행 요약을 시간 순 JSON lines 로"""
+        events, reruns, cache = self._snapshot(session)
+        lines = sorted(events + reruns, key=lambda d: d["ts"])
+        lines += [
+            {"kind": "cache", "session": s, "name": name, "hit": h, "miss": m}
+            for (s, name), (h, m) in cache.items()
+        ]
+        return "".join(json.dumps(d, ensure_ascii=False) + "\n" for d in lines)
+
+    def reset(self):
+        with self._lock:
+            self._events.clear()
+            self._reruns.clear()
+            self._cache.clear()
+            self._expired.clear()
+
+
+METRICS = Metrics()
@@ -0,0 +1,87 @@
+import logging
+import threading
+import time
+
+from metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+# --------------------------------------------------
+# stale-while-revalidate - 마지막 정상 값을 계속 쓰면서 백그라운드에서 다시 읽기
+# --------------------------------------------------
+
+
+class BackgroundRefresher:
+    """
+    loader() 결과를 보관하는 공유 캐시.
+
+    - 처음 get() 할 때만 호출한 세션이 직접 읽는다. (실패하면 예외를 그대로 올림)
+    - ttl 이 지나면 get() 은 기다리지 않고 마지막 값을 돌려주고, 백그라운드 스레드가 다시 읽는다.
+    - 다시 읽기가 끝나면 새 값으로 한 번에 교체하고, 실패하면 이전 값을 유지한 채 로그만 남긴다.
+
+    loader: 새 값을 만들어 돌려주는 함수 (네트워크 I/O 포함)
+    ttl: 값을 새로 읽은 뒤 이 시간(초)이 지나면 백그라운드 새로고침
+    name: 로그/스레드 이름
+    """
+
+    def __init__(self, loader, ttl=600.0, name="refresher"):
+        self._loader = loader
+        self._ttl = ttl
+        self._name = name
+        self._lock = threading.Lock()            # 값 교체용 (짧게만 잡음)
+        self._load_lock = threading.Lock()       # 동시에 한 번만 읽기
+        self._value = None
+        self._loaded_at = None
+        self._refreshing = False
+        self._last_error = None
+
+    @property
+    def last_error(self):
+        return self._last_error
+
+    def get(self):
+        with self._lock:
+            loaded_at = self._loaded_at
+            value = self._value
+            stale = loaded_at is not None and time.monotonic() - loaded_at >= self._ttl
+            start = stale and not self._refreshing
+            if start:
+                self._refreshing = True
+
+        METRICS.cache(self._name, hit=loaded_at is not None)
+        if loaded_at is None:
+            return self._load(cold=True)
+        if start:
+            threading.Thread(target=self._refresh_in_background, name=self._name, daemon=True).start()
+        return value
+
+    def refresh(self):
+        """지금 바로 다시 읽어서 교체하고 새 값을 돌려준다. 실패하면 이전 값을 유지하고 예외를 올린다."""
+        return self._load(cold=False)
+
+    def _load(self, cold):
+        with self._load_lock:
+            if cold:
+                # 처음 읽기를 기다리던 세션들 - 앞 세션이 이미 읽었으면 그 값을 그대로 (loader 1회)
+                with self._lock:
+                    if self._loaded_at is not None:
+                        return self._value
+            value = self._loader()
+            with self._lock:
+                self._value = value
+                self._loaded_at = time.monotonic()
+                self._last_error = None
+            return value
+
+    def _refresh_in_background(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            self._last_error = e
+            logger.exception("%s: 백그라운드 새로고침 실패 - 이전 값을 계속 사용", self._name)
+            with self._lock:
+                # 실패해도 ttl 만큼은 다시 시도하지 않음 (매 rerun 마다 시트를 두드리지 않도록)
+                self._loaded_at = time.monotonic()
+        finally:
+            with self._lock:
+                self._refreshing = False
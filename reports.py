@@ -0,0 +1,261 @@
+import os
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from string import Template
+
+from feedback import FEEDBACK_CATALOG
+
+# --------------------------------------------------
+# 성적표 / 포트폴리오 HTML
+# --------------------------------------------------
+# 성적표 페이지 틀 (CSS 포함) - 모듈 로딩 때 한 번만 만들고 값만 채워 넣음
+REPORT_PAGE = Template("""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <title>$name 성적표</title>
+    <style>
+        body { font-family: 'Malgun Gothic', sans-serif; padding: 20px; color: #333; }
+        .paper { max-width: 800px; margin: 0 auto; border: 2px solid #444; padding: 40px; }
+        h1 { text-align: center; border-bottom: 3px solid #444; padding-bottom: 20px; margin-bottom: 30px; }
+        .info-table { width: 100%; border-collapse: collapse; margin-bottom: 30px; }
+        .info-table th { background-color: #f4f4f4; border: 1px solid #999; padding: 12px; width: 20%; font-weight: bold; }
+        .info-table td { border: 1px solid #999; padding: 12px; text-align: center; }
+        .score { font-size: 36px; font-weight: bold; color: #D32F2F; }
+        .feedback-card { border: 1px solid #999; margin-bottom: 20px; page-break-inside: avoid; }
+        .card-header { background-color: #eee; padding: 10px 15px; border-bottom: 1px solid #ccc; display: flex; justify-content: space-between; align-items: center; }
+        .card-title { font-size: 16px; font-weight: bold; }
+        .card-nums { font-size: 14px; color: #D32F2F; font-weight: bold; background: white; padding: 3px 8px; border-radius: 5px; border: 1px solid #ddd; }
+        .card-body { padding: 15px; font-size: 13px; line-height: 1.6; }
+        .footer { text-align: center; margin-top: 50px; font-size: 12px; color: #888; }
+    </style>
+</head>
+<body>
+    <div class="paper">
+        <h1>📑 $grade $round_name 분석 성적표</h1>
+
+        <table class="info-table">
+            <tr>
+                <th>이 름</th><td>$name</td>
+                <th>응시일</th><td>$now</td>
+            </tr>
+            <tr>
+                <th>점 수</th><td><span class="score">$score</span> 점</td>
+                <th>등 수</th><td>${rank}등 / ${total_students}명</td>
+            </tr>
+        </table>
+
+        <h3 style="border-bottom: 2px solid #ddd; padding-bottom: 10px;">
+            💊 유형별 오답 분석 및 처방
+        </h3>
+
+        $feedback_section_html
+
+        <div class="footer">
+            위 학생의 모의고사 결과를 증명합니다.<br>
+            Designed by AI Teacher
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+
+def create_report_html(grade, round_name, name, score, rank, total_students, feedback_group):
+    """
+    feedback_group: {피드백 메시지: [틀린 문항 번호, ...]}  (group_feedback 결과)
+    카드 HTML 은 FEEDBACK_CATALOG 에 미리 만들어 둔 조각에 번호만 끼워 넣는다.
+    """
+    now = datetime.now().strftime("%Y년 %m월 %d일 %H시 %M분")
+
+    if feedback_group:
+        feedback_section_html = "".join(
+            FEEDBACK_CATALOG.entry(msg).report_card(q_nums) for msg, q_nums in feedback_group.items()
+        )
+    else:
+        feedback_section_html = """
+        <div class='feedback-card' style='border-color:#4CAF50; background:#E8F5E9;'>
+            <h3 style='color:#2E7D32; margin:0;'>🎉 완벽합니다!</h3>
+            <p style='margin:10px 0 0 0;'>약점이 없습니다.</p>
+        </div>
+        """
+
+    return REPORT_PAGE.substitute(
+        name=name,
+        grade=grade,
+        round_name=round_name,
+        now=now,
+        score=int(score),
+        rank=rank,
+        total_students=total_students,
+        feedback_section_html=feedback_section_html,
+    )
+
+def create_portfolio_html(grade, name, my_hist_df, weakness_stats):
+    """
+    grade: 학년 문자열 (예: '중 1학년')
+    name:  학생 이름
+    my_hist_df: 해당 학생 기록 df (Round, Score, Wrong_Types 포함)
+    weakness_stats: [(유형명, 횟수), ...]  (보통 TOP3)
+    """
+    now = datetime.now().strftime("%Y년 %m월 %d일 %H시 %M분")
+
+    # 1) 응시 기록 테이블 HTML
+    history_rows = ""
+    for _, row in my_hist_df.iterrows():
+        history_rows += f"""
+        <tr>
+            <td>{row['Round']}</td>
+            <td>{row['Score']}</td>
+            <td>{row.get('Wrong_Types', '')}</td>
+        </tr>
+        """
+
+    # 2) 누적 취약 유형 TOP3 테이블
+    weakness_rows = ""
+    for t, c in weakness_stats:
+        # 보기 좋게 "화법(말하기 전략)" → "화법: 말하기 전략"
+        display_title = str(t).replace("(", ": ").replace(")", "")
+        weakness_rows += f"""
+        <tr>
+            <td>{display_title}</td>
+            <td>{c}회</td>
+        </tr>
+        """
+
+    # 3) 유형별 맞춤 처방 (카탈로그에 미리 만들어 둔 카드 조각)
+    feedback_sections = "".join(FEEDBACK_CATALOG.type_entry(t).portfolio_card for t, _ in weakness_stats)
+
+    # 최종 HTML
+    return f"""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <title>{grade} {name} 포트폴리오 리포트</title>
+    <style>
+        body {{ font-family: 'Malgun Gothic', sans-serif; padding: 20px; color: #333; }}
+        h1 {{ text-align: center; border-bottom: 3px solid #444; padding-bottom: 20px; margin-bottom: 30px; }}
+        h2 {{ margin-top: 30px; border-bottom: 2px solid #999; padding-bottom: 8px; }}
+        table {{ width: 100%; border-collapse: collapse; margin-top: 10px; }}
+        th, td {{ border: 1px solid #999; padding: 8px; text-align: center; font-size: 13px; }}
+        th {{ background-color: #f4f4f4; }}
+        .feedback-card {{ border: 1px solid #999; margin-top: 15px; page-break-inside: avoid; }}
+        .card-header {{ background-color: #eee; padding: 8px 12px; border-bottom: 1px solid #ccc; }}
+        .card-title {{ font-weight: bold; }}
+        .card-body {{ padding: 12px; font-size: 13px; line-height: 1.6; }}
+        .meta {{ font-size: 12px; color: #666; text-align:right; margin-bottom: 10px; }}
+    </style>
+</head>
+<body>
+    <h1>📈 {grade} {name} 포트폴리오 리포트</h1>
+    <div class="meta">생성 시각: {now}</div>
+
+    <h2>1️⃣ 응시 기록 요약</h2>
+    <table>
+        <thead>
+            <tr>
+                <th>회차</th>
+                <th>점수</th>
+                <th>오답 유형</th>
+            </tr>
+        </thead>
+        <tbody>
+            {history_rows}
+        </tbody>
+    </table>
+
+    <h2>2️⃣ 누적 취약 유형 TOP3</h2>
+    <table>
+        <thead>
+            <tr>
+                <th>유형</th>
+                <th>누적 오답 횟수</th>
+            </tr>
+        </thead>
+        <tbody>
+            {weakness_rows}
+        </tbody>
+    </table>
+
+    <h2>3️⃣ 유형별 맞춤 처방</h2>
+    {feedback_sections}
+
+</body>
+</html>
+"""
+
+
+# --------------------------------------------------
+# 오답 → 피드백 묶기 (성적 조회 화면 / 성적표 공용)
+# --------------------------------------------------
+def parse_wrong_questions(w_q_str):
+    # "3, 7, 12" -> [3, 7, 12]  ("없음" 이면 빈 리스트)
+    w_q_str = str(w_q_str)
+    if w_q_str == "없음":
+        return []
+    return [int(x.strip()) for x in w_q_str.split(",") if x.strip().isdigit()]
+
+
+def group_feedback(round_data, wrong_nums, feedback_func):
+    # 동일한 피드백 내용끼리 묶기: msg(피드백 문자열) -> [문항 번호 리스트]
+    feedback_group = {}
+
+    for q in wrong_nums:
+        if q not in round_data:
+            continue
+        qt = round_data[q]['type']          # 이 문항의 Type (예: "화법(강연-말하기 전략)")
+
+        for msg in feedback_func(qt):
+            key = msg.strip()
+            if key not in feedback_group:
+                feedback_group[key] = []
+            if q not in feedback_group[key]:
+                feedback_group[key].append(q)
+
+    return feedback_group
+
+
+def build_student_report(grade, round_name, round_data, name, score, rank, total, w_q_str, feedback_func):
+    feedback_group = group_feedback(round_data, parse_wrong_questions(w_q_str), feedback_func)
+    return create_report_html(grade, round_name, name, score, rank, total, feedback_group)
+
+
+# --------------------------------------------------
+# 회차 전체 성적표 ZIP
+# --------------------------------------------------
+def write_reports_zip(fileobj, jobs, render, max_workers=8, window=64):
+    """
+    jobs 의 각 항목을 render(job) -> (파일명, html) 로 만들어 fileobj 에 ZIP 으로 기록한다.
+    작업 스레드 여러 개가 성적표를 만들고, 동시에 메모리에 올라가는 성적표는 window 개로 제한한다.
+
+    return: 기록한 성적표 수
+    """
+    count = 0
+    used_names = set()
+    with zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED) as zf, \
+            ThreadPoolExecutor(max_workers=max_workers) as pool:
+        in_flight = deque()
+        for job in jobs:
+            in_flight.append(pool.submit(render, job))
+            if len(in_flight) >= window:
+                count += _write_entry(zf, in_flight.popleft().result(), used_names)
+        while in_flight:
+            count += _write_entry(zf, in_flight.popleft().result(), used_names)
+    return count
+
+
+def _write_entry(zf, rendered, used_names):
+    filename, html = rendered
+    # 동명이인 파일명 충돌 방지
+    base, ext = os.path.splitext(filename)
+    n = 2
+    while filename in used_names:
+        filename = f"{base}_{n}{ext}"
+        n += 1
+    used_names.add(filename)
+    zf.writestr(filename, html.encode("utf-8"))
+    return 1
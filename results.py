@@ -0,0 +1,638 @@
+import bisect
+import threading
+import time
+
+import pandas as pd
+from gspread.utils import rowcol_to_a1
+from pandas.api.types import union_categoricals
+
+from metrics import METRICS
+
+# --------------------------------------------------
+# 학생 결과 캐시 (워크시트 1개: Sheet1 또는 결과 샤드) - 새로 추가된 행만 이어 읽기
+# --------------------------------------------------
+TEXT_COLUMNS = ["Grade", "Round", "ID", "Name", "Wrong_Types", "Wrong_Questions", "AdminID", "Answers"]
+CATEGORY_COLUMNS = ["Grade", "Round", "AdminID"]     # 값 종류가 적은 컬럼은 category 로 보관
+
+
+def normalize_id(v):
+    # 학번 정규화: 숫자면 앞자리 0 제거 ("0123" -> "123"), 아니면 공백만 제거
+    try:
+        return str(int(str(v)))
+    except:
+        return str(v).strip()
+
+
+def normalize_id_series(ids):
+    # normalize_id 의 벡터화 버전 (행마다 try/except 를 돌지 않음)
+    # 보통의 숫자 학번만 정규식으로 처리하고, 나머지(전각 숫자 '１２', '1_000' 처럼 int() 가 받는 값 포함)는
+    # 종류별로 한 번씩 normalize_id 에 맡겨서 결과가 항상 같도록 함
+    s = ids.astype(str).str.strip()
+    parts = s.str.extract(r"^([+-]?)0*([0-9]+)$")
+    is_num = parts[1].notna()
+    negative = (parts[0] == "-") & (parts[1] != "0")
+    num = parts[1].where(~negative, "-" + parts[1])
+    if not is_num.all():
+        seen = {}
+        num[~is_num] = [seen[v] if v in seen else seen.setdefault(v, normalize_id(v)) for v in ids[~is_num]]
+    return num
+
+
+# 응시 일시 컬럼 (시트 헤더 이름이 달라도 찾을 수 있도록 후보 + 7번째 컬럼)
+TIME_COLUMNS = ["Date", "Timestamp", "Time", "응시일", "응시일시", "날짜"]
+TIME_POSITION = 6
+TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+
+def find_time_column(columns):
+    for c in TIME_COLUMNS:
+        if c in columns:
+            return c
+    columns = list(columns)
+    return columns[TIME_POSITION] if len(columns) > TIME_POSITION else None
+
+
+def prepare_results_frame(df):
+    # 문자열 컬럼 정리 + Score 정수화 + 학번 정규화 (모든 조회 화면이 같은 형태를 쓰도록)
+    time_col = find_time_column(df.columns)
+    for col in TEXT_COLUMNS:
+        if col not in df.columns:
+            df[col] = ""
+        df[col] = df[col].astype(str).str.strip()
+    for col in CATEGORY_COLUMNS:
+        df[col] = df[col].astype("category")
+    if "Score" not in df.columns:
+        df["Score"] = 0
+    df["Score"] = pd.to_numeric(df["Score"], errors="coerce").fillna(0).round().astype("int64")
+    df["ID_Clean"] = normalize_id_series(df["ID"])
+    if time_col is not None:
+        df["Submitted_At"] = pd.to_datetime(df[time_col], format=TIME_FORMAT, errors="coerce")
+    else:
+        df["Submitted_At"] = pd.NaT
+    return df
+
+
+def append_results_frame(df, new):
+    # category 컬럼은 카테고리를 합쳐서 이어 붙여야 dtype 이 유지됨 (그냥 concat 하면 문자열로 풀림)
+    out = pd.concat([df, new], ignore_index=True)
+    for col in CATEGORY_COLUMNS:
+        out[col] = union_categoricals([df[col], new[col]])
+    return out
+
+
+def plain_results_frame(df):
+    # 화면/차트로 넘길 때는 category 를 일반 문자열로 (altair 가 category 를 순서형으로 해석하지 않도록)
+    df = df.copy()
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(str)
+    return df
+
+
+class ScoreIndex:
+    """
+    (Grade, Round) 별 점수를 오름차순 리스트로 유지.
+    등수 = (내 점수보다 높은 점수 개수) + 1 을 이진 탐색으로 계산한다.
+    """
+
+    def __init__(self):
+        self._scores = {}
+
+    def build(self, df):
+        self._scores = {
+            key: sorted(group.tolist())
+            for key, group in df.groupby(["Grade", "Round"], sort=False, observed=True)["Score"]
+        }
+
+    def add(self, df):
+        for grade, round_name, score in zip(df["Grade"], df["Round"], df["Score"]):
+            bisect.insort(self._scores.setdefault((grade, round_name), []), score)
+
+    def remove(self, df):
+        # 덮어쓴 행의 예전 점수를 뺌
+        for grade, round_name, score in zip(df["Grade"], df["Round"], df["Score"]):
+            scores = self._scores.get((grade, round_name), [])
+            i = bisect.bisect_left(scores, score)
+            if i < len(scores) and scores[i] == score:
+                scores.pop(i)
+
+    def rank(self, grade, round_name, score, include_new=False):
+        """
+        return: (등수, 응시자 수, 상위 %)
+        include_new=True 이면 아직 시트에 반영되지 않은 점수 1개를 더해서 계산 (제출 직후 등수)
+        """
+        scores = self._scores.get((str(grade), str(round_name)), [])
+        higher = len(scores) - bisect.bisect_right(scores, score)
+        rank = higher + 1
+        total = len(scores) + (1 if include_new else 0)
+        pct = (rank / total) * 100 if total else 0.0
+        return rank, total, pct
+
+
+class StudentIndex:
+    """
+    (Grade, ID_Clean) / (Grade, Round, ID_Clean) -> 행 위치 리스트.
+    학생 조회를 전체 스캔 대신 dict 조회로 처리한다.
+    """
+
+    def __init__(self):
+        self._by_grade = {}
+        self._by_round = {}
+
+    def build(self, df):
+        self._by_grade = {}
+        self._by_round = {}
+        self.add(df, offset=0)
+
+    def add(self, df, offset):
+        cols = zip(df["Grade"], df["Round"], df["ID_Clean"])
+        for pos, (grade, round_name, sid) in enumerate(cols, start=offset):
+            self._by_grade.setdefault((grade, sid), []).append(pos)
+            self._by_round.setdefault((grade, round_name, sid), []).append(pos)
+
+    def positions(self, grade, sid, round_name=None):
+        if round_name is None:
+            return self._by_grade.get((grade, sid), [])
+        return self._by_round.get((grade, round_name, sid), [])
+
+
+class WeaknessTable:
+    """
+    (Grade, ID_Clean) 별 누적 오답 유형 집계.
+    {(Grade, ID_Clean): {Type: {AdminID: 횟수}}}  - Type 은 처음 등장한 순서대로 유지
+    (최종관리자는 모든 AdminID 합계, 일반 관리자는 자기 AdminID 만)
+    """
+
+    def __init__(self):
+        self._counts = {}
+
+    def build(self, df):
+        self._counts = {}
+        self.add(df)
+
+    @staticmethod
+    def _sizes(df):
+        wt = df[["Grade", "ID_Clean", "AdminID", "Wrong_Types"]].copy()
+        wt["Wrong_Types"] = wt["Wrong_Types"].str.split(" | ", regex=False)
+        wt = wt.explode("Wrong_Types")
+        wt = wt[wt["Wrong_Types"].notna() & (wt["Wrong_Types"] != "")]
+        return wt.groupby(["Grade", "ID_Clean", "Wrong_Types", "AdminID"], sort=False, observed=True).size()
+
+    def add(self, df):
+        for (grade, sid, t, admin), n in self._sizes(df).items():
+            per_admin = self._counts.setdefault((grade, sid), {}).setdefault(t, {})
+            per_admin[admin] = per_admin.get(admin, 0) + int(n)
+
+    def remove(self, df):
+        # 덮어쓴 행의 예전 오답 유형을 뺌 (0 이 되면 항목 삭제)
+        for (grade, sid, t, admin), n in self._sizes(df).items():
+            types = self._counts.get((grade, sid), {})
+            per_admin = types.get(t, {})
+            left = per_admin.get(admin, 0) - int(n)
+            if left > 0:
+                per_admin[admin] = left
+            else:
+                per_admin.pop(admin, None)
+                if not per_admin:
+                    types.pop(t, None)
+
+    def counts(self, grade, sid, admin_id=None):
+        # [(Type, 횟수), ...] 처음 등장한 순서대로
+        types = self._counts.get((grade, sid), {})
+        if admin_id is None:
+            counts = [(t, sum(per_admin.values())) for t, per_admin in types.items()]
+        else:
+            counts = [(t, per_admin.get(admin_id, 0)) for t, per_admin in types.items()]
+        return [(t, c) for t, c in counts if c > 0]
+
+    def most_common(self, grade, sid, admin_id=None):
+        # [(Type, 횟수), ...] 많은 순 (같으면 먼저 등장한 유형 먼저)
+        return sorted(self.counts(grade, sid, admin_id), key=lambda tc: -tc[1])
+
+
+class AdminOverview:
+    """
+    관리자별 입력 현황.
+    {(AdminID, Grade, ID, Name): [응시횟수, 마지막 응시 일시]}
+    """
+
+    def __init__(self):
+        self._rows = {}
+
+    def build(self, df):
+        self._rows = {}
+        self.add(df)
+
+    def add(self, df):
+        agg = df.groupby(["AdminID", "Grade", "ID", "Name"], sort=False, observed=True).agg(
+            n=("Score", "size"), last=("Submitted_At", "max")
+        )
+        for key, n, last in zip(agg.index, agg["n"], agg["last"]):
+            row = self._rows.get(key)
+            if row is None:
+                self._rows[key] = [int(n), last]
+            else:
+                row[0] += int(n)
+                if pd.notna(last) and (pd.isna(row[1]) or last > row[1]):
+                    row[1] = last
+
+    def remove(self, df):
+        # 덮어쓴 행만큼 응시횟수를 뺌 (마지막 응시 일시는 덮어쓴 새 행이 더 최근이므로 그대로)
+        counts = df.groupby(["AdminID", "Grade", "ID", "Name"], sort=False, observed=True).size()
+        for key, n in counts.items():
+            row = self._rows.get(key)
+            if row is None:
+                continue
+            row[0] -= int(n)
+            if row[0] <= 0:
+                del self._rows[key]
+
+    def admins(self):
+        return sorted({key[0] for key in self._rows})
+
+    def students(self, admin_id):
+        # 해당 관리자가 입력한 학생 목록 (Grade, ID 순)
+        rows = [
+            (grade, sid, name, n, last)
+            for (admin, grade, sid, name), (n, last) in self._rows.items()
+            if admin == admin_id
+        ]
+        view = pd.DataFrame(rows, columns=["Grade", "ID", "Name", "응시횟수", "마지막 응시"])
+        return view.sort_values(["Grade", "ID"], ignore_index=True)
+
+
+class ResultsCache:
+    """
+    결과 워크시트는 append-only 이므로 지금까지 읽은 행 수를 기억해 두고,
+    다음 동기화 때는 그 뒤쪽 범위만 읽어서 DataFrame 에 이어 붙인다.
+    (예외: 업서트 제출이 덮어쓴 행은 쓴 쪽이 replace_rows 로 캐시에 직접 반영)
+    snapshot 이 있으면 읽은 결과를 로컬 파일에도 저장해 두고, 재시작 시 거기서 이어 읽는다.
+
+    worksheet_getter: 결과 워크시트(Sheet1 / 샤드)를 돌려주는 함수
+    min_interval: 이 시간(초) 안에 다시 sync 하면 시트를 읽지 않고 캐시를 그대로 사용
+    snapshot: ResultsSnapshot (None 이면 로컬 저장 안 함)
+    save_interval: 새 행이 생겼을 때 스냅샷을 다시 쓰는 최소 간격(초)
+    start_row: 앞쪽 데이터 행 몇 개를 건너뛸지 (샤드로 옮긴 Sheet1 행 - 헤더 + 그 뒤 행만 읽음)
+    grid_rows: 워크시트 -> 지금 격자 행 수 (SheetsPool.grid_rows). 꼬리 읽기 전에 읽을 행이 격자 안에 있는지 확인
+    """
+
+    def __init__(self, worksheet_getter, min_interval=3.0, snapshot=None, save_interval=30.0, start_row=0,
+                 grid_rows=None):
+        self._worksheet_getter = worksheet_getter
+        self._min_interval = min_interval
+        self._snapshot = snapshot
+        self._save_interval = save_interval
+        self._start_row = start_row
+        self._grid_rows = grid_rows
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()     # 스냅샷 파일 쓰기 / 지우기 (self._lock 다음에만 잡음)
+        self._save_gen = 0                     # 스냅샷을 지울 때마다 증가 - 그 전에 잡아 둔 상태는 쓰지 않음
+        self._header = None
+        self._n_rows = 0          # 헤더 제외, 지금까지 읽은 데이터 행 수
+        self._last_row = None     # 마지막으로 읽은 행 원본 (스냅샷이 시트와 맞는지 확인용)
+        self._df = None
+        self._last_sync = 0.0
+        self._last_save = 0.0
+        self._unsaved = False
+        self._revision = 0        # replace_rows 로 덮어쓴 행 수
+        self._scores = ScoreIndex()
+        self._students = StudentIndex()
+        self._weakness = WeaknessTable()
+        self._admins = AdminOverview()
+        self._derived_stale = False   # 스냅샷 복원 직후 - 오답 유형 / 관리자 표는 처음 조회할 때 만듦
+
+    @property
+    def version(self):
+        # 읽은 행 수 + 덮어쓴 횟수 (행이 추가되거나 덮어써질 때마다 커짐)
+        return self._n_rows + self._revision
+
+    @property
+    def header(self):
+        return list(self._header or [])
+
+    @property
+    def loaded(self):
+        # 한 번이라도 읽었는지 (등수 / 조회를 시트 읽기 없이 바로 할 수 있는지)
+        return self._df is not None
+
+    def _pad(self, rows):
+        width = len(self._header)
+        return [[str(v) for v in (list(r) + [""] * width)[:width]] for r in rows]
+
+    def _full_load(self, ws):
+        values = ws.get_all_values()
+        self._header = [str(h).strip() for h in values[0]] if values else []
+        rows = self._pad(values[1:] if values else [])
+        self._n_rows = len(rows)
+        self._last_row = rows[-1] if rows else None
+        return rows
+
+    def _skip_load(self, ws):
+        # 헤더만 읽고 start_row 다음부터 이어 읽음
+        values = ws.get("1:1")
+        self._header = [str(h).strip() for h in values[0]] if values else []
+        self._n_rows = self._start_row
+        self._last_row = None
+        return self._tail_load(ws) if self._header else []
+
+    def _has_room(self, ws):
+        """
+        다음에 읽을 행이 시트 격자 안에 있는지. (격자를 넘는 범위를 읽으면 Sheets API 가 400)
+        핸들의 row_count(연 시점 값 - 격자는 줄지 않음) 안이면 바로 True, 넘으면 메타데이터로 다시 확인
+        """
+        row = self._n_rows + 2
+        if row <= (getattr(ws, "row_count", 0) or 0):
+            return True
+        if self._grid_rows is None:
+            return True
+        count = self._grid_rows(ws)
+        return count is None or row <= count
+
+    def _tail_load(self, ws):
+        # 마지막으로 읽은 행 바로 다음부터 끝까지 한 번에 읽음 (새 행이 없으면 빈 리스트)
+        if not self._has_room(ws):
+            return []
+        start = rowcol_to_a1(self._n_rows + 2, 1)
+        end_col = rowcol_to_a1(1, len(self._header)).rstrip("0123456789")
+        rows = self._pad(ws.get(f"{start}:{end_col}"))
+        self._n_rows += len(rows)
+        if rows:
+            self._last_row = rows[-1]
+        return rows
+
+    def _to_frame(self, rows):
+        return prepare_results_frame(pd.DataFrame(rows, columns=self._header))
+
+    def _build_indexes(self, derived=True):
+        self._scores.build(self._df)
+        self._students.build(self._df)
+        if derived:
+            self._build_derived()
+        else:
+            self._derived_stale = True
+
+    def _build_derived(self):
+        self._weakness.build(self._df)
+        self._admins.build(self._df)
+        self._derived_stale = False
+
+    def _derived(self):
+        # 오답 유형 / 관리자 표 조회 전에 호출 (self._lock 안에서)
+        if self._derived_stale:
+            self._build_derived()
+
+    def _append(self, rows):
+        new = self._to_frame(rows)
+        offset = len(self._df)
+        self._df = append_results_frame(self._df, new)
+        self._scores.add(new)
+        self._students.add(new, offset)
+        if not self._derived_stale:
+            self._weakness.add(new)
+            self._admins.add(new)
+
+    def _restore(self, ws):
+        """
+        로컬 스냅샷에서 복원하고 그 뒤에 추가된 행만 시트에서 읽는다.
+        스냅샷의 마지막 행부터 읽어서 시트의 같은 행과 비교 -> 다르면(행 삭제/수정) False (전체 다시 읽기)
+        """
+        loaded = self._snapshot.load() if self._snapshot is not None else None
+        if loaded is None:
+            return False
+        header, n_rows, last_row, df = loaded
+        if n_rows == 0:
+            return False
+
+        start = rowcol_to_a1(n_rows + 1, 1)
+        end_col = rowcol_to_a1(1, len(header)).rstrip("0123456789")
+        self._header = header
+        rows = self._pad(ws.get(f"{start}:{end_col}"))
+        if not rows or rows[0] != last_row:
+            self._header = None
+            return False
+
+        self._df = df
+        self._n_rows = n_rows
+        self._last_row = last_row
+        # 등수 / 학생 조회용 인덱스만 바로 만들고 오답 유형 표(가장 오래 걸림)는 필요할 때 만듦
+        self._build_indexes(derived=False)
+        if len(rows) > 1:
+            self._append(rows[1:])
+            self._n_rows += len(rows) - 1
+            self._last_row = rows[-1]
+            self._unsaved = True
+        return True
+
+    def _save_state(self, now, force=False):
+        """
+        스냅샷에 쓸 상태를 잡아 둔다. (self._lock 안에서) 쓸 필요가 없으면 None
+        파일 쓰기는 _write_snapshot 이 lock 밖에서 - DataFrame 은 바꿀 때마다 새 객체로 교체하므로 그대로 넘김
+        """
+        if self._snapshot is None or not (self._unsaved or force):
+            return None
+        if not force and now - self._last_save < self._save_interval:
+            return None
+        self._last_save = now
+        self._unsaved = False
+        return self._save_gen, list(self._header), self._n_rows, self._last_row, self._df
+
+    def _write_snapshot(self, state):
+        gen, header, n_rows, last_row, df = state
+        with self._save_lock:
+            if gen != self._save_gen:
+                return            # 그 사이 덮어쓰기 / reset 으로 지워진 스냅샷 - 다음 sync 때 다시 저장
+            try:
+                self._snapshot.save(header, n_rows, last_row, df)
+                return
+            except OSError:
+                pass              # 디스크 문제는 무시 (다음 재시작 때 시트에서 다시 받으면 됨)
+        with self._lock:
+            self._unsaved = True
+
+    def _clear_snapshot(self):
+        # self._lock 안에서 호출 - 쓰는 중인 스냅샷이 있으면 끝난 뒤 지움
+        if self._snapshot is None:
+            return
+        with self._save_lock:
+            self._save_gen += 1
+            self._snapshot.clear()
+
+    def sync(self, force=False):
+        """새로 추가된 행을 반영한 DataFrame 을 돌려준다. (반환값은 읽기 전용으로 사용)"""
+        with self._lock:
+            now = time.monotonic()
+            if self._df is not None and not force and now - self._last_sync < self._min_interval:
+                METRICS.cache("results", hit=True)
+                return self._df
+            METRICS.cache("results", hit=False)
+
+            ws = self._worksheet_getter()
+            if self._df is None or not self._header:
+                if self._start_row:
+                    self._df = self._to_frame(self._skip_load(ws))
+                    self._build_indexes()
+                elif not self._restore(ws):
+                    self._df = self._to_frame(self._full_load(ws))
+                    self._build_indexes()
+                    self._unsaved = True
+                state = self._save_state(now, force=True)
+            else:
+                rows = self._tail_load(ws)
+                if rows:
+                    self._append(rows)
+                    self._unsaved = True
+                state = self._save_state(now)
+
+            self._last_sync = now
+            df = self._df
+
+        # 스냅샷 파일은 lock 밖에서 씀 (그동안 다른 세션의 조회 / 등수 계산이 기다리지 않도록)
+        if state is not None:
+            self._write_snapshot(state)
+        return df
+
+    def extend_header(self, header):
+        """
+        시트 헤더 뒤에 컬럼이 추가된 경우 (예: 처음 쓸 때 채운 Answers) - 이후 읽는 행은 그 컬럼까지 읽음.
+        이미 읽은 행은 빈 값으로 둔다. 앞쪽이 지금 헤더와 다르면 무시.
+        """
+        with self._lock:
+            width = len(self._header or [])
+            if self._df is None or len(header) <= width or list(header[:width]) != self._header:
+                return
+            added = [h for h in header[width:] if h not in self._df.columns]
+            if added:
+                self._df = self._df.assign(**{h: "" for h in added})
+            self._header = list(header)
+            if self._last_row is not None:
+                self._last_row = self._pad([self._last_row])[0]
+            self._unsaved = True
+
+    def find(self, grade, round_name, student_id, admin_id):
+        """
+        (Grade, Round, 학번, AdminID) 의 마지막 기록 -> (시트 행 번호, 행 원본 값), 없으면 None. (마지막 sync 기준)
+        업서트 제출이 덮어쓸 행을 찾을 때 사용한다. (학번은 관리자마다 따로 매기므로 다른 관리자의 행은 찾지 않음)
+        """
+        with self._lock:
+            if self._df is None:
+                return None
+            pos = self._students.positions(str(grade), normalize_id(student_id), str(round_name))
+            admins = self._df["AdminID"]
+            pos = [p for p in pos if admins.iat[p] == str(admin_id).strip()]
+            if not pos:
+                return None
+            row = self._df.iloc[pos[-1]]
+            return self._start_row + pos[-1] + 2, [str(row[h]) for h in self._header]
+
+    def replace_rows(self, updates):
+        """
+        업서트로 시트 행을 덮어쓴 뒤 캐시에도 반영한다. (시트를 다시 읽지 않음)
+        updates: [(시트 행 번호, 새 행), ...] - 같은 (Grade, Round, 학번) 행을 덮어쓰는 경우만
+        (학생 인덱스의 위치는 그대로 둔다)
+        """
+        with self._lock:
+            if self._df is None:
+                return
+            updates = [(r - self._start_row - 2, row) for r, row in updates]
+            updates = [(pos, row) for pos, row in updates if 0 <= pos < len(self._df)]
+            if not updates:
+                return
+            positions = [pos for pos, _ in updates]
+            padded = self._pad([row for _, row in updates])
+            new = self._to_frame(padded)
+            old = self._df.iloc[positions]
+            self._scores.remove(old)
+            if not self._derived_stale:
+                self._weakness.remove(old)
+                self._admins.remove(old)
+
+            # 이미 sync 로 받아 간 DataFrame 은 그대로 두고 복사본을 고쳐서 바꿔 끼움
+            df = self._df.copy()
+            for col in new.columns:
+                values = new[col]
+                if isinstance(df[col].dtype, pd.CategoricalDtype):
+                    missing = pd.Index(values.unique()).difference(df[col].cat.categories)
+                    if len(missing):
+                        df[col] = df[col].cat.add_categories(missing)
+                df.loc[positions, col] = values.to_numpy()
+            self._df = df
+
+            self._scores.add(new)
+            if not self._derived_stale:
+                self._weakness.add(new)
+                self._admins.add(new)
+            self._revision += len(updates)
+            if len(df) - 1 in positions:
+                self._last_row = padded[positions.index(len(df) - 1)]
+            # 스냅샷은 마지막 행만 비교하므로 덮어쓴 행이 반영되기 전까지 지워 둠 (다음 sync 때 다시 저장)
+            self._clear_snapshot()
+            self._unsaved = True
+            self._last_save = 0.0
+
+    def rank(self, grade, round_name, score, include_new=False):
+        # 마지막 sync 기준 등수 (시트를 다시 읽지 않음)
+        with self._lock:
+            return self._scores.rank(grade, round_name, score, include_new=include_new)
+
+    def lookup(self, grade, student_id, round_name=None):
+        """
+        해당 학년(+회차) 학생의 기록을 시트에 쌓인 순서대로 돌려준다. (마지막 sync 기준)
+        student_id 는 입력값 그대로 넘기면 normalize_id 로 정규화한다.
+        """
+        with self._lock:
+            if self._df is None:
+                return pd.DataFrame(columns=TEXT_COLUMNS + ["Score", "ID_Clean"])
+            rn = None if round_name is None else str(round_name)
+            pos = self._students.positions(str(grade), normalize_id(student_id), rn)
+            return plain_results_frame(self._df.iloc[pos])
+
+    def weak_types(self, grade, student_id, admin_id=None):
+        """
+        학생의 누적 오답 유형 [(Type, 횟수), ...] 많은 순. (마지막 sync 기준)
+        admin_id 를 주면 그 관리자가 입력한 기록만 센다.
+        """
+        with self._lock:
+            self._derived()
+            return self._weakness.most_common(str(grade), normalize_id(student_id), admin_id)
+
+    def weak_type_counts(self, grade, student_id, admin_id=None):
+        """weak_types 와 같지만 정렬 전 (처음 등장한 순서) - 여러 캐시를 합칠 때 사용"""
+        with self._lock:
+            self._derived()
+            return self._weakness.counts(str(grade), normalize_id(student_id), admin_id)
+
+    def admin_ids(self):
+        with self._lock:
+            self._derived()
+            return self._admins.admins()
+
+    def admin_students(self, admin_id):
+        """관리자별 입력 현황 표 (Grade, ID, Name, 응시횟수, 마지막 응시)"""
+        with self._lock:
+            self._derived()
+            return self._admins.students(admin_id)
+
+    def round_frame(self, grade, round_name):
+        """해당 학년·회차 응시 기록 (학생별 마지막 제출 1행씩, 마지막 sync 기준)"""
+        with self._lock:
+            if self._df is None:
+                return pd.DataFrame(columns=TEXT_COLUMNS + ["Score", "ID_Clean"])
+            df = self._df
+        rows = df[(df["Grade"] == str(grade)) & (df["Round"] == str(round_name))]
+        return plain_results_frame(rows.drop_duplicates("ID_Clean", keep="last"))
+
+    def reset(self):
+        # 시트에서 행을 지우거나 고친 경우 다음 sync 때 전체를 다시 읽음 (로컬 스냅샷도 삭제)
+        with self._lock:
+            self._clear_snapshot()
+            self._header = None
+            self._n_rows = 0
+            self._last_row = None
+            self._df = None
+            self._unsaved = False
+            self._scores = ScoreIndex()
+            self._students = StudentIndex()
+            self._weakness = WeaknessTable()
+            self._admins = AdminOverview()
+            self._derived_stale = False
+
@@ -0,0 +1,540 @@
+import logging
+import threading
+import time
+from datetime import datetime
+
+import gspread
+import pandas as pd
+import streamlit as st
+from gspread.utils import rowcol_to_a1
+
+from results import ResultsCache, find_time_column, normalize_id
+from sheets import get_pool
+from snapshot import ResultsSnapshot, snapshot_path
+from submissions import RESULT_HEADER
+
+logger = logging.getLogger(__name__)
+
+# --------------------------------------------------
+# 결과 샤딩 - 학년·학년도별 워크시트 (예: 결과_고 2학년_2026)
+# --------------------------------------------------
+# 분리(migrate_legacy) 전: 쓰기·읽기 모두 Sheet1 (기존 방식 그대로)
+# 분리 후: 새 제출은 학년·학년도 샤드에 쓰고, 조회는 그 학년의 샤드만 읽는다.
+#          Sheet1 은 분리 때 옮긴 행 다음부터(분리 중에 들어온 행)만 호환용으로 이어 읽는다.
+SHARD_PREFIX = "결과_"
+META_SHEET = "결과_메타"           # key / value - migrated_rows: 샤드로 옮긴 Sheet1 데이터 행 수
+HISTORY_SHEET = "결과_응시이력"     # 업서트로 덮어쓴 이전 응시 기록 (+ Replaced_At)
+SCHOOL_YEAR_START_MONTH = 3        # 3월부터 새 학년도 (1·2월은 전년도)
+MIGRATE_CHUNK = 5000               # 분리할 때 append_rows 1회에 보낼 행 수
+DATE_POSITION = 6                  # build_result_row 의 응시일시 위치
+
+# 제출 저장 방식
+#   "upsert": 같은 (Grade, Round, 학번, AdminID) 기록이 있으면 그 행을 덮어씀 -> 시트에는 학생·회차당 1행
+#   "append": 제출할 때마다 새 행 (예전 방식)
+SUBMISSION_MODE = "upsert"
+KEEP_ATTEMPTS = True               # 업서트로 덮어쓴 이전 기록을 HISTORY_SHEET 에 남길지
+
+
+def academic_year(date_text, default=None):
+    """'2026-02-10 09:00' -> 2025 (3월 전이면 전년도). 날짜를 못 읽으면 default(없으면 올해 학년도)"""
+    try:
+        d = datetime.strptime(str(date_text).strip()[:10], "%Y-%m-%d")
+    except ValueError:
+        d = None
+    if d is None:
+        if default is not None:
+            return default
+        d = datetime.now()
+    return d.year if d.month >= SCHOOL_YEAR_START_MONTH else d.year - 1
+
+
+def shard_title(grade, year):
+    return f"{SHARD_PREFIX}{str(grade).strip()}_{int(year)}"
+
+
+def with_result_columns(header):
+    # 헤더 뒤에 빠진 결과 컬럼(예: 옛 Sheet1 의 Answers)을 붙임 - 앞쪽 이름은 시트 그대로
+    return list(header) + RESULT_HEADER[len(header):]
+
+
+def parse_shard_title(title):
+    """'결과_고 2학년_2026' -> ('고 2학년', 2026), 샤드 이름이 아니면 None"""
+    if not title.startswith(SHARD_PREFIX) or title in (META_SHEET, HISTORY_SHEET):
+        return None
+    grade, _, year = title[len(SHARD_PREFIX):].rpartition("_")
+    if not grade or not year.isdigit():
+        return None
+    return grade, int(year)
+
+
+class ShardRouter:
+    """
+    어떤 워크시트에 쓰고 어떤 워크시트를 읽을지 정한다. (프로세스 전체 공유)
+
+    - 워크시트 목록과 결과_메타(분리 여부)는 ttl 마다 한 번만 다시 읽는다.
+      (다른 서버 프로세스가 분리했거나 새 학년도 샤드를 만든 경우도 ttl 안에 반영)
+    - 이 프로세스에서 만든 샤드는 바로 목록에 추가한다.
+    """
+
+    def __init__(self, pool, ttl=60.0):
+        self._pool = pool
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._sheets = set()         # 스프레드시트의 모든 워크시트 이름
+        self._titles = None          # {샤드 이름: (학년, 학년도)}
+        self._migrated_rows = None   # None = 아직 분리 전 (Sheet1 사용)
+        self._loaded_at = 0.0
+        self._header = None
+        self._headers = {}           # 결과 워크시트 이름(None = Sheet1) -> 컬럼을 확인한 헤더
+
+    def _load(self):
+        titles = [ws.title for ws in self._pool.spreadsheet().worksheets()]
+        migrated = None
+        if META_SHEET in titles:
+            meta = {
+                str(r[0]).strip(): str(r[1]).strip()
+                for r in self._pool.worksheet(META_SHEET).get_all_values() if len(r) >= 2
+            }
+            if meta.get("migrated_rows", "").isdigit():
+                migrated = int(meta["migrated_rows"])
+        self._sheets = set(titles)
+        self._titles = {t: parsed for t in titles if (parsed := parse_shard_title(t))}
+        self._migrated_rows = migrated
+        self._loaded_at = time.monotonic()
+
+    def _ensure_loaded(self):
+        with self._lock:
+            if self._titles is not None and time.monotonic() - self._loaded_at < self._ttl:
+                return
+            try:
+                self._load()
+            except Exception:
+                if self._titles is None:
+                    raise
+                # 다시 읽기 실패 -> 이전 목록으로 계속 (ttl 뒤에 다시 시도)
+                logger.exception("샤드 목록 새로고침 실패 - 이전 목록 사용")
+                self._loaded_at = time.monotonic()
+
+    def refresh(self):
+        with self._lock:
+            self._load()
+
+    @property
+    def migrated_rows(self):
+        """샤드로 옮긴 Sheet1 데이터 행 수 (분리 전이면 None)"""
+        self._ensure_loaded()
+        return self._migrated_rows
+
+    @property
+    def sharded(self):
+        return self.migrated_rows is not None
+
+    def titles(self, grade=None):
+        """존재하는 샤드 이름 (학년 -> 학년도 순)"""
+        self._ensure_loaded()
+        with self._lock:
+            items = list(self._titles.items())
+        return [t for t, (g, y) in sorted(items, key=lambda kv: kv[1]) if grade is None or g == str(grade)]
+
+    def route(self, row):
+        """제출 행 -> 쓸 샤드 이름 (분리 전이면 None = Sheet1)"""
+        if not self.sharded:
+            return None
+        return shard_title(row[0], academic_year(row[DATE_POSITION] if len(row) > DATE_POSITION else ""))
+
+    def legacy_header(self):
+        if self._header is None:
+            values = self._pool.sheet1().get("1:1")
+            self._header = [str(h).strip() for h in values[0]] if values else []
+        return self._header
+
+    def ensure_columns(self, title, ws):
+        """
+        결과 워크시트 헤더 뒤에 빠진 컬럼(예: Answers)이 있으면 채우고 헤더를 돌려준다.
+        (워크시트마다 프로세스당 한 번만 읽음 - 옛 Sheet1 은 백필 전까지 Answers 헤더가 없음)
+        """
+        with self._lock:
+            if title in self._headers:
+                return self._headers[title]
+        values = ws.get("1:1")
+        header = [str(h).strip() for h in values[0]] if values else []
+        full = with_result_columns(header)
+        if len(full) > len(header):
+            ws.update(range_name=rowcol_to_a1(1, len(header) + 1), values=[full[len(header):]])
+        with self._lock:
+            self._headers[title] = full
+            if title is None:
+                self._header = full
+        return full
+
+    def ensure(self, title, header=None):
+        """샤드 워크시트를 돌려준다. 없으면 헤더 1행짜리로 만든다."""
+        self._ensure_loaded()
+        with self._lock:
+            exists = title in self._sheets
+        if not exists:
+            header = header or with_result_columns(self.legacy_header())
+            try:
+                ws = self._pool.spreadsheet().add_worksheet(title, rows=1, cols=max(len(header), 1))
+                ws.update(range_name="A1", values=[header])
+            except gspread.exceptions.APIError:
+                # 다른 프로세스가 먼저 만든 경우 - 목록을 다시 읽고 그 시트를 사용
+                self.refresh()
+                if title not in self._sheets:
+                    raise
+            with self._lock:
+                self._sheets.add(title)
+                parsed = parse_shard_title(title)
+                if parsed:
+                    self._titles[title] = parsed
+        return self._pool.worksheet(title)
+
+
+def _result_worksheet(pool, router, results, title):
+    # 쓸 워크시트 + 헤더 컬럼 확인 (헤더를 늘렸으면 이 프로세스의 캐시도 그 컬럼까지 읽도록)
+    ws = pool.sheet1() if title is None else router.ensure(title)
+    header = router.ensure_columns(title, ws)
+    cache = results.cache_for(title) if results is not None else None
+    if cache is not None:
+        cache.extend_header(header)
+    return ws, cache
+
+
+def write_result_rows(pool, router, rows, results=None):
+    # 제출 대기열 writer - 같은 샤드로 가는 행만 모아서 넘어옴 (SubmissionQueue key=router.route)
+    ws, _ = _result_worksheet(pool, router, results, router.route(rows[0]))
+    ws.append_rows(rows)
+
+
+def result_key(row, grade_idx=0, round_idx=1, id_idx=2, admin_idx=8):
+    # 업서트 키 (Grade, Round, 정규화 학번, AdminID) - 학번은 관리자마다 따로 매기므로 관리자까지 같아야 같은 학생
+    admin = str(row[admin_idx]).strip() if admin_idx is not None and admin_idx < len(row) else ""
+    return str(row[grade_idx]).strip(), str(row[round_idx]).strip(), normalize_id(row[id_idx]), admin
+
+
+def _history_rows(rows, width):
+    # 응시이력 시트 행: 결과 헤더 폭에 맞춘 원본 + 옮긴 시각
+    stamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+    return [(list(r) + [""] * width)[:width] + [stamp] for r in rows]
+
+
+def upsert_result_rows(pool, router, results, rows, keep_attempts=KEEP_ATTEMPTS):
+    """
+    제출 대기열 writer (업서트) - 같은 (Grade, Round, 학번, AdminID) 기록이 이미 있으면 그 행을 덮어쓰고 없으면 추가.
+    같은 묶음에 같은 학생이 여러 번 있으면 마지막 제출만 시트에 남긴다.
+    keep_attempts: 덮어쓴 이전 기록을 응시이력 시트에 먼저 추가 (덮어쓰기가 실패해도 기록이 남도록)
+    시트 호출: 새 행 확인(꼬리 읽기) 1회 + 응시이력 append 1회 + 덮어쓰기 batch_update 1회 + 추가 append 1회
+    """
+    ws, cache = _result_worksheet(pool, router, results, router.route(rows[0]))
+    # 다른 세션 / 프로세스가 방금 추가한 행까지 키 인덱스에 반영 (새로 추가된 행만 읽음)
+    cache.sync(force=True)
+
+    attempts = {}                # 키 -> 이 묶음의 제출들 (마지막 것만 시트에 씀)
+    for row in rows:
+        attempts.setdefault(result_key(row), []).append(row)
+
+    # 캐시의 행 원본은 헤더 폭이므로 비교도 헤더 폭으로 (헤더에 없는 컬럼은 읽어 올 수 없음)
+    width = len(cache.header)
+    updates = []
+    appends = []
+    replaced = []
+    for key, key_rows in attempts.items():
+        row = key_rows[-1]
+        found = cache.find(*key)
+        if found is None:
+            appends.append(row)
+        elif found[1] != ([str(v) for v in row] + [""] * width)[:width]:
+            updates.append((found[0], row))
+            replaced.append(found[1])
+        else:
+            continue                 # 재시도 - 이미 덮어쓴 행 (이전 기록도 이미 응시이력에 있음)
+        replaced += key_rows[:-1]
+
+    header = cache.header
+    if keep_attempts and replaced:
+        history = router.ensure(HISTORY_SHEET, header + ["Replaced_At"])
+        history.append_rows(_history_rows(replaced, len(header)))
+    if updates:
+        ws.batch_update([
+            {"range": f"A{r}:{rowcol_to_a1(r, len(row))}", "values": [list(row)]} for r, row in updates
+        ])
+        cache.replace_rows(updates)
+    if appends:
+        ws.append_rows(appends)
+
+
+def migrate_legacy(pool, router, dedupe=None):
+    """
+    Sheet1 의 기존 기록을 학년·학년도 샤드로 나눠 옮기고, 결과_메타에 옮긴 행 수를 기록한다.
+    분리 전에는 샤드에 새 제출이 쓰이지 않으므로, 중간에 실패해도 다시 실행하면 샤드를 비우고 처음부터 다시 쓴다.
+    dedupe: 샤드에는 (Grade, Round, 학번, AdminID) 마지막 기록만 옮기고 이전 기록은 응시이력 시트로
+            (기본: 업서트 모드면 True, Sheet1 원본은 그대로 남음)
+    Grade 가 빈 행은 어느 학년 화면에서도 읽지 않으므로 옮기지 않고 행 번호만 돌려준다. (Sheet1 에는 그대로 남음)
+    return: ({샤드 이름(+ 응시이력): 옮긴 행 수}, [건너뛴 Sheet1 행 번호])
+    """
+    if dedupe is None:
+        dedupe = SUBMISSION_MODE == "upsert"
+    router.refresh()
+    if router.sharded:
+        raise ValueError(f"이미 분리되었습니다. (옮긴 행 {router.migrated_rows}개)")
+
+    values = pool.sheet1().get_all_values()
+    header = [str(h).strip() for h in values[0]] if values else []
+    rows = values[1:] if values else []
+    if not header:
+        raise ValueError("Sheet1 에 헤더가 없습니다.")
+    header = with_result_columns(header)     # 샤드는 Answers 컬럼까지 갖춘 헤더로 시작
+
+    g_idx = header.index("Grade") if "Grade" in header else 0
+    r_idx = header.index("Round") if "Round" in header else 1
+    i_idx = header.index("ID") if "ID" in header else 2
+    a_idx = header.index("AdminID") if "AdminID" in header else None
+    time_col = find_time_column(header)
+    t_idx = header.index(time_col) if time_col is not None else None
+
+    groups = {}
+    skipped = []
+    for n, row in enumerate(rows, start=2):
+        row = list(row) + [""] * (len(header) - len(row))
+        if not str(row[g_idx]).strip():
+            skipped.append(n)
+            continue
+        date = row[t_idx] if t_idx is not None else ""
+        groups.setdefault(shard_title(row[g_idx], academic_year(date)), []).append(row)
+
+    earlier = []
+    if dedupe:
+        for title, shard_rows in groups.items():
+            last = {result_key(row, g_idx, r_idx, i_idx, a_idx): i for i, row in enumerate(shard_rows)}
+            keep = set(last.values())
+            earlier += [row for i, row in enumerate(shard_rows) if i not in keep]
+            groups[title] = [row for i, row in enumerate(shard_rows) if i in keep]
+
+    for title, shard_rows in groups.items():
+        ws = router.ensure(title, header)
+        ws.clear()
+        ws.update(range_name="A1", values=[header])
+        for i in range(0, len(shard_rows), MIGRATE_CHUNK):
+            ws.append_rows(shard_rows[i:i + MIGRATE_CHUNK])
+
+    # 응시이력은 지우지 않고 이어 씀 (분리 전 업서트가 남긴 기록이 있을 수 있음 - 다시 실행하면 중복될 수 있음)
+    if earlier:
+        history = router.ensure(HISTORY_SHEET, header + ["Replaced_At"])
+        stamped = _history_rows(earlier, len(header))
+        for i in range(0, len(stamped), MIGRATE_CHUNK):
+            history.append_rows(stamped[i:i + MIGRATE_CHUNK])
+
+    # 마지막에 메타를 써야 읽기·쓰기가 샤드로 넘어감 (그 사이 Sheet1 에 들어온 행은 호환 경로로 읽힘)
+    meta = router.ensure(META_SHEET, ["key", "value"])
+    meta.update(range_name="A1", values=[
+        ["key", "value"],
+        ["migrated_rows", str(len(rows))],
+        ["migrated_at", datetime.now().strftime("%Y-%m-%d %H:%M")],
+    ])
+    router.refresh()
+    moved = {title: len(shard_rows) for title, shard_rows in groups.items()}
+    if earlier:
+        moved[HISTORY_SHEET] = len(earlier)
+    return moved, skipped
+
+
+# --------------------------------------------------
+# 샤드 묶음 결과 캐시 - 조회한 학년의 샤드만 읽는다
+# --------------------------------------------------
+class ShardedResults:
+    """
+    ResultsCache 와 같은 조회 API. 샤드마다 ResultsCache(+ 스냅샷) 1개, Sheet1 호환용 1개.
+
+    sync(grade): 그 학년의 샤드와 Sheet1(분리 뒤에는 옮긴 행 다음부터)만 새 행을 읽는다.
+    grade 없이 sync() 하면 전체 (관리자별 입력 현황처럼 학년을 가리지 않는 화면용).
+    snapshots: False 이면 로컬 스냅샷을 쓰지 않음 (벤치마크용)
+    """
+
+    def __init__(self, pool, router, min_interval=3.0, snapshots=True):
+        self._pool = pool
+        self._router = router
+        self._min_interval = min_interval
+        self._snapshots = snapshots
+        self._lock = threading.Lock()
+        self._shards = {}            # 샤드 이름 -> ResultsCache
+        self._legacy = None
+        self._legacy_start = None
+
+    def _legacy_cache(self):
+        # 분리 여부가 바뀌면(다른 프로세스가 분리) Sheet1 캐시를 새로 만듦
+        start = self._router.migrated_rows
+        if self._legacy is None or start != self._legacy_start:
+            if start is None:
+                snapshot = ResultsSnapshot() if self._snapshots else None
+                self._legacy = ResultsCache(
+                    self._pool.sheet1, self._min_interval, snapshot=snapshot, grid_rows=self._pool.grid_rows
+                )
+            else:
+                # 옮긴 행은 샤드에 있으므로 읽지 않음 (헤더 + 분리 뒤에 들어온 행만)
+                if self._snapshots:
+                    ResultsSnapshot().clear()
+                self._legacy = ResultsCache(
+                    self._pool.sheet1, self._min_interval, start_row=start, grid_rows=self._pool.grid_rows
+                )
+            self._legacy_start = start
+        return self._legacy
+
+    def _shard_cache(self, title):
+        cache = self._shards.get(title)
+        if cache is None:
+            snapshot = ResultsSnapshot(snapshot_path(title)) if self._snapshots else None
+            cache = ResultsCache(
+                lambda: self._pool.worksheet(title), self._min_interval, snapshot=snapshot,
+                grid_rows=self._pool.grid_rows,
+            )
+            self._shards[title] = cache
+        return cache
+
+    def cache_for(self, title):
+        """워크시트 하나의 캐시 (title None = Sheet1) - 업서트 writer 용"""
+        with self._lock:
+            return self._legacy_cache() if title is None else self._shard_cache(title)
+
+    def _sources(self, grade=None):
+        with self._lock:
+            caches = [self._shard_cache(t) for t in self._router.titles(grade)]
+            caches.append(self._legacy_cache())
+        return caches
+
+    def worksheets(self):
+        """모든 결과 워크시트 (Sheet1 + 샤드) - 백필 등 시트 전체 작업용"""
+        return [self._pool.sheet1()] + [self._pool.worksheet(t) for t in self._router.titles()]
+
+    @property
+    def version(self):
+        # 샤드별 버전(읽은 행 수 + 덮어쓴 횟수)의 합
+        with self._lock:
+            caches = list(self._shards.values()) + ([self._legacy] if self._legacy else [])
+        return sum(c.version for c in caches)
+
+    @property
+    def header(self):
+        for c in self._sources():
+            if c.header:
+                return c.header
+        return []
+
+    def sync(self, grade=None, force=False):
+        for c in self._sources(grade):
+            c.sync(force=force)
+
+    def loaded(self, grade=None):
+        """그 학년의 샤드(+ Sheet1)를 모두 한 번 이상 읽었는지 - 읽지 않고 등수를 낼 수 있는지"""
+        return all(c.loaded for c in self._sources(grade))
+
+    def rank(self, grade, round_name, score, include_new=False, student_id=None, admin_id=None):
+        """
+        샤드별 (내 점수보다 높은 수, 응시자 수) 를 더함.
+        include_new + student_id: 업서트 제출 직후 - 그 학생(같은 admin_id 가 입력한 기록)의 이전 점수 대신 방금 점수로 계산
+        """
+        higher = total = 0
+        for c in self._sources(grade):
+            r, t, _ = c.rank(grade, round_name, score)
+            higher += r - 1
+            total += t
+        if include_new:
+            total += 1
+            prev = self.lookup(grade, student_id, round_name) if student_id is not None else None
+            if prev is not None:
+                prev = prev[prev["AdminID"] == str(admin_id or "").strip()]
+            if prev is not None and not prev.empty:
+                total -= 1
+                higher -= int(prev.iloc[-1]["Score"]) > score
+        rank = higher + 1
+        pct = (rank / total) * 100 if total else 0.0
+        return rank, total, pct
+
+    @staticmethod
+    def _merge(frames):
+        # 여러 샤드의 기록을 응시 일시 순으로 (같은 시각이면 샤드 순서 유지)
+        frames = [f for f in frames if not f.empty]
+        if not frames:
+            return None
+        if len(frames) == 1:
+            return frames[0]
+        df = pd.concat(frames, ignore_index=True)
+        return df.sort_values("Submitted_At", kind="stable", na_position="first", ignore_index=True)
+
+    def lookup(self, grade, student_id, round_name=None):
+        frames = [c.lookup(grade, student_id, round_name) for c in self._sources(grade)]
+        merged = self._merge(frames)
+        return frames[0] if merged is None else merged
+
+    def round_frame(self, grade, round_name):
+        frames = [c.round_frame(grade, round_name) for c in self._sources(grade)]
+        merged = self._merge(frames)
+        if merged is None:
+            return frames[0]
+        return merged.drop_duplicates("ID_Clean", keep="last")
+
+    def weak_types(self, grade, student_id, admin_id=None):
+        # 샤드 순서(학년도 순 -> Sheet1) 대로 합쳐서 '먼저 등장한 유형 먼저' 를 유지
+        counts = {}
+        for c in self._sources(grade):
+            for t, n in c.weak_type_counts(grade, student_id, admin_id):
+                counts[t] = counts.get(t, 0) + n
+        return sorted(counts.items(), key=lambda tc: -tc[1])
+
+    def admin_ids(self):
+        return sorted({a for c in self._sources() for a in c.admin_ids()})
+
+    def admin_students(self, admin_id):
+        frames = [c.admin_students(admin_id) for c in self._sources()]
+        non_empty = [f for f in frames if not f.empty]
+        if len(non_empty) <= 1:
+            return non_empty[0] if non_empty else frames[0]
+        view = pd.concat(non_empty, ignore_index=True).groupby(["Grade", "ID", "Name"], as_index=False).agg(
+            **{"응시횟수": ("응시횟수", "sum"), "마지막 응시": ("마지막 응시", "max")}
+        )
+        return view.sort_values(["Grade", "ID"], ignore_index=True)
+
+    def reset(self):
+        # 분리 / 백필 뒤: 목록과 분리 여부를 다시 읽고, 모든 캐시와 스냅샷을 버림
+        with self._lock:
+            for c in self._shards.values():
+                c.reset()
+            if self._legacy is not None:
+                self._legacy.reset()
+            self._shards = {}
+            self._legacy = None
+            self._legacy_start = None
+        self._router.refresh()
+
+
+@st.cache_resource
+def get_shard_router():
+    """모든 세션이 공유하는 샤드 라우터. 서비스 계정 정보가 없으면 None."""
+    pool = get_pool()
+    if pool is None:
+        return None
+    return ShardRouter(pool)
+
+
+@st.cache_resource
+def get_results_cache():
+    """모든 세션이 공유하는 결과 캐시 (샤드별). 서비스 계정 정보가 없으면 None."""
+    router = get_shard_router()
+    if router is None:
+        return None
+    return ShardedResults(get_pool(), router)
+
+
+if __name__ == "__main__":
+    # python shards.py migrate  - .streamlit/secrets.toml 의 서비스 계정으로 Sheet1 을 샤드로 분리
+    import sys
+
+    if sys.argv[1:] != ["migrate"]:
+        sys.exit("usage: python shards.py migrate")
+    pool = get_pool()
+    if pool is None:
+        sys.exit("서비스 계정 정보(gcp_service_account)가 없습니다.")
+    moved, skipped = migrate_legacy(pool, ShardRouter(pool))
+    for title, n in moved.items():
+        print(f"{title}: {n}행")
+    if skipped:
+        print(f"Grade 가 비어 옮기지 않은 Sheet1 행 {len(skipped)}개: {', '.join(map(str, skipped))}")
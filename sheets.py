@@ -0,0 +1,191 @@
+import functools
+import threading
+
+import streamlit as st
+
+from gateway import SheetsGateway
+from metrics import METRICS
+
+# --------------------------------------------------
+# 구글 시트 연결 계층 (프로세스 전체 공유)
+# --------------------------------------------------
+SCOPE = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
+SPREADSHEET_NAME = "ExamResults"
+
+
+# 토큰 갱신 실패 예외 - google-auth(RefreshError) / oauth2client(AccessTokenRefreshError, HttpAccessTokenRefreshError)
+# 인증 라이브러리는 실제로 연결할 때 처음 import 하므로 클래스 대신 이름으로 (하위 클래스 포함) 확인
+AUTH_ERROR_NAMES = {"RefreshError", "AccessTokenRefreshError", "HttpAccessTokenRefreshError"}
+
+
+def is_auth_error(e):
+    # 401 / 토큰 갱신 실패 (키가 폐기·교체된 경우 등) - 다시 연결해야 하는 오류
+    status = getattr(getattr(e, "response", None), "status_code", None)
+    return status == 401 or any(c.__name__ in AUTH_ERROR_NAMES for c in type(e).__mro__)
+
+
+class GatedWorksheet:
+    """
+    gspread 워크시트를 감싸서 공개 메서드 호출(= API 호출)을 모두 SheetsGateway 로 보낸다.
+    (쿼터 속도 제한 / 같은 읽기 합치기 / METRICS 기록)
+
+    gateway: call(name, target, fn, *args, **kwargs) 를 가진 객체 (SheetsPool - 인증 오류 처리 후 SheetsGateway 로 넘김)
+    """
+
+    def __init__(self, target, gateway):
+        self._target = target
+        self._gateway = gateway
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if name.startswith("_") or not callable(attr):
+            return attr                    # title / row_count 등 속성은 그대로
+
+        @functools.wraps(attr)
+        def call(*args, **kwargs):
+            return self._wrap(name, self._gateway.call(name, self._title(), attr, *args, **kwargs))
+        return call
+
+    def _title(self):
+        return getattr(self._target, "title", "")
+
+    def _wrap(self, name, value):
+        return value
+
+
+class GatedSpreadsheet(GatedWorksheet):
+    """Spreadsheet 용 - 돌려주는 워크시트도 GatedWorksheet 로 감싼다"""
+
+    _RETURNS_WORKSHEET = {"worksheet", "add_worksheet", "get_worksheet", "duplicate_sheet"}
+
+    @property
+    def sheet1(self):
+        return self._wrap("sheet1", self._gateway.call("sheet1", "", lambda: self._target.sheet1))
+
+    def _title(self):
+        return ""
+
+    def _wrap(self, name, value):
+        if name == "worksheets":
+            return [GatedWorksheet(ws, self._gateway) for ws in value]
+        if name == "sheet1" or name in self._RETURNS_WORKSHEET:
+            return GatedWorksheet(value, self._gateway)
+        return value
+
+
+class SheetsPool:
+    """
+    인증된 client 1개 + 열린 Spreadsheet 1개 + 워크시트 핸들 캐시.
+    모든 Streamlit 세션이 같은 객체를 공유한다. 액세스 토큰 갱신은 gspread(google-auth 세션)가 알아서 하고,
+    그래도 인증 오류(401 / 토큰 갱신 실패)가 나면 연결을 버려서 다음 접근 때 다시 연결한다.
+
+    client_factory: 인증된 gspread client 를 돌려주는 함수 (테스트/벤치마크에서는 가짜 client)
+    gateway: 모든 API 호출이 거쳐 갈 SheetsGateway (없으면 기본 쿼터로 새로 만듦)
+    """
+
+    def __init__(self, client_factory, spreadsheet_name=SPREADSHEET_NAME, gateway=None):
+        self._client_factory = client_factory
+        self._spreadsheet_name = spreadsheet_name
+        self._gateway = gateway or SheetsGateway()
+        self._lock = threading.Lock()              # 핸들 캐시만 보호 (API 호출 / 쿼터 대기는 lock 밖에서)
+        self._connect_lock = threading.Lock()      # 동시에 처음 접근해도 연결은 한 번만
+        self._client = None
+        self._spreadsheet = None
+        self._worksheets = {}
+
+    def call(self, name, target, fn, *args, **kwargs):
+        # GatedWorksheet / GatedSpreadsheet 의 모든 호출 - 인증 오류면 연결을 버리고 그대로 올려 보냄
+        try:
+            return self._gateway.call(name, target, fn, *args, **kwargs)
+        except Exception as e:
+            if is_auth_error(e):
+                self.invalidate()
+            raise
+
+    def _connect(self):
+        with METRICS.sheets_call("authorize"):
+            client = self._client_factory()
+        ss = self.call("open", self._spreadsheet_name, client.open, self._spreadsheet_name)
+        return client, GatedSpreadsheet(ss, self)
+
+    def invalidate(self):
+        # 인증 오류가 난 뒤 호출 - 다음 접근 때 다시 연결
+        with self._lock:
+            self._client = None
+            self._spreadsheet = None
+            self._worksheets = {}
+
+    def spreadsheet(self):
+        ss = self._spreadsheet
+        if ss is not None:
+            return ss
+        with self._connect_lock:
+            ss = self._spreadsheet
+            if ss is None:
+                client, ss = self._connect()
+                with self._lock:
+                    self._client = client
+                    self._spreadsheet = ss
+                    self._worksheets = {}
+            return ss
+
+    def _cached_worksheet(self, ss, key, open_fn):
+        # 핸들은 lock 밖에서 열고 (쿼터 대기 포함), 동시에 연 경우 먼저 넣은 쪽을 씀
+        with self._lock:
+            ws = self._worksheets.get(key)
+        if ws is not None:
+            return ws
+        ws = open_fn()
+        with self._lock:
+            if self._spreadsheet is not ss:
+                return ws         # 그 사이 invalidate 됨 - 버려진 연결의 핸들은 캐시하지 않음
+            return self._worksheets.setdefault(key, ws)
+
+    def worksheet(self, name):
+        # 없는 시트는 gspread.WorksheetNotFound 를 그대로 올려 보냄 (캐시하지 않음)
+        ss = self.spreadsheet()
+        return self._cached_worksheet(ss, name, lambda: ss.worksheet(name))
+
+    def grid_rows(self, ws):
+        """
+        워크시트 격자 행 수를 시트 메타데이터에서 새로 읽는다. (핸들의 row_count 는 연 시점 값)
+        읽은 값은 핸들에도 반영해서 다음 확인은 호출 없이 끝나도록 한다. 못 찾으면 None.
+        """
+        meta = self.spreadsheet().fetch_sheet_metadata(
+            {"fields": "sheets.properties(sheetId,gridProperties.rowCount)"}
+        )
+        for sheet in meta.get("sheets", []):
+            props = sheet.get("properties", {})
+            if props.get("sheetId") == ws.id:
+                n = props.get("gridProperties", {}).get("rowCount")
+                if n is not None:
+                    ws._properties.setdefault("gridProperties", {})["rowCount"] = n
+                return n
+        return None
+
+    def sheet1(self):
+        ss = self.spreadsheet()
+        return self._cached_worksheet(ss, 0, lambda: ss.sheet1)
+
+
+def sheet_range(title, a1=None):
+    # 공백이 들어간 시트 이름도 A1 표기에 쓸 수 있도록 따옴표 처리
+    quoted = "'" + str(title).replace("'", "''") + "'"
+    return f"{quoted}!{a1}" if a1 else quoted
+
+
+def _service_account_pool(info):
+    # gspread / oauth2client 는 실제로 연결할 때 처음 import (로그인 화면은 이 모듈들 없이 뜸)
+    import gspread
+    from oauth2client.service_account import ServiceAccountCredentials
+
+    creds = ServiceAccountCredentials.from_json_keyfile_dict(info, SCOPE)
+    return SheetsPool(lambda: gspread.authorize(creds))
+
+
+@st.cache_resource
+def get_pool():
+    """모든 세션이 공유하는 SheetsPool. 서비스 계정 정보가 없으면 None."""
+    if "gcp_service_account" not in st.secrets:
+        return None
+    return _service_account_pool(dict(st.secrets["gcp_service_account"]))
@@ -0,0 +1,80 @@
+import json
+import os
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from config import LOCAL_DIR
+
+# --------------------------------------------------
+# Sheet1 로컬 스냅샷 (Arrow IPC 파일, 컬럼형 + 타입 지정)
+# --------------------------------------------------
+# 프로세스가 재시작돼도 전체 기록을 다시 받지 않도록 ResultsCache 의 DataFrame 을 그대로 저장한다.
+# Arrow IPC 파일은 memory-map 으로 열 수 있어서 JSON/CSV 파싱 없이 바로 DataFrame 으로 복원된다.
+SNAPSHOT_PATH = os.path.join(LOCAL_DIR, "results_snapshot.arrow")
+FORMAT_VERSION = "1"
+
+_META_VERSION = b"exam.version"
+_META_HEADER = b"exam.header"
+_META_N_ROWS = b"exam.n_rows"
+_META_LAST_ROW = b"exam.last_row"
+
+
+def snapshot_path(title):
+    # 결과 샤드(워크시트)별 스냅샷 파일 - 공백 / 경로 문자만 바꿔서 시트 이름을 그대로 씀
+    safe = "".join("_" if c in ' /\\:' else c for c in str(title))
+    return os.path.join(LOCAL_DIR, f"results_snapshot_{safe}.arrow")
+
+
+class ResultsSnapshot:
+    """
+    save(): DataFrame + (시트 헤더, 읽은 행 수, 마지막 행 원본) 을 원자적으로 저장
+    load(): 저장된 스냅샷을 memory-map 으로 읽어서 (header, n_rows, last_row, df) 반환, 없으면 None
+    """
+
+    def __init__(self, path=SNAPSHOT_PATH):
+        self.path = path
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return None
+        try:
+            source = pa.memory_map(self.path, "r")
+            table = ipc.open_file(source).read_all()
+            meta = table.schema.metadata or {}
+            if meta.get(_META_VERSION) != FORMAT_VERSION.encode():
+                return None
+            header = json.loads(meta[_META_HEADER])
+            n_rows = int(meta[_META_N_ROWS])
+            last_row = json.loads(meta[_META_LAST_ROW])
+            df = table.to_pandas()
+        except (OSError, KeyError, ValueError, pa.ArrowException):
+            # 쓰다 만 파일 / 형식이 바뀐 파일은 무시하고 시트에서 다시 받음
+            return None
+        if len(df) != n_rows or any(h not in df.columns for h in header):
+            return None
+        return header, n_rows, last_row, df
+
+    def save(self, header, n_rows, last_row, df):
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        meta = dict(table.schema.metadata or {})
+        meta.update({
+            _META_VERSION: FORMAT_VERSION.encode(),
+            _META_HEADER: json.dumps(header, ensure_ascii=False).encode("utf-8"),
+            _META_N_ROWS: str(n_rows).encode(),
+            _META_LAST_ROW: json.dumps(last_row, ensure_ascii=False).encode("utf-8"),
+        })
+        table = table.replace_schema_metadata(meta)
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with pa.OSFile(tmp, "wb") as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp, self.path)
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,312 @@
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from datetime import datetime
+
+import streamlit as st
+
+from config import LOCAL_DIR
+from sheets import get_pool
+
+# --------------------------------------------------
+# 제출 대기열 (write-behind) - 모아서 한 번에 저장
+# --------------------------------------------------
+JOURNAL_PATH = os.path.join(LOCAL_DIR, "submission_queue.jsonl")
+
+QUEUED = "queued"
+RETRYING = "retrying"          # 재시도 가능한 오류(429 / 5xx)가 이어져 잠시 쉬는 중 - 대기열에 그대로 남음
+WRITTEN = "written"
+FAILED = "failed"              # 시트가 거부한 행 - 저널에 보관, 관리자가 다시 시도하거나 삭제할 때까지 유지
+DISCARDED = "discarded"
+
+STATUS_LABELS = {
+    QUEUED: "⏳ 저장 대기",
+    RETRYING: "🔁 재시도 대기",
+    WRITTEN: "✅ 저장 완료",
+    FAILED: "❌ 저장 실패 (관리자 확인 필요)",
+    DISCARDED: "🗑️ 삭제됨",
+}
+
+
+# 결과 시트 헤더 (build_result_row 순서) - 옛 Sheet1 은 Answers 가 없을 수 있어 처음 쓸 때 뒤에 채움
+RESULT_HEADER = ["Grade", "Round", "ID", "Name", "Score", "Wrong_Types", "Date", "Wrong_Questions", "AdminID", "Answers"]
+
+
+def build_result_row(grade, round_name, sid, name, total_score, wrong_types, wrong_q_nums, admin_id, answer_vector=""):
+    # Sheet1 한 행: Grade, Round, ID, Name, Score, Wrong_Types, 응시일시, Wrong_Questions, AdminID, Answers
+    wrong_q = [str(q) for q in wrong_q_nums]
+    return [
+        grade,
+        round_name,
+        sid,
+        name,
+        int(total_score),
+        " | ".join(wrong_types),
+        datetime.now().strftime("%Y-%m-%d %H:%M"),
+        ", ".join(wrong_q) if wrong_q else "없음",
+        admin_id,
+        answer_vector
+    ]
+
+
+def is_retryable(e):
+    # 429(쿼터 초과) / 5xx / 네트워크 오류는 재시도, 나머지 4xx 는 바로 실패 처리
+    response = getattr(e, "response", None)
+    code = getattr(response, "status_code", None)
+    if code is None:
+        return not isinstance(e, (ValueError, TypeError))
+    return code == 429 or code >= 500
+
+
+class SubmissionQueue:
+    """
+    제출 행을 로컬 저널(JSONL)에 먼저 기록하고 바로 돌아온 뒤,
+    백그라운드 스레드가 flush_interval 동안 모인 행을 writer(rows) 한 번으로 저장한다.
+    프로세스가 재시작되면 저널에 남은 미저장 행을 다시 대기열에 넣는다.
+
+    - 429 / 5xx 가 max_retries 번 이어지면 묶음을 대기열에 그대로 두고 max_delay 동안 쉰 뒤 다시 시도
+    - 시트가 거부한 행(그 밖의 4xx)은 FAILED 로 저널에 보관 -> retry_failed / discard_failed (관리자) 전까지 유지
+
+    writer: 행 리스트를 시트에 쓰는 함수 (기본은 결과 샤드 / Sheet1 에 업서트, shards.SUBMISSION_MODE)
+    key: 행 -> 저장할 워크시트 이름 (같은 key 인 행만 한 번에 writer 로 넘김, None 이면 전부 한 묶음)
+    """
+
+    def __init__(self, writer, journal_path=JOURNAL_PATH, batch_size=200,
+                 flush_interval=10.0, max_retries=6, base_delay=1.0, max_delay=60.0, key=None):
+        self._writer = writer
+        self._key = key
+        self._journal_path = journal_path
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+
+        self._cond = threading.Condition()
+        self._pending = []            # [(submission_id, row), ...]
+        self._failed = {}             # submission_id -> row (저장 실패로 보관 중)
+        self._status = {}             # submission_id -> QUEUED / RETRYING / WRITTEN / FAILED / DISCARDED
+        self._errors = {}             # submission_id -> 오류 메시지
+        self._flush_deadline = None   # 지금 모으는 묶음을 저장할 시각 (대기열이 비면 None)
+        self._not_before = 0.0        # 재시도 가능한 오류가 이어진 뒤 다음 저장을 시도할 시각
+
+        self._replay_journal()
+        self._worker = threading.Thread(target=self._run, name="submission-queue", daemon=True)
+        self._worker.start()
+
+    # ---------- 저널 ----------
+    def _journal_append(self, records):
+        os.makedirs(os.path.dirname(self._journal_path), exist_ok=True)
+        with open(self._journal_path, "a", encoding="utf-8") as f:
+            for rec in records:
+                f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _replay_journal(self):
+        if not os.path.exists(self._journal_path):
+            return
+        rows = {}
+        order = []
+        with open(self._journal_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue          # 마지막 줄이 쓰다 만 상태일 수 있음
+                sid = rec.get("id")
+                status = rec.get("status")
+                if "row" in rec:
+                    rows[sid] = rec["row"]
+                    order.append(sid)
+                    self._status[sid] = QUEUED
+                elif status in (WRITTEN, DISCARDED):
+                    rows.pop(sid, None)
+                elif status in (FAILED, QUEUED) and sid in rows:
+                    self._status[sid] = status
+                    if status == FAILED:
+                        self._errors[sid] = rec.get("error", "")
+
+        for sid in order:
+            if sid not in rows:
+                self._status.pop(sid, None)
+            elif self._status[sid] == FAILED:
+                self._failed[sid] = rows[sid]
+            else:
+                self._pending.append((sid, rows[sid]))
+
+        # 미저장 / 실패 보관 행만 남기고 저널 압축
+        tmp = self._journal_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for sid in order:
+                if sid not in rows:
+                    continue
+                f.write(json.dumps({"id": sid, "row": rows[sid]}, ensure_ascii=False) + "\n")
+                if sid in self._failed:
+                    rec = {"id": sid, "status": FAILED, "error": self._errors.get(sid, "")}
+                    f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        os.replace(tmp, self._journal_path)
+
+    # ---------- 외부 API ----------
+    def submit(self, row):
+        """행을 대기열에 넣고 submission_id 를 바로 돌려준다."""
+        sid = uuid.uuid4().hex
+        with self._cond:
+            self._journal_append([{"id": sid, "row": row}])
+            self._pending.append((sid, row))
+            self._status[sid] = QUEUED
+            self._cond.notify()
+        return sid
+
+    def submit_many(self, rows):
+        """여러 행을 한꺼번에 대기열에 넣는다. (batch_size 이하면 append_rows 1회로 저장)"""
+        sids = [uuid.uuid4().hex for _ in rows]
+        with self._cond:
+            self._journal_append([{"id": sid, "row": row} for sid, row in zip(sids, rows)])
+            self._pending.extend(zip(sids, rows))
+            for sid in sids:
+                self._status[sid] = QUEUED
+            self._cond.notify()
+        return sids
+
+    def status(self, sid):
+        return self._status.get(sid)
+
+    def error(self, sid):
+        return self._errors.get(sid)
+
+    def pending_count(self):
+        with self._cond:
+            return len(self._pending)
+
+    def failed(self):
+        """저장에 실패해 보관 중인 행 [(submission_id, row, 오류), ...]"""
+        with self._cond:
+            return [(sid, row, self._errors.get(sid, "")) for sid, row in self._failed.items()]
+
+    def retry_failed(self, sids=None):
+        """보관 중인 실패 행(sids 없으면 전부)을 대기열 맨 앞에 다시 넣는다. return: 다시 넣은 행 수"""
+        with self._cond:
+            items = [(sid, self._failed.pop(sid)) for sid in list(sids or self._failed) if sid in self._failed]
+            if items:
+                self._journal_append([{"id": sid, "status": QUEUED} for sid, _ in items])
+                # 실패한 행이 같은 학생의 더 나중 제출보다 늦게 저장되지 않도록 앞쪽에
+                self._pending[:0] = items
+                for sid, _ in items:
+                    self._status[sid] = QUEUED
+                    self._errors.pop(sid, None)
+                self._cond.notify()
+            return len(items)
+
+    def discard_failed(self, sids=None):
+        """보관 중인 실패 행(sids 없으면 전부)을 버린다. (관리자가 확인한 뒤에만) return: 버린 행 수"""
+        with self._cond:
+            done = [sid for sid in list(sids or self._failed) if self._failed.pop(sid, None) is not None]
+            if done:
+                self._journal_append([{"id": sid, "status": DISCARDED} for sid in done])
+                for sid in done:
+                    self._status[sid] = DISCARDED
+            return len(done)
+
+    # ---------- 백그라운드 저장 ----------
+    def _take_batch(self):
+        with self._cond:
+            while not self._pending:
+                self._cond.wait()
+            # 재시도 가능한 오류가 이어졌으면 쉬었다가 (그동안 submit 은 그대로 받음)
+            while (cooldown := self._not_before - time.monotonic()) > 0:
+                self._cond.wait(cooldown)
+            # 첫 행이 들어온 뒤 잠시 기다려서 같이 제출된 행을 한 번에 모음
+            # (워크시트별로 나눠 쓰는 동안에는 남은 묶음을 다시 기다리지 않음)
+            if self._flush_deadline is None:
+                self._flush_deadline = time.monotonic() + self._flush_interval
+            while len(self._pending) < self._batch_size:
+                remaining = self._flush_deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            pending = list(self._pending)   # 행을 빼는 곳은 이 스레드(_finish)뿐이라 복사본으로 충분
+        if self._key is None:
+            return pending[:self._batch_size]
+        # 첫 행과 같은 워크시트로 가는 행만 (append_rows 1회 = 워크시트 1개)
+        # key(라우터)는 시트를 읽거나 쿼터를 기다릴 수 있으므로 잠금 밖에서 - 그동안 submit() 이 막히지 않도록
+        try:
+            first = self._key(pending[0][1])
+            batch = [item for item in pending if self._key(item[1]) == first]
+        except Exception:
+            batch = pending[:1]         # 저장할 곳을 못 정하면 1행만 - writer 쪽에서 재시도
+        return batch[:self._batch_size]
+
+    def _finish(self, batch, status, error=None):
+        with self._cond:
+            done = {sid for sid, _ in batch}
+            self._pending = [item for item in self._pending if item[0] not in done]
+            if not self._pending:
+                self._flush_deadline = None
+            self._not_before = 0.0
+            for sid, row in batch:
+                self._status[sid] = status
+                if status == FAILED:
+                    self._failed[sid] = row
+                    self._errors[sid] = error
+                else:
+                    self._errors.pop(sid, None)
+            self._journal_append([
+                {"id": sid, "status": status, **({"error": error} if status == FAILED else {})} for sid in done
+            ])
+
+    def _defer(self, batch, error):
+        # 429 / 5xx 가 이어짐 - 행은 대기열(저널)에 그대로 두고 max_delay 뒤에 다시 시도
+        with self._cond:
+            self._not_before = time.monotonic() + self._max_delay
+            for sid, _ in batch:
+                self._status[sid] = RETRYING
+                self._errors[sid] = error
+
+    def _write_with_backoff(self, rows):
+        """return: (오류 메시지, 재시도 가능 여부) - 성공하면 (None, False)"""
+        attempt = 0
+        while True:
+            try:
+                self._writer(rows)
+                return None, False
+            except Exception as e:
+                attempt += 1
+                if not is_retryable(e):
+                    return str(e), False
+                if attempt > self._max_retries:
+                    return str(e), True
+                delay = min(self._max_delay, self._base_delay * (2 ** (attempt - 1)))
+                time.sleep(delay * (0.5 + random.random() / 2))
+
+    def _run(self):
+        while True:
+            batch = self._take_batch()
+            error, retryable = self._write_with_backoff([row for _, row in batch])
+            if error is None:
+                self._finish(batch, WRITTEN)
+            elif retryable:
+                self._defer(batch, error)
+            else:
+                self._finish(batch, FAILED, error)
+
+
+@st.cache_resource
+def get_submission_queue():
+    """모든 세션이 공유하는 제출 대기열. 서비스 계정 정보가 없으면 None."""
+    pool = get_pool()
+    if pool is None:
+        return None
+    # shards 가 이 모듈(RESULT_HEADER)을 import 하므로 순환을 피해 여기서 import
+    from shards import SUBMISSION_MODE, get_results_cache, get_shard_router, upsert_result_rows, write_result_rows
+
+    router = get_shard_router()
+    results = get_results_cache()
+    if SUBMISSION_MODE == "upsert":
+        writer = lambda rows: upsert_result_rows(pool, router, results, rows)
+    else:
+        writer = lambda rows: write_result_rows(pool, router, rows, results)
+    return SubmissionQueue(writer, key=router.route)
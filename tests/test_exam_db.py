@@ -0,0 +1,47 @@
+from benchmarks.fake_gspread import FakeBackend, FakeSpreadsheet
+from benchmarks.synthetic import make_answer_values
+from exam_db import ExamDBCache, answer_sheet_name, fetch_answer_values
+
+
+def make_spreadsheet(grades):
+    values = make_answer_values(n_rounds=2)
+    backend = FakeBackend()
+    sheets = {"Sheet1": [["Grade"]]}
+    sheets.update({answer_sheet_name(g): values[g] for g in grades})
+    return backend, FakeSpreadsheet(backend, sheets), values
+
+
+def test_fetch_uses_one_listing_and_one_batch_read():
+    grades = ["중 1학년", "고 2학년", "고 3학년"]
+    backend, ss, values = make_spreadsheet(grades)
+
+    out = fetch_answer_values(ss)
+
+    assert out == {g: values[g] for g in grades}
+    assert backend.calls == {"worksheets": 1, "values_batch_get": 1}
+
+
+def test_missing_grades_are_skipped():
+    backend, ss, _ = make_spreadsheet(["고 1학년"])
+
+    out = fetch_answer_values(ss)
+
+    assert list(out) == ["고 1학년"]
+    assert backend.calls["values_batch_get"] == 1
+
+
+def test_no_answer_sheets_skips_batch_read():
+    backend, ss, _ = make_spreadsheet([])
+
+    assert fetch_answer_values(ss) == {}
+    assert backend.calls == {"worksheets": 1}
+
+
+def test_cache_parses_fetched_grades():
+    backend, ss, values = make_spreadsheet(["중 2학년"])
+
+    db = ExamDBCache(lambda: ss).get()
+
+    assert list(db) == ["중 2학년"]
+    first_round = values["중 2학년"][1][0]
+    assert db["중 2학년"][first_round][1]["ans"] == int(values["중 2학년"][1][2])
@@ -0,0 +1,79 @@
+from feedback import FeedbackEngine, load_feedback_data
+
+BY_TYPE, RULES, FALLBACK = load_feedback_data()
+
+
+def rule_message(*any_of):
+    # 카탈로그에서 any_of 가 정확히 일치하는 일반 규칙 메시지
+    return next(r["message"] for r in RULES if tuple(r["any_of"]) == any_of)
+
+
+def test_exact_type_uses_only_specific_message():
+    # 전용 피드백이 있으면 '화법' 일반 규칙 / 기본 메시지는 붙지 않음
+    engine = FeedbackEngine()
+    t = "화법(강연-말하기 전략)"
+    assert engine.messages(t) == [BY_TYPE[t]]
+
+
+def test_specific_message_suppresses_keyword_rules():
+    # 옛 조건문은 use_general=False 여도 '인문' 규칙이 같이 나왔음
+    engine = FeedbackEngine()
+    t = "비문학-인문/철학(흄·데카르트-진리관 비교)"
+    assert engine.messages(t) == [BY_TYPE[t]]
+    assert rule_message("철학", "인문") not in engine.messages(t)
+
+
+def test_type_is_stripped_before_lookup():
+    engine = FeedbackEngine()
+    t = "화법(강연-말하기 전략)"
+    assert engine.messages(f"  {t} ") == [BY_TYPE[t]]
+
+
+def test_general_rules_when_no_specific_message():
+    engine = FeedbackEngine()
+    assert engine.messages("문법-문장 확장(새 유형)") == [rule_message("문법", "문장")]
+
+
+def test_none_of_excludes_rule():
+    # '문법' 이 들어 있어도 '음운' 이 있으면 문장 뼈대 규칙 대신 음운 규칙만
+    engine = FeedbackEngine()
+    assert engine.messages("문법-음운(새 유형)") == [rule_message("음운")]
+
+
+def test_all_matching_rules_in_rule_order():
+    engine = FeedbackEngine()
+    msgs = engine.messages("비문학-사회/인문 융합(보기 적용)")
+    assert msgs == [rule_message("철학", "인문"), rule_message("경제", "사회"), rule_message("보기")]
+    assert FALLBACK not in msgs
+
+
+def test_fallback_when_nothing_matches():
+    engine = FeedbackEngine()
+    assert engine.messages("알 수 없는 유형") == [FALLBACK]
+    assert engine.messages("") == [FALLBACK]
+
+
+def test_precomputed_table_matches_lazy_resolution():
+    types = list(BY_TYPE) + ["문법-문장 확장(새 유형)", "알 수 없는 유형"]
+    lazy = FeedbackEngine()
+    warm = FeedbackEngine()
+    warm.precompute(types)
+    for t in types:
+        assert warm.messages(t) == lazy.messages(t)
+
+
+def test_returned_list_does_not_change_table():
+    engine = FeedbackEngine()
+    engine.messages("알 수 없는 유형").append("x")
+    assert engine.messages("알 수 없는 유형") == [FALLBACK]
+
+
+def test_custom_rules():
+    engine = FeedbackEngine(
+        by_type={"A": "전용"},
+        rules=[{"any_of": ["k"], "none_of": ["x"], "message": "일반"}],
+        fallback="기본",
+    )
+    assert engine.messages("A") == ["전용"]
+    assert engine.messages("kk") == ["일반"]
+    assert engine.messages("kx") == ["기본"]
@@ -0,0 +1,40 @@
+import metrics
+from metrics import EXPIRED, Metrics
+
+
+class FakeCtx:
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.fragment_ids_this_run = []
+
+
+def run_in_session(monkeypatch, m, session_id, cache_name="results", hit=True):
+    # 세션 하나의 스크립트 실행 - 탭 기록 + 캐시 조회 1회
+    monkeypatch.setattr(metrics, "get_script_run_ctx", lambda suppress_warning=False: FakeCtx(session_id))
+    m.begin_rerun(tab="탭")
+    m.cache(cache_name, hit=hit)
+    m.end_rerun()
+
+
+def test_session_tables_are_bounded(monkeypatch):
+    m = Metrics(max_sessions=3)
+    for i in range(10):
+        run_in_session(monkeypatch, m, f"s{i}")
+
+    assert list(m._tabs) == ["s7", "s8", "s9"]
+    assert list(m._cache) == ["s7", "s8", "s9"]
+    # 정리한 세션의 집계는 전체 통계에 그대로 남음
+    assert m.cache_stats() == [{"name": "results", "hit": 10, "miss": 0, "hit_rate": 1.0}]
+    assert m.cache_stats("s9")[0]["hit"] == 1
+    assert {s for s, _ in m._snapshot()[2]} == {"s7", "s8", "s9", EXPIRED}
+
+
+def test_active_session_is_kept(monkeypatch):
+    m = Metrics(max_sessions=2)
+    run_in_session(monkeypatch, m, "old")
+    run_in_session(monkeypatch, m, "a")
+    run_in_session(monkeypatch, m, "old", hit=False)
+    run_in_session(monkeypatch, m, "b")
+
+    assert list(m._cache) == ["old", "b"]
+    assert m.cache_stats("old")[0]["miss"] == 1
@@ -0,0 +1,21 @@
+import pandas as pd
+
+from results import normalize_id, normalize_id_series
+
+IDS = [
+    "0123", "123", " 12 ", "+5", "-0", "-007", "00", "0",
+    "１２", "٣", "1_000", "1__0", "_1", "12a", "abc", "", " ", "김 철수",
+    "1.0", "1e3", "nan", None, 42,
+]
+
+
+def test_series_matches_scalar():
+    s = pd.Series(IDS, dtype=object)
+    assert normalize_id_series(s).tolist() == [normalize_id(v) for v in IDS]
+
+
+def test_series_keeps_index():
+    s = pd.Series(["0123", "１２"], index=[7, 3])
+    out = normalize_id_series(s)
+    assert out.index.tolist() == [7, 3]
+    assert out.tolist() == ["123", "12"]
@@ -0,0 +1,194 @@
+from benchmarks.fake_gspread import FakeBackend, FakeSpreadsheet, make_pool
+from shards import HISTORY_SHEET, ShardedResults, ShardRouter, migrate_legacy, upsert_result_rows
+from submissions import RESULT_HEADER
+
+DATE = "2025-05-01 10:00"
+
+
+def result_row(sid, name, score, admin, grade="고 1학년", round_name="1회", date=DATE):
+    return [grade, round_name, sid, name, str(score), "", date, "없음", admin, ""]
+
+
+def make_env(rows):
+    backend = FakeBackend()
+    ss = FakeSpreadsheet(backend, {"Sheet1": [RESULT_HEADER] + rows})
+    pool = make_pool(ss)
+    router = ShardRouter(pool)
+    results = ShardedResults(pool, router, min_interval=0, snapshots=False)
+    return ss, pool, router, results
+
+
+def sheet_rows(ss, title="Sheet1"):
+    return ss._sheets[title]._rows[1:] if title in ss._sheets else []
+
+
+def test_same_id_from_another_admin_is_appended():
+    # 관리자마다 학번을 따로 매김 - 다른 관리자의 같은 학번 행을 덮어쓰면 안 됨
+    theirs = result_row("100001", "학생1-1", 70, "teacher2")
+    ss, pool, router, results = make_env([theirs])
+    results.sync("고 1학년")
+
+    mine = result_row("100001", "홍길동", 90, "admin")
+    upsert_result_rows(pool, router, results, [mine])
+
+    assert sheet_rows(ss) == [theirs, mine]
+    assert sheet_rows(ss, HISTORY_SHEET) == []
+    results.sync("고 1학년", force=True)
+    assert results.lookup("고 1학년", "100001")["Name"].tolist() == ["학생1-1", "홍길동"]
+
+
+def test_resubmit_overwrites_only_own_row():
+    theirs = result_row("100001", "학생1-1", 70, "teacher2")
+    mine = result_row("100001", "홍길동", 90, "admin")
+    ss, pool, router, results = make_env([theirs, mine])
+    results.sync("고 1학년")
+
+    again = result_row("100001", "홍길동", 95, "admin")
+    upsert_result_rows(pool, router, results, [again])
+
+    assert sheet_rows(ss) == [theirs, again]
+    assert [r[:-1] for r in sheet_rows(ss, HISTORY_SHEET)] == [mine]
+
+
+def test_rank_excludes_only_same_admin_previous_score():
+    theirs = result_row("100001", "학생1-1", 80, "teacher2")
+    ss, pool, router, results = make_env([theirs])
+    results.sync("고 1학년")
+
+    # admin 의 100001 은 처음 제출 -> teacher2 의 점수는 그대로 응시자 수에 포함
+    assert results.rank("고 1학년", "1회", 90, include_new=True, student_id="100001", admin_id="admin")[:2] == (1, 2)
+    # teacher2 가 같은 학생을 다시 제출 -> 이전 점수 80 대신 새 점수
+    assert results.rank("고 1학년", "1회", 60, include_new=True, student_id="100001", admin_id="teacher2")[:2] == (1, 1)
+
+
+def migrated_env(rows):
+    ss, pool, router, results = make_env(rows)
+    moved, skipped = migrate_legacy(pool, router)
+    results.reset()
+    return ss, pool, router, results, moved, skipped
+
+
+def test_migrate_skips_rows_without_grade():
+    rows = [
+        result_row("1", "가", 80, "admin"),
+        result_row("2", "나", 70, "admin", grade=""),
+        result_row("3", "다", 60, "admin", grade="  "),
+    ]
+    ss, pool, router, results, moved, skipped = migrated_env(rows)
+
+    assert moved == {"결과_고 1학년_2025": 1}
+    assert skipped == [3, 4]
+    assert not any(t.startswith("결과__") for t in ss._sheets)
+    assert router.migrated_rows == 3
+
+
+def test_sharded_rank_and_lookup_merge_seasons():
+    rows = [
+        result_row("1", "가", 90, "admin", date="2025-05-01 10:00"),
+        result_row("2", "나", 70, "admin", date="2025-05-01 10:00"),
+        result_row("1", "가", 60, "admin", date="2026-02-10 10:00"),   # 3월 전 -> 2025 학년도
+        result_row("1", "가", 85, "admin", date="2026-04-01 10:00"),
+        result_row("3", "라", 95, "admin", date="2026-04-02 10:00"),
+    ]
+    ss, pool, router, results, moved, _ = migrated_env(rows)
+    assert set(moved) == {"결과_고 1학년_2025", "결과_고 1학년_2026", HISTORY_SHEET}
+
+    # 분리 뒤 Sheet1 에 들어온 행도 호환 경로로 같이 읽음
+    ss._sheets["Sheet1"].append_rows([result_row("4", "마", 50, "admin", date="2026-05-01 10:00")])
+    results.sync("고 1학년")
+
+    # 학년도 샤드 2개 + Sheet1 꼬리의 점수: 60(2025 업서트로 90 대체), 70, 85, 95, 50
+    assert results.rank("고 1학년", "1회", 80)[:2] == (3, 5)
+    assert results.rank("고 1학년", "1회", 100, include_new=True)[:2] == (1, 6)
+
+    hist = results.lookup("고 1학년", "0001")
+    assert hist["Score"].tolist() == [60, 85]
+    assert hist["Date"].tolist() == ["2026-02-10 10:00", "2026-04-01 10:00"]
+    assert results.lookup("고 1학년", "4")["Name"].tolist() == ["마"]
+
+
+def record_batch_updates(ws):
+    calls = []
+    write = ws.batch_update
+
+    def batch_update(data, **kwargs):
+        calls.append(data)
+        return write(data, **kwargs)
+
+    ws.batch_update = batch_update
+    return calls
+
+
+def test_upsert_overwrites_row_in_place():
+    r1 = result_row("1", "가", 80, "admin")
+    r2 = result_row("2", "나", 70, "admin")
+    ss, pool, router, results = make_env([r1, r2])
+    results.sync("고 1학년")
+    calls = record_batch_updates(ss._sheets["Sheet1"])
+
+    again = result_row("2", "나", 75, "admin", date="2025-05-02 10:00")
+    upsert_result_rows(pool, router, results, [again])
+
+    assert calls == [[{"range": "A3:J3", "values": [again]}]]
+    assert sheet_rows(ss) == [r1, again]
+    history = sheet_rows(ss, HISTORY_SHEET)
+    assert [r[:-1] for r in history] == [r2]
+    assert ss._sheets[HISTORY_SHEET]._rows[0] == RESULT_HEADER + ["Replaced_At"]
+
+
+def test_upsert_collapses_duplicates_in_batch():
+    r1 = result_row("1", "가", 80, "admin")
+    ss, pool, router, results = make_env([r1])
+    results.sync("고 1학년")
+    calls = record_batch_updates(ss._sheets["Sheet1"])
+
+    a1, b1 = result_row("1", "가", 81, "admin"), result_row("1", "가", 82, "admin")
+    a3, b3 = result_row("3", "다", 60, "admin"), result_row("3", "다", 65, "admin")
+    upsert_result_rows(pool, router, results, [a1, a3, b1, b3])
+
+    # 같은 학생의 마지막 제출만 시트에, 나머지(덮어쓴 행 + 앞선 제출)는 응시이력에
+    assert len(calls) == 1 and calls[0][0]["values"] == [b1]
+    assert sheet_rows(ss) == [b1, b3]
+    assert [r[:-1] for r in sheet_rows(ss, HISTORY_SHEET)] == [r1, a1, a3]
+
+
+def test_upsert_retry_is_idempotent():
+    r1 = result_row("1", "가", 80, "admin")
+    ss, pool, router, results = make_env([r1])
+    results.sync("고 1학년")
+    calls = record_batch_updates(ss._sheets["Sheet1"])
+    batch = [result_row("1", "가", 90, "admin"), result_row("2", "나", 70, "admin")]
+
+    upsert_result_rows(pool, router, results, batch)
+    # 쓰기는 됐지만 응답을 못 받아 대기열이 같은 묶음을 다시 보냄
+    upsert_result_rows(pool, router, results, batch)
+
+    assert len(calls) == 1
+    assert sheet_rows(ss) == batch
+    assert [r[:-1] for r in sheet_rows(ss, HISTORY_SHEET)] == [r1]
+
+
+def test_replace_rows_keeps_indexes_consistent():
+    rows = [result_row(str(i), f"학생{i}", 50 + i, "admin") for i in range(1, 6)]
+    rows[1][5] = "문법 | 화법"
+    ss, pool, router, results = make_env(rows)
+    results.sync("고 1학년")
+
+    again = result_row("2", "학생2", 99, "admin")
+    again[5] = "독서"
+    upsert_result_rows(pool, router, results, [again])
+
+    fresh = ShardedResults(pool, router, min_interval=0, snapshots=False)
+    fresh.sync("고 1학년")
+    for score in (50, 52, 55, 99, 100):
+        assert results.rank("고 1학년", "1회", score) == fresh.rank("고 1학년", "1회", score)
+    assert results.lookup("고 1학년", "2")["Score"].tolist() == [99]
+    assert results.weak_types("고 1학년", "2") == fresh.weak_types("고 1학년", "2") == [("독서", 1)]
+    assert results.admin_students("admin")["응시횟수"].tolist() == [1] * 5
+
+
+def test_loaded_only_after_first_sync():
+    ss, pool, router, results = make_env([result_row("1", "가", 80, "admin")])
+    assert not results.loaded("고 1학년")
+    results.sync("고 1학년")
+    assert results.loaded("고 1학년")
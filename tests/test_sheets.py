@@ -0,0 +1,103 @@
+import threading
+
+import gspread
+import pytest
+from google.auth.exceptions import RefreshError
+from oauth2client.client import AccessTokenRefreshError, HttpAccessTokenRefreshError
+
+from benchmarks.fake_gspread import FakeBackend, FakeClient, FakeSpreadsheet, auth_error, quota_error
+from gateway import SheetsGateway
+from sheets import SheetsPool, is_auth_error
+
+
+def make_pool(ss):
+    clients = []
+
+    def factory():
+        clients.append(FakeClient(ss))
+        return clients[-1]
+
+    gateway = SheetsGateway(reads_per_minute=None, writes_per_minute=None)
+    return SheetsPool(factory, gateway=gateway), clients
+
+
+def test_auth_error_reconnects_on_next_access():
+    backend = FakeBackend()
+    ss = FakeSpreadsheet(backend, {"Sheet1": [["Grade"], ["고 1학년"]]})
+    pool, clients = make_pool(ss)
+    ws = pool.sheet1()
+    target = ws._target
+    read = target.get_all_values
+
+    def fail_once(**kwargs):
+        target.get_all_values = read
+        raise auth_error()
+
+    target.get_all_values = fail_once
+
+    with pytest.raises(gspread.exceptions.APIError):
+        ws.get_all_values()
+    assert len(clients) == 1
+
+    assert pool.sheet1().get_all_values() == [["Grade"], ["고 1학년"]]
+    assert len(clients) == 2
+
+
+def test_other_errors_keep_connection():
+    backend = FakeBackend()
+    ss = FakeSpreadsheet(backend, {"Sheet1": [["Grade"]]})
+    pool, clients = make_pool(ss)
+
+    with pytest.raises(gspread.WorksheetNotFound):
+        pool.worksheet("없는 시트")
+    pool.sheet1()
+    assert len(clients) == 1
+
+
+def test_concurrent_cold_start_connects_once():
+    backend = FakeBackend(latency=0.05)
+    ss = FakeSpreadsheet(backend, {"Sheet1": [["Grade"]]})
+    pool, clients = make_pool(ss)
+
+    threads = [threading.Thread(target=pool.sheet1) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(clients) == 1
+    assert backend.calls["open"] == 1
+
+
+@pytest.mark.parametrize("error", [
+    auth_error(),
+    RefreshError("invalid_grant"),
+    AccessTokenRefreshError("invalid_grant"),
+    HttpAccessTokenRefreshError("invalid_grant", status=400),
+])
+def test_auth_errors(error):
+    assert is_auth_error(error)
+
+
+def test_other_errors_are_not_auth_errors():
+    assert not is_auth_error(quota_error())
+    assert not is_auth_error(ValueError("x"))
+
+
+def test_token_refresh_error_reconnects():
+    backend = FakeBackend()
+    ss = FakeSpreadsheet(backend, {"Sheet1": [["Grade"]]})
+    pool, clients = make_pool(ss)
+    ws = pool.sheet1()
+    target = ws._target
+    read = target.get_all_values
+
+    def fail_once(**kwargs):
+        target.get_all_values = read
+        raise HttpAccessTokenRefreshError("invalid_grant: Invalid JWT Signature.", status=400)
+
+    target.get_all_values = fail_once
+    with pytest.raises(HttpAccessTokenRefreshError):
+        ws.get_all_values()
+
+    assert pool.sheet1().get_all_values() == [["Grade"]]
+    assert len(clients) == 2
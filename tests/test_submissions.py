@@ -0,0 +1,176 @@
+import json
+import time
+
+from benchmarks.fake_gspread import FakeBackend, FakeSpreadsheet, grid_error, make_pool, quota_error
+from shards import META_SHEET, ShardRouter, write_result_rows
+from submissions import DISCARDED, FAILED, QUEUED, RESULT_HEADER, RETRYING, WRITTEN, SubmissionQueue
+
+FAST = {"flush_interval": 0.01, "base_delay": 0.001}
+
+
+def result_row(grade, sid, date="2025-05-01 10:00"):
+    return [grade, "1회", sid, f"학생{sid}", 80, "", date, "없음", "admin", ""]
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+def journal(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+class Writer:
+    """앞쪽 호출은 errors 의 예외를 차례로 던지고, 그다음부터 rows 를 기록"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+        self.written = []
+
+    def __call__(self, rows):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        self.written.append(list(rows))
+
+
+class AlwaysFails:
+    def __init__(self, make_error):
+        self.make_error = make_error
+        self.calls = 0
+
+    def __call__(self, rows):
+        self.calls += 1
+        raise self.make_error()
+
+
+def test_batches_by_shard(tmp_path):
+    backend = FakeBackend()
+    ss = FakeSpreadsheet(backend, {
+        "Sheet1": [RESULT_HEADER],
+        META_SHEET: [["key", "value"], ["migrated_rows", "0"]],
+    })
+    pool = make_pool(ss)
+    router = ShardRouter(pool)
+    queue = SubmissionQueue(
+        lambda rows: write_result_rows(pool, router, rows), journal_path=str(tmp_path / "q.jsonl"),
+        key=router.route, flush_interval=0.2,
+    )
+
+    rows = [result_row("고 1학년", "1"), result_row("고 2학년", "2"), result_row("고 1학년", "3"),
+            result_row("고 1학년", "4", date="2026-04-01 10:00")]
+    sids = queue.submit_many(rows)
+
+    assert wait_until(lambda: all(queue.status(s) == WRITTEN for s in sids))
+    assert backend.calls["append_rows"] == 3
+    shard = lambda title: [r[2] for r in ss._sheets[title]._rows[1:]]
+    assert shard("결과_고 1학년_2025") == ["1", "3"]
+    assert shard("결과_고 2학년_2025") == ["2"]
+    assert shard("결과_고 1학년_2026") == ["4"]
+
+
+def test_retryable_errors_back_off_then_write(tmp_path):
+    writer = Writer(quota_error(), quota_error())
+    queue = SubmissionQueue(writer, journal_path=str(tmp_path / "q.jsonl"), **FAST)
+
+    sid = queue.submit(result_row("고 1학년", "1"))
+
+    assert wait_until(lambda: queue.status(sid) == WRITTEN)
+    assert writer.calls == 3
+    assert writer.written == [[result_row("고 1학년", "1")]]
+
+
+def test_exhausted_retries_keep_rows_queued(tmp_path):
+    writer = AlwaysFails(quota_error)
+    queue = SubmissionQueue(writer, journal_path=str(tmp_path / "q.jsonl"), max_retries=1, max_delay=3600, **FAST)
+
+    sid = queue.submit(result_row("고 1학년", "1"))
+
+    assert wait_until(lambda: queue.status(sid) == RETRYING)
+    assert writer.calls == 2
+    assert queue.pending_count() == 1
+    assert queue.failed() == []
+    assert "Quota" in queue.error(sid)
+
+
+def test_rejected_rows_are_held_until_admin_action(tmp_path):
+    path = str(tmp_path / "q.jsonl")
+    queue = SubmissionQueue(AlwaysFails(lambda: grid_error("A2:J", 1)), journal_path=path, **FAST)
+    sid = queue.submit(result_row("고 1학년", "1"))
+    assert wait_until(lambda: queue.status(sid) == FAILED)
+    assert queue.pending_count() == 0
+    assert [(s, row) for s, row, _ in queue.failed()] == [(sid, result_row("고 1학년", "1"))]
+
+    # 재시작해도 자동으로 다시 쓰지 않고 보관
+    writer = Writer()
+    restarted = SubmissionQueue(writer, journal_path=path, **FAST)
+    assert restarted.status(sid) == FAILED
+    assert "exceeds grid limits" in restarted.error(sid)
+    time.sleep(0.05)
+    assert writer.calls == 0
+
+    assert restarted.retry_failed() == 1
+    assert wait_until(lambda: restarted.status(sid) == WRITTEN)
+    assert writer.written == [[result_row("고 1학년", "1")]]
+
+
+def test_discard_failed(tmp_path):
+    path = str(tmp_path / "q.jsonl")
+    queue = SubmissionQueue(AlwaysFails(lambda: grid_error("A2:J", 1)), journal_path=path, **FAST)
+    sid = queue.submit(result_row("고 1학년", "1"))
+    assert wait_until(lambda: queue.status(sid) == FAILED)
+
+    assert queue.discard_failed([sid]) == 1
+    assert queue.status(sid) == DISCARDED
+    assert queue.failed() == []
+
+    restarted = SubmissionQueue(Writer(), journal_path=path, **FAST)
+    assert restarted.status(sid) is None
+    assert journal(path) == []
+
+
+def test_restart_replays_unwritten_rows_and_compacts(tmp_path):
+    path = str(tmp_path / "q.jsonl")
+    done = Writer()
+    first = SubmissionQueue(done, journal_path=path, **FAST)
+    written = first.submit(result_row("고 1학년", "1"))
+    assert wait_until(lambda: first.status(written) == WRITTEN)
+
+    # 저장 전에 프로세스가 멈춘 경우 - 429 가 이어져 대기열에 남은 행
+    stuck = SubmissionQueue(AlwaysFails(quota_error), journal_path=path, max_retries=0, max_delay=3600, **FAST)
+    sid = stuck.submit(result_row("고 1학년", "2"))
+    assert wait_until(lambda: stuck.status(sid) == RETRYING)
+
+    writer = Writer()
+    restarted = SubmissionQueue(writer, journal_path=path, **FAST)
+    assert restarted.status(written) is None
+    assert wait_until(lambda: restarted.status(sid) == WRITTEN)
+    assert writer.written == [[result_row("고 1학년", "2")]]
+
+    # 저널은 재시작 때 저장 안 된 행만 남기고 압축됨 (그 뒤 WRITTEN 기록만 추가)
+    assert journal(path) == [
+        {"id": sid, "row": result_row("고 1학년", "2")},
+        {"id": sid, "status": WRITTEN},
+    ]
+
+
+def test_retried_rows_go_before_later_submissions(tmp_path):
+    path = str(tmp_path / "q.jsonl")
+    queue = SubmissionQueue(AlwaysFails(lambda: grid_error("A2:J", 1)), journal_path=path, **FAST)
+    old = queue.submit(result_row("고 1학년", "1"))
+    assert wait_until(lambda: queue.status(old) == FAILED)
+
+    writer = Writer()
+    restarted = SubmissionQueue(writer, journal_path=path, flush_interval=0.2, base_delay=0.001)
+    new = restarted.submit(result_row("고 1학년", "1b"))
+    restarted.retry_failed()
+    assert restarted.status(old) == QUEUED
+    assert wait_until(lambda: restarted.status(new) == WRITTEN and restarted.status(old) == WRITTEN)
+    assert [r[2] for rows in writer.written for r in rows] == ["1", "1b"]